@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+AI-Eng-TAM Survey -- Local Analytics Store
+==========================================
+Loads archive_{TIMESTAMP}/ directories (or the live tables) into a local
+SQLite database built from supabase-schema.sql -- same tables, same indexes
+(idx_likert_respondent, idx_likert_item_code, idx_respondents_type, ...) --
+plus precomputed per-respondent construct scores, so repeated analysis
+runs locally at index speed instead of through paginated REST calls.
+Ingest also saves the demographic cube (survey_cube.py) and the Section D
+tool bitset index (survey_tools.py) next to the database; `cube` and
+`tools` answer from them without rescanning rows.
+
+  python analytics-store.py ingest archive_20250301_120000/
+  python analytics-store.py ingest --live
+  python analytics-store.py constructs --by stakeholder_type
+  python analytics-store.py constructs --by prior_ai_experience --where stakeholder_type=student
+  python analytics-store.py items --item BI1 --by year_in_program
+  python analytics-store.py cube --by industry_sector --where stakeholder_type=practitioner
+  python analytics-store.py tools adoption --category DL
+  python analytics-store.py tools cooccurrence --category GenAI --stakeholder practitioner
+  python analytics-store.py tools combos --top 15
+  python analytics-store.py tools constructs --construct BI --category ML
+  python analytics-store.py sql "SELECT COUNT(*) FROM respondents"
+"""
+
+import argparse, csv, json, math, os, sqlite3, sys, time
+from supabase_rest import SupabaseClient, SupabaseError, enable_tracing
+from survey_schema import TABLES, parse_schema, coerce_row, fill_defaults, validate_row
+from survey_stats import CONSTRUCT_NAMES, anova_from_moments, construct_of
+from survey_cube import DIMENSIONS, Cube
+from survey_tools import ToolIndex
+
+# --Supabase credentials (service-role key -- full access) --
+SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
+SERVICE_KEY = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJpc3MiOiJzdXBhYmFzZSIsInJlZiI6InZwdnpobWJhaXJtc2xvenJuZXl1Iiwi"
+    "cm9sZSI6InNlcnZpY2Vfcm9sZSIsImlhdCI6MTc3MTIwNzUwNSwiZXhwIjoyMDg2"
+    "NzgzNTA1fQ.WMj3qqwBV1QBwPxrQFd7lHtuLopbpxvEOT8vm3GEB70"
+)
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analytics.db')
+PAGE_SIZE = 1000
+
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+SQLITE_TYPES = {'INTEGER': 'INTEGER', 'BOOLEAN': 'INTEGER'}
+
+# Derived tables, rebuilt after every ingest
+DERIVED_DDL = [
+    """CREATE TABLE IF NOT EXISTS item_constructs (
+      item_code TEXT PRIMARY KEY,
+      construct TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS construct_scores (
+      respondent_id TEXT NOT NULL REFERENCES respondents(id) ON DELETE CASCADE,
+      construct TEXT NOT NULL,
+      score REAL NOT NULL,        -- mean of the respondent's items in the construct
+      n_items INTEGER NOT NULL,
+      PRIMARY KEY (respondent_id, construct)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_construct_scores_construct ON construct_scores(construct)",
+]
+
+
+# ================================================================
+# SCHEMA
+# ================================================================
+
+def sqlite_ddl(tables, indexes):
+    """Translate the parsed Postgres schema into SQLite statements."""
+    statements = []
+    for name in TABLES:
+        table = tables[name]
+        lines = []
+        for col in table.columns.values():
+            parts = [col.name, SQLITE_TYPES.get(col.type, 'TEXT')]
+            if col.primary_key:
+                parts.append('PRIMARY KEY')
+            elif col.not_null:
+                parts.append('NOT NULL')
+            if col.choices is not None:
+                opts = ', '.join(f"'{c}'" for c in sorted(col.choices))
+                parts.append(f"CHECK ({col.name} IN ({opts}))")
+            if col.min_value is not None and col.max_value is not None:
+                parts.append(f"CHECK ({col.name} BETWEEN {col.min_value} AND {col.max_value})")
+            if col.references:
+                parts.append(f"REFERENCES {col.references[0]}({col.references[1]}) ON DELETE CASCADE")
+            lines.append('  ' + ' '.join(parts))
+        for cols in table.unique:
+            lines.append(f"  UNIQUE({', '.join(cols)})")
+        statements.append(f"CREATE TABLE IF NOT EXISTS {name} (\n" + ',\n'.join(lines) + "\n)")
+    for index_name, table_name, cols in indexes:
+        statements.append(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({', '.join(cols)})")
+    return statements
+
+
+def connect(db_path, foreign_keys=True):
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}")
+    return conn
+
+
+def init_db(conn, tables, indexes):
+    for stmt in sqlite_ddl(tables, indexes) + DERIVED_DDL:
+        conn.execute(stmt)
+
+
+# ================================================================
+# SOURCES
+# ================================================================
+
+def archive_rows(archive_dir, table):
+    """Stream raw CSV rows from {archive_dir}/{table}.csv (typed by load_table)."""
+    path = os.path.join(archive_dir, f'{table.name}.csv')
+    if not os.path.exists(path):
+        return
+    with open(path, newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+
+def live_rows(table):
+    """Stream rows of a live table, paginating past the 1000-row limit."""
+    client = SupabaseClient(SUPABASE_URL, SERVICE_KEY)
+    try:
+        for row in client.paginate(table.name, page_size=PAGE_SIZE):
+            yield {k: v for k, v in row.items() if k in table.columns}
+    except SupabaseError as e:
+        print(f"  ERROR reading {table.name}: {e.status} -- {e.body}", file=sys.stderr)
+        raise
+    finally:
+        client.close()
+
+
+# ================================================================
+# INGEST
+# ================================================================
+
+def to_sqlite(table, row):
+    """Typed row -> SQLite values (JSONB as JSON text, booleans as 0/1)."""
+    out = {}
+    for name, value in row.items():
+        col = table.columns[name]
+        if value is not None and col.type in ('JSONB', 'JSON'):
+            if isinstance(value, str):
+                # Double-encoded JSON text (simulate.py inserts selected_tools this way)
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+            value = json.dumps(value, ensure_ascii=False)
+        elif isinstance(value, bool):
+            value = int(value)
+        out[name] = value
+    return out
+
+
+def load_table(conn, table, rows, batch_size=10000, coerce=False):
+    """Bulk-insert rows with executemany; re-ingesting replaces by primary key.
+
+    With coerce=True rows are raw CSV text and are typed with coerce_row.
+    Empty cells in NOT NULL columns get the column default, as in
+    restore-archive.py; rows with unparseable values or still violating
+    NOT NULL / CHECK constraints are skipped. Returns (loaded, skipped).
+    """
+    count, skipped = 0, 0
+    sql, columns, batch = None, None, []
+
+    def flush():
+        if batch:
+            conn.executemany(sql, batch)
+            batch.clear()
+
+    for row in rows:
+        try:
+            row = fill_defaults(table, coerce_row(table, row) if coerce else row)
+        except (ValueError, SyntaxError):
+            skipped += 1
+            continue
+        if validate_row(table, row):
+            skipped += 1
+            continue
+        row = to_sqlite(table, row)
+        if sql is None:
+            columns = list(row.keys())
+            sql = (f"INSERT OR REPLACE INTO {table.name} ({', '.join(columns)}) "
+                   f"VALUES ({', '.join('?' for _ in columns)})")
+        batch.append(tuple(row.get(c) for c in columns))
+        count += 1
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return count, skipped
+
+
+def rebuild_construct_scores(conn):
+    """Recompute item -> construct mapping and per-respondent construct means."""
+    codes = [r[0] for r in conn.execute("SELECT DISTINCT item_code FROM likert_responses")]
+    conn.execute("DELETE FROM item_constructs")
+    conn.executemany("INSERT INTO item_constructs (item_code, construct) VALUES (?, ?)",
+                     [(code, construct_of(code)) for code in codes])
+    conn.execute("DELETE FROM construct_scores")
+    conn.execute("""
+        INSERT INTO construct_scores (respondent_id, construct, score, n_items)
+        SELECT l.respondent_id, ic.construct, AVG(l.value), COUNT(*)
+        FROM likert_responses l
+        JOIN item_constructs ic ON ic.item_code = l.item_code
+        GROUP BY l.respondent_id, ic.construct
+    """)
+    return conn.execute("SELECT COUNT(*) FROM construct_scores").fetchone()[0]
+
+
+def cube_path(db_path):
+    return os.path.splitext(db_path)[0] + '.cube.json'
+
+
+def build_cube(conn):
+    """Demographic cube (survey_cube.py) over the whole store."""
+    dims = ', '.join(DIMENSIONS)
+    conn.row_factory = sqlite3.Row
+    respondents = [dict(r) for r in conn.execute(f"SELECT id, {dims} FROM respondents")]
+    conn.row_factory = None
+    items = [r[0] for r in conn.execute("SELECT item_code FROM item_constructs ORDER BY construct, item_code")]
+    constructs = [c for c in CONSTRUCT_NAMES if c in {construct_of(i) for i in items}]
+    return Cube.build(
+        respondents,
+        conn.execute("SELECT respondent_id, construct, score FROM construct_scores"),
+        conn.execute("SELECT respondent_id, item_code, value FROM likert_responses"),
+        constructs, items,
+    )
+
+
+def tools_path(db_path):
+    return os.path.splitext(db_path)[0] + '.tools.json'
+
+
+def build_tools(conn):
+    """Section D tool bitset index (survey_tools.py) over the whole store."""
+    return ToolIndex.build(
+        conn.execute("SELECT id, stakeholder_type FROM respondents ORDER BY id"),
+        conn.execute("SELECT respondent_id, category, uses_category, selected_tools, other_tool "
+                     "FROM section_a_responses"),
+        conn.execute("SELECT respondent_id, construct, score FROM construct_scores"),
+    )
+
+
+def cmd_ingest(args):
+    tables, indexes = parse_schema()
+    # Foreign keys are off while loading so INSERT OR REPLACE of a respondent
+    # does not cascade-delete rows ingested from an earlier archive;
+    # orphans are removed at the end instead.
+    conn = connect(args.db, foreign_keys=False)
+    init_db(conn, tables, indexes)
+    conn.execute('PRAGMA synchronous=OFF')
+
+    sources = ['live'] if args.live else args.archives
+    if not sources:
+        raise SystemExit("  Nothing to ingest: pass archive directories or --live")
+
+    t0 = time.time()
+    with conn:
+        for source in sources:
+            print(f"\n  Ingesting {'live tables' if source == 'live' else source}...")
+            for name in TABLES:
+                table = tables[name]
+                if source == 'live':
+                    n, skipped = load_table(conn, table, live_rows(table))
+                else:
+                    n, skipped = load_table(conn, table, archive_rows(source, table), coerce=True)
+                print(f"    {name}: {n} rows" + (f" ({skipped} invalid rows skipped)" if skipped else ''))
+        for name in TABLES[1:]:
+            orphans = conn.execute(
+                f"DELETE FROM {name} WHERE respondent_id NOT IN (SELECT id FROM respondents)").rowcount
+            if orphans:
+                print(f"    {name}: removed {orphans} rows with no respondent")
+        n_scores = rebuild_construct_scores(conn)
+    conn.execute('ANALYZE')
+    print(f"\n  construct_scores: {n_scores} rows")
+    cube = build_cube(conn)
+    cube.save(cube_path(args.db))
+    print(f"  cube: {len(cube.base)} base cells, {len(cube.rollups)} rollups -> {cube_path(args.db)}")
+    tools = build_tools(conn)
+    tools.save(tools_path(args.db))
+    print(f"  tools: {len(tools.features)} tools x {tools.size} respondents -> {tools_path(args.db)}")
+    print(f"  Done in {time.time() - t0:.1f}s -> {args.db}")
+
+
+# ================================================================
+# QUERIES
+# ================================================================
+
+def respondent_columns():
+    tables, _ = parse_schema()
+    return list(tables['respondents'].columns)
+
+
+def parse_filters(where, allowed):
+    """['col=value', ...] -> (SQL fragment, params), columns checked against the schema."""
+    clauses, params = [], []
+    for cond in where or []:
+        col, _, value = cond.partition('=')
+        if col not in allowed:
+            raise SystemExit(f"  Unknown respondents column in --where: {col}")
+        clauses.append(f"r.{col} = ?")
+        params.append(value)
+    return (' AND '.join(clauses) or '1=1'), params
+
+
+def parse_dims(by, allowed):
+    dims = [d.strip() for d in (by or 'stakeholder_type').split(',') if d.strip()]
+    for d in dims:
+        if d not in allowed:
+            raise SystemExit(f"  Unknown respondents column in --by: {d}")
+    return dims
+
+
+def print_grouped(title, rows, dims, anova_by=None):
+    """rows: [(key, *dim values, n, sum, sumsq)] grouped by key."""
+    by_key = {}
+    for key, *rest in rows:
+        by_key.setdefault(key, []).append(rest)
+
+    print(f"\n{title}")
+    print("-" * 78)
+    header = ' | '.join(f"{d:>18s}" for d in dims)
+    print(f"{'':8s} {header} | {'n':>6s} {'mean':>6s} {'sd':>6s}")
+    for key in sorted(by_key):
+        moments = []
+        for group in by_key[key]:
+            *dim_vals, n, s, ss = group
+            mean = s / n
+            sd = math.sqrt(max(0.0, ss - s * s / n) / (n - 1)) if n > 1 else 0
+            labels = ' | '.join(f"{str(v if v is not None else '--')[:18]:>18s}" for v in dim_vals)
+            print(f"{key:8s} {labels} | {n:6d} {mean:6.2f} {sd:6.2f}")
+            moments.append((n, s, ss))
+        if anova_by:
+            res = anova_from_moments(moments)
+            if res['F'] is not None:
+                print(f"{'':8s} ANOVA F({res['dfBetween']},{res['dfWithin']}) = {res['F']:.3f}, "
+                      f"p = {res['p']:.4f}, eta^2 = {res['etaSquared']:.3f}")
+        print()
+
+
+def cmd_constructs(args):
+    allowed = respondent_columns()
+    dims = parse_dims(args.by, allowed)
+    where, params = parse_filters(args.where, allowed)
+    if args.construct:
+        where += " AND cs.construct = ?"
+        params.append(args.construct)
+    dim_sql = ', '.join(f"r.{d}" for d in dims)
+    conn = connect(args.db)
+    rows = conn.execute(f"""
+        SELECT cs.construct, {dim_sql}, COUNT(*), SUM(cs.score), SUM(cs.score * cs.score)
+        FROM construct_scores cs
+        JOIN respondents r ON r.id = cs.respondent_id
+        WHERE {where}
+        GROUP BY cs.construct, {dim_sql}
+        ORDER BY cs.construct, {dim_sql}
+    """, params).fetchall()
+    # Keep dashboard order of constructs
+    order = {c: i for i, c in enumerate(CONSTRUCT_NAMES)}
+    rows.sort(key=lambda r: order.get(r[0], len(order)))
+    print_grouped(f"Construct scores by {', '.join(dims)}", rows, dims, anova_by=len(dims) == 1)
+
+
+def cmd_items(args):
+    allowed = respondent_columns()
+    dims = parse_dims(args.by, allowed)
+    where, params = parse_filters(args.where, allowed)
+    if args.item:
+        where += " AND l.item_code = ?"
+        params.append(args.item)
+    dim_sql = ', '.join(f"r.{d}" for d in dims)
+    conn = connect(args.db)
+    rows = conn.execute(f"""
+        SELECT l.item_code, {dim_sql}, COUNT(*), SUM(l.value), SUM(l.value * l.value)
+        FROM likert_responses l
+        JOIN respondents r ON r.id = l.respondent_id
+        WHERE {where}
+        GROUP BY l.item_code, {dim_sql}
+        ORDER BY l.item_code, {dim_sql}
+    """, params).fetchall()
+    print_grouped(f"Item scores by {', '.join(dims)}", rows, dims, anova_by=len(dims) == 1)
+
+
+def cmd_cube(args):
+    path = cube_path(args.db)
+    if args.rebuild or not os.path.exists(path):
+        cube = build_cube(connect(args.db))
+        cube.save(path)
+    else:
+        cube = Cube.load(path)
+    dims = parse_dims(args.by, cube.dimensions)
+    where = {}
+    for cond in args.where or []:
+        col, _, value = cond.partition('=')
+        if col not in cube.dimensions:
+            raise SystemExit(f"  Not a cube dimension in --where: {col}")
+        where.setdefault(col, []).append(value)
+
+    groups = cube.query(dims, where)
+    unanswered = sum(cell.n for values, cell in groups if '' in values)
+    groups = [(values, cell) for values, cell in groups if '' not in values]
+    if args.item:
+        keys, kind = [args.item], 'item'
+    else:
+        keys, kind = ([args.construct] if args.construct else cube.constructs), 'construct'
+
+    rows = []
+    for key in keys:
+        for values, cell in groups:
+            n, s, ss = cube.moments(cell, **{kind: key})
+            if n:
+                rows.append((key, *values, n, s, ss))
+    title = f"{'Item' if args.item else 'Construct'} scores by {', '.join(dims)} (cube built {cube.built_at})"
+    print_grouped(title, rows, dims, anova_by=len(dims) == 1)
+    if unanswered:
+        print(f"  {unanswered} respondents with no answer for {', '.join(dims)} not shown")
+
+
+def cmd_tools(args):
+    path = tools_path(args.db)
+    if args.rebuild or not os.path.exists(path):
+        idx = build_tools(connect(args.db))
+        idx.save(path)
+    else:
+        idx = ToolIndex.load(path)
+    if args.category and args.category not in idx.category_use and not idx.feature_ids(args.category):
+        raise SystemExit(f"  No Section D answers for category: {args.category}")
+    if args.stakeholder and args.stakeholder not in idx.stakeholders:
+        raise SystemExit(f"  Unknown stakeholder type: {args.stakeholder}")
+    scope = ' / '.join(x for x in (args.category, args.stakeholder) if x) or 'all respondents'
+    pop = idx.population(args.stakeholder)
+    base = pop.bit_count()
+
+    if args.report == 'adoption':
+        uses = idx.category_adoption(args.category)
+        rows = idx.adoption(args.category)
+        groups = list((uses or rows)[0][-1]) if uses or rows else []
+        print(f"\n  Category use ({scope}; share of Section D respondents per group)")
+        print(f"  {'category':<12}" + ''.join(f" {g:>14}" for g in groups))
+        for category, by_group in uses:
+            print(f"  {category:<12}" + ''.join(f" {c:>6} ({r:5.1%})" for c, r in by_group.values()))
+        print(f"\n  Tool adoption ({scope}; share of Section D respondents per group)")
+        print(f"  {'category':<12} {'tool':<34}" + ''.join(f" {g:>14}" for g in groups))
+        for category, tool, by_group in rows:
+            cells = ''.join(f" {c:>6} ({r:5.1%})" for c, r in by_group.values())
+            print(f"  {category:<12} {tool[:34]:<34}{cells}")
+
+    elif args.report == 'cooccurrence':
+        # Rank by users within the scope; tools nobody in it chose are left out
+        users = {f: (idx.bitmaps[f] & pop).bit_count() for f in idx.feature_ids(args.category)}
+        features = sorted((f for f in users if users[f]), key=lambda f: -users[f])[:args.top]
+        matrix = idx.cooccurrence(features, args.stakeholder)
+        print(f"\n  Tool co-occurrence ({scope}; {base} respondents; diagonal = users of the tool)")
+        for k, f in enumerate(features):
+            print(f"  [{k:>2}] {'/'.join(idx.features[f])}")
+        print('       ' + ''.join(f" {k:>5}" for k in range(len(features))))
+        for k, row in enumerate(matrix):
+            print(f"  [{k:>2}] " + ''.join(f" {v:>5}" for v in row))
+
+    elif args.report == 'combos':
+        print(f"\n  Top tool combinations ({scope}; {base} respondents)")
+        for tools, count in idx.combinations(args.category, args.stakeholder, args.top):
+            print(f"  {count:>6}  {' + '.join(tools)}")
+
+    else:
+        constructs = [args.construct] if args.construct else [c for c in CONSTRUCT_NAMES if c in idx.score_levels]
+        print(f"\n  Construct scores of tool users vs. non-users ({scope})")
+        print(f"  {'construct':<10} {'tool':<40} {'users':>6} {'mean':>6} {'others':>7} {'mean':>6} {'F':>8} {'p':>8}")
+        for construct in constructs:
+            for category, tool, (nu, mu), (no, mo), a in idx.construct_link(construct, args.category, args.stakeholder):
+                F = f"{a['F']:.2f}" if a['F'] is not None else '-'
+                pv = f"{a['p']:.4f}" if a['p'] is not None else '-'
+                print(f"  {construct:<10} {(category + '/' + tool)[:40]:<40} {nu:>6} {mu:>6.2f} {no:>7} {mo:>6.2f} {F:>8} {pv:>8}")
+
+
+def cmd_sql(args):
+    conn = connect(args.db)
+    cur = conn.execute(args.query)
+    if cur.description:
+        writer = csv.writer(sys.stdout)
+        writer.writerow([d[0] for d in cur.description])
+        writer.writerows(cur)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SQLite analytics store for survey archives.")
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite database file')
+    parser.add_argument('--trace', metavar='PATH', help='append a JSONL span per REST call (see trace-report.py)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('ingest', help='load archive directories or the live tables')
+    p.add_argument('archives', nargs='*', help='archive_{TIMESTAMP}/ directories')
+    p.add_argument('--live', action='store_true', help='read the live Supabase tables instead')
+    p.set_defaults(func=cmd_ingest)
+
+    for name, func, helptext in [('constructs', cmd_constructs, 'construct scores by demographic'),
+                                 ('items', cmd_items, 'item scores by demographic')]:
+        p = sub.add_parser(name, help=helptext)
+        p.add_argument('--by', help='comma-separated respondents columns (default: stakeholder_type)')
+        p.add_argument('--where', action='append', help='respondents column filter, e.g. stakeholder_type=student')
+        if name == 'constructs':
+            p.add_argument('--construct', help='only this construct id (e.g. BI)')
+        else:
+            p.add_argument('--item', help='only this item code (e.g. BI1)')
+        p.set_defaults(func=func)
+
+    p = sub.add_parser('cube', help='construct/item scores by demographic from the precomputed cube')
+    p.add_argument('--by', help='comma-separated cube dimensions (default: stakeholder_type)')
+    p.add_argument('--where', action='append', help='dimension filter, e.g. stakeholder_type=student (repeatable)')
+    g = p.add_mutually_exclusive_group()
+    g.add_argument('--construct', help='only this construct id (e.g. BI)')
+    g.add_argument('--item', help='an item code (e.g. BI1) instead of constructs')
+    p.add_argument('--rebuild', action='store_true', help='rebuild the cube from the store first')
+    p.set_defaults(func=cmd_cube)
+
+    p = sub.add_parser('tools', help='Section D tool adoption, co-occurrence and combinations from the bitset index')
+    p.add_argument('report', choices=['adoption', 'cooccurrence', 'combos', 'constructs'])
+    p.add_argument('--category', help='one Section D category (e.g. DL, GenAI)')
+    p.add_argument('--stakeholder', help='only this stakeholder type')
+    p.add_argument('--construct', help='only this construct id for the constructs report (e.g. BI)')
+    p.add_argument('--top', type=int, default=12, help='tools in the matrix / combinations listed (default 12)')
+    p.add_argument('--rebuild', action='store_true', help='rebuild the index from the store first')
+    p.set_defaults(func=cmd_tools)
+
+    p = sub.add_parser('sql', help='run an ad-hoc SQL query; prints CSV')
+    p.add_argument('query')
+    p.set_defaults(func=cmd_sql)
+
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -42,17 +42,32 @@ export default async function handler(req, res) {
     keyEnd: '...' + serviceKey.substring(serviceKey.length - 10),
   };
 
+  // Timing: ADMIN_TRACE=1 logs one JSON span per Supabase request (same
+  // shape as supabase_rest.py, so trace-report.py can summarize the logs);
+  // ?timing=1 or ADMIN_SERVER_TIMING=1 adds a Server-Timing header.
+  // fetch() hands back the body already inflated, so sizes here are decoded
+  // bytes (bytes_decoded), not the wire bytes supabase_rest.py records.
+  const envFlag = (value) => ['1', 'true'].includes(String(value || '').toLowerCase());
+  const traceSpans = envFlag(process.env.ADMIN_TRACE);
+  const serverTiming = envFlag(process.env.ADMIN_SERVER_TIMING) || req.query?.timing === '1';
+  const tableTimings = {};
+  const startedAt = performance.now();
+
   try {
     // Fetch all rows from a table, paginating in batches to avoid the
     // PostgREST default 1000-row limit.
     const fetchTable = async (table) => {
       const PAGE_SIZE = 1000;
+      const tableStart = performance.now();
       let allRows = [];
       let offset = 0;
       let done = false;
+      let bytesIn = 0;
 
       while (!done) {
         const url = `${supabaseUrl}/rest/v1/${table}?select=*&order=id&limit=${PAGE_SIZE}&offset=${offset}`;
+        const ts = Date.now() / 1000;
+        const pageStart = performance.now();
         const response = await fetch(url, {
           headers: {
             apikey: serviceKey,
@@ -65,7 +80,18 @@ export default async function handler(req, res) {
           const body = await response.json().catch(() => ({}));
           throw new Error(body.message || `HTTP ${response.status} fetching ${table}`);
         }
-        const rows = await response.json();
+        const text = await response.text();
+        const rows = JSON.parse(text);
+        const pageBytes = Buffer.byteLength(text);
+        bytesIn += pageBytes;
+        if (traceSpans) {
+          console.log(JSON.stringify({
+            method: 'GET', resource: table, status: response.status,
+            bytes_out: 0, bytes_decoded: pageBytes, rows: rows.length, retries: 0,
+            ts, ms: Math.round((performance.now() - pageStart) * 1000) / 1000,
+            script: 'api/admin-data',
+          }));
+        }
         allRows = allRows.concat(rows);
         if (rows.length < PAGE_SIZE) {
           done = true;
@@ -74,6 +100,12 @@ export default async function handler(req, res) {
         }
       }
 
+      tableTimings[table] = {
+        ms: performance.now() - tableStart,
+        pages: offset / PAGE_SIZE + 1,
+        rows: allRows.length,
+        bytes: bytesIn,
+      };
       return allRows;
     };
 
@@ -83,6 +115,13 @@ export default async function handler(req, res) {
       fetchTable('likert_responses'),
     ]);
 
+    if (serverTiming) {
+      const metrics = Object.entries(tableTimings).map(([table, t]) =>
+        `${table};dur=${t.ms.toFixed(1)};desc="${t.rows} rows, ${t.pages} pages, ${t.bytes} decoded bytes"`);
+      metrics.push(`total;dur=${(performance.now() - startedAt).toFixed(1)}`);
+      res.setHeader('Server-Timing', metrics.join(', '));
+    }
+
     return res.status(200).json({ respondents, sectionA, likert });
   } catch (err) {
     return res.status(500).json({ error: err.message, diagnostics: diag });
@@ -0,0 +1,116 @@
+// Vercel Serverless Function — single-round-trip survey submission
+// Writes the respondent, Section D and Likert rows in one transaction
+// via the submit_survey() Postgres function (see supabase-schema.sql).
+//
+// Body is either one submission { respondent, sectionA, likert } or, when the
+// browser drains its offline queue, a batch { submissions: [...] }.
+
+const UUID_RE = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+const STAKEHOLDER_TYPES = ['faculty', 'student', 'practitioner'];
+const MAX_BATCH = 50;
+
+// SQLSTATE classes 22 (data exception) and 23 (integrity constraint
+// violation) mean the payload itself is bad; resending it cannot succeed.
+// Everything else -- bad key, RLS, function not deployed, 5xx -- is a
+// server-side problem and the client keeps the submission for a retry.
+const isPayloadError = (code) => /^2[23]/.test(code || '');
+
+// Basic shape checks — the table constraints enforce the rest
+function validateSubmission(payload) {
+  const respondent = payload?.respondent;
+  if (!respondent || !UUID_RE.test(respondent.id || '')) {
+    return 'respondent.id must be a client-generated UUID';
+  }
+  if (!STAKEHOLDER_TYPES.includes(respondent.stakeholder_type)) {
+    return 'Invalid stakeholder_type';
+  }
+  return null;
+}
+
+function normalizeSubmission(payload) {
+  return {
+    respondent: payload.respondent,
+    sectionA: Array.isArray(payload.sectionA) ? payload.sectionA : [],
+    likert: Array.isArray(payload.likert) ? payload.likert : [],
+  };
+}
+
+export default async function handler(req, res) {
+  // Only allow POST
+  if (req.method !== 'POST') {
+    return res.status(405).json({ error: 'Method not allowed' });
+  }
+
+  // Server-side env vars (NOT prefixed with VITE_)
+  const supabaseUrl = process.env.SUPABASE_URL || process.env.VITE_SUPABASE_URL;
+  const serviceKey = process.env.SUPABASE_SERVICE_KEY || process.env.VITE_SUPABASE_SERVICE_KEY;
+
+  if (!supabaseUrl || !serviceKey) {
+    return res.status(500).json({
+      error: 'Server misconfigured: missing environment variables. Please add SUPABASE_URL and SUPABASE_SERVICE_KEY in Vercel Settings > Environment Variables.',
+    });
+  }
+
+  let payload = req.body;
+  if (typeof payload === 'string') {
+    try {
+      payload = JSON.parse(payload || '{}');
+    } catch {
+      return res.status(400).json({ error: 'Invalid JSON body' });
+    }
+  }
+
+  const callRpc = async (fn, args) => {
+    const response = await fetch(`${supabaseUrl}/rest/v1/rpc/${fn}`, {
+      method: 'POST',
+      headers: {
+        apikey: serviceKey,
+        Authorization: `Bearer ${serviceKey}`,
+        'Content-Type': 'application/json',
+        Accept: 'application/json',
+      },
+      body: JSON.stringify(args),
+    });
+    if (!response.ok) {
+      const body = await response.json().catch(() => ({}));
+      const err = new Error(body.message || `HTTP ${response.status} from ${fn}`);
+      err.status = isPayloadError(body.code) ? 400 : 502;
+      throw err;
+    }
+    return response.json();
+  };
+
+  try {
+    // Batch submission (offline queue drain)
+    if (Array.isArray(payload?.submissions)) {
+      if (payload.submissions.length > MAX_BATCH) {
+        return res.status(400).json({ error: `At most ${MAX_BATCH} submissions per batch` });
+      }
+      const results = [];
+      const valid = [];
+      for (const submission of payload.submissions) {
+        const problem = validateSubmission(submission);
+        if (problem) {
+          results.push({ id: submission?.respondent?.id ?? null, ok: false, retryable: false, error: problem });
+        } else {
+          valid.push(normalizeSubmission(submission));
+        }
+      }
+      if (valid.length > 0) {
+        const settled = await callRpc('submit_surveys', { payloads: valid });
+        results.push(...settled.map((r) => (r.ok ? r : { ...r, retryable: !isPayloadError(r.code) })));
+      }
+      return res.status(200).json({ results });
+    }
+
+    // Single submission
+    const problem = validateSubmission(payload);
+    if (problem) {
+      return res.status(400).json({ error: problem });
+    }
+    const id = await callRpc('submit_survey', { payload: normalizeSubmission(payload) });
+    return res.status(200).json({ id });
+  } catch (err) {
+    return res.status(err.status || 502).json({ error: err.message });
+  }
+}
@@ -2,7 +2,9 @@
 """
 AI-Eng-TAM Survey -- Archive & Clear Database
 =============================================
-1. Downloads all data from the three survey tables as CSV files.
+1. Downloads all data from the three survey tables as CSV files, and
+   writes data_quality.csv (survey_quality.py: straight-lining, patterns,
+   duplicate submissions) next to them.
 2. Creates archive copies of the tables inside Supabase (via SQL).
 3. Clears the live tables (respecting foreign-key order).
 
@@ -11,8 +13,9 @@ Uses the service-role key so it can SELECT and DELETE.
 
 import json, csv, os, sys, time
 from datetime import datetime
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+
+from supabase_rest import SupabaseClient, SupabaseError
+import survey_quality
 
 # --Supabase credentials (service-role key -- full access) --
 SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
@@ -28,58 +31,35 @@ TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), f'archive_{TIMESTAMP}')
 
 
-def supabase_get(table, select='*', limit=10000):
-    """Fetch all rows from a Supabase table via REST API."""
-    url = f"{SUPABASE_URL}/rest/v1/{table}?select={select}&limit={limit}"
-    req = Request(url, method='GET')
-    req.add_header('apikey', SERVICE_KEY)
-    req.add_header('Authorization', f'Bearer {SERVICE_KEY}')
-    req.add_header('Content-Type', 'application/json')
+client = SupabaseClient(SUPABASE_URL, SERVICE_KEY)
+
 
+def supabase_get(table, select='*'):
+    """Fetch all rows from a Supabase table via REST API (paginated)."""
     try:
-        resp = urlopen(req)
-        return json.loads(resp.read().decode('utf-8'))
-    except HTTPError as e:
-        body = e.read().decode('utf-8')
-        print(f"  ERROR reading {table}: {e.code} -- {body}", file=sys.stderr)
+        return list(client.paginate(table, select=select))
+    except SupabaseError as e:
+        print(f"  ERROR reading {table}: {e.status} -- {e.body}", file=sys.stderr)
         raise
 
 
 def supabase_rpc(sql):
     """Execute raw SQL via Supabase's rpc endpoint (pg function)."""
-    # We use the SQL editor REST endpoint
-    url = f"{SUPABASE_URL}/rest/v1/rpc/exec_sql"
-    data = json.dumps({'query': sql}).encode('utf-8')
-    req = Request(url, data=data, method='POST')
-    req.add_header('apikey', SERVICE_KEY)
-    req.add_header('Authorization', f'Bearer {SERVICE_KEY}')
-    req.add_header('Content-Type', 'application/json')
-
     try:
-        resp = urlopen(req)
-        return resp.status
-    except HTTPError as e:
+        client.rpc('exec_sql', {'query': sql})
+        return 200
+    except SupabaseError:
         # rpc function may not exist; we'll handle this gracefully
-        body = e.read().decode('utf-8')
         return None
 
 
 def supabase_delete(table):
     """Delete all rows from a Supabase table via REST API."""
     # Supabase REST requires a filter; use a tautology to match all rows
-    url = f"{SUPABASE_URL}/rest/v1/{table}?id=not.is.null"
-    req = Request(url, method='DELETE')
-    req.add_header('apikey', SERVICE_KEY)
-    req.add_header('Authorization', f'Bearer {SERVICE_KEY}')
-    req.add_header('Content-Type', 'application/json')
-    req.add_header('Prefer', 'return=minimal')
-
     try:
-        resp = urlopen(req)
-        return resp.status
-    except HTTPError as e:
-        body = e.read().decode('utf-8')
-        print(f"  ERROR deleting from {table}: {e.code} -- {body}", file=sys.stderr)
+        return client.delete(table, {'id': 'not.is.null'})
+    except SupabaseError as e:
+        print(f"  ERROR deleting from {table}: {e.status} -- {e.body}", file=sys.stderr)
         raise
 
 
@@ -125,6 +105,18 @@ def main():
         print("\n  WARNING: No data found in any table. Nothing to archive or clear.")
         return
 
+    # Data-quality flags for the archived responses
+    quality = survey_quality.assess(
+        all_data['respondents'],
+        ((r['respondent_id'], r['item_code'], r['value']) for r in all_data['likert_responses']),
+    )
+    quality_path = os.path.join(OUTPUT_DIR, 'data_quality.csv')
+    survey_quality.write_csv(quality, quality_path)
+    counts = survey_quality.summarize(quality)
+    print(f"\n  Data quality ({counts['screened']} respondents screened -> {quality_path}):")
+    for flag in ['zero_variance', 'long_string', 'pattern', 'exact_duplicate', 'near_duplicate', 'repeat_flag']:
+        print(f"    {flag}: {counts.get(flag, 0)}")
+
     # --Step 2: Create archive tables via SQL --
     print(f"\n[Step 2] Creating archive tables in Supabase...\n")
     print("  NOTE: Archive tables must be created via the Supabase SQL Editor.")
@@ -172,6 +164,7 @@ def main():
     print(f"\n{'=' * 70}")
     print("COMPLETE!")
     print(f"  - CSV backups saved to: {OUTPUT_DIR}/")
+    print(f"  - Data-quality flags saved to: {quality_path}")
     print(f"  - Archive SQL saved to: {sql_path}")
     print(f"  - All live tables have been cleared.")
     print(f"{'=' * 70}")
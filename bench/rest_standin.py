@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Local PostgREST stand-in for offline benchmarks
+===============================================
+An in-memory server speaking the subset of the Supabase REST API the
+Python tooling uses: paginated GET (order, <order>=gt.<key>, limit/offset,
+Content-Range), POST
+inserts, DELETE and rpc/<fn>. Responses are gzipped when the client asks,
+like the hosted API. HTTP/1.1 keep-alive.
+
+    python bench/rest_standin.py --port 54321      # standalone
+
+or from Python:
+
+    with StandIn() as server:
+        client = SupabaseClient(server.url, 'bench')
+"""
+
+import argparse, bisect, gzip, json, os, sys, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from survey_schema import parse_schema, default_value
+
+SCHEMA, _ = parse_schema()
+
+
+def normalize(table, rows):
+    """Give rows every column of the table, with DEFAULTs filled, as the
+    database does -- archive-and-clear.py relies on uniform keys."""
+    spec = SCHEMA.get(table)
+    if spec is None:
+        return list(rows)
+    cols = list(spec.columns.values())
+    return [{c.name: row[c.name] if c.name in row else default_value(c) for c in cols} for row in rows]
+
+
+def _ordered(rows, column):
+    rows = sorted(rows, key=lambda r: str(r.get(column)))
+    return rows, [str(r.get(column)) for r in rows]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # response stalls ~40ms on Nagle + delayed ACK and the timings measure that.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def _route(self):
+        parts = urlsplit(self.path)
+        name = parts.path[len('/rest/v1/'):] if parts.path.startswith('/rest/v1/') else None
+        return name, {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+    def _body(self):
+        data = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        return json.loads(data) if data else None
+
+    def _send(self, status, payload=None, headers=None):
+        body = b'' if payload is None else json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        if body and 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        table, params = self._route()
+        if table is None:
+            return self._send(404, {'message': 'not found'})
+        with self.server.lock:
+            rows = self.store.get(table, [])
+            order = params.get('order')
+            offset = int(params.get('offset', 0))
+            limit = int(params.get('limit', 1000))
+            start = offset
+            if order:
+                rows, keys = self._sorted(table, order)
+                after = params.get(order, '')
+                if after.startswith('gt.'):
+                    start += bisect.bisect_right(keys, after[3:])
+            page = rows[start:start + limit]
+        select = params.get('select', '*')
+        if select != '*':
+            cols = select.split(',')
+            page = [{c: r.get(c) for c in cols} for r in page]
+        end = offset + len(page) - 1
+        self._send(200, page, {'Content-Range': f"{offset}-{end}/*" if page else '*/*'})
+
+    def _sorted(self, table, column):
+        """(rows, keys) of a table ordered by column, cached until it changes."""
+        cache = self.server.sorted
+        if (table, column) not in cache:
+            cache[(table, column)] = _ordered(self.store.get(table, []), column)
+        return cache[(table, column)]
+
+    def do_POST(self):
+        name, _ = self._route()
+        body = self._body()
+        if name is None:
+            return self._send(404, {'message': 'not found'})
+        if name.startswith('rpc/'):
+            return self._send(200, 0)
+        rows = normalize(name, body if isinstance(body, list) else [body])
+        with self.server.lock:
+            self.store.setdefault(name, []).extend(rows)
+            self.server.sorted.clear()
+        self._send(201)
+
+    def do_DELETE(self):
+        table, _ = self._route()
+        with self.server.lock:
+            self.store[table] = []
+            self.server.sorted.clear()
+        self._send(204)
+
+
+class StandIn:
+    """Runs the stand-in on a background thread; `store` maps table -> rows."""
+
+    def __init__(self, port=0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self.server.daemon_threads = True
+        self.server.store = {}
+        self.server.sorted = {}
+        self.server.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def load(self, tables):
+        """Replace the contents with {table: rows} (rows as from normalize())."""
+        with self.server.lock:
+            self.server.store.clear()
+            self.server.store.update({t: list(rows) for t, rows in tables.items()})
+            # Like the primary key index: built before any timed request
+            self.server.sorted = {(t, 'id'): _ordered(rows, 'id') for t, rows in tables.items()}
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory Supabase REST stand-in.")
+    parser.add_argument('--port', type=int, default=54321)
+    args = parser.parse_args()
+    server = StandIn(args.port)
+    print(f"Listening on {server.url} (Ctrl-C to stop)")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+AI-Eng-TAM Survey -- Benchmarks
+===============================
+Offline, reproducible timings for the hot paths, at 10^2 .. 10^6
+respondents. REST benchmarks run against bench/rest_standin.py, so no
+network or database is needed.
+
+  simulate.generate   persona generation + row building (simulate.py)
+  simulate.submit     per-persona submission over REST (3 inserts each)
+  archive.export      archive-and-clear.py download + CSV write, all tables
+  archive.delete      archive-and-clear.py table clears
+  js.*                statistics.js and the dashboard CSV exports
+                      (bench/stats-bench.js; needs node and `npm install`)
+
+Each benchmark has a default size cap so a full run finishes in minutes;
+--max-n raises (or lowers) every cap. Timings are best-of --repeat.
+
+Results are compared with a stored baseline (bench/baseline.json by
+default); slowdowns beyond --threshold are reported and make the run exit 1.
+Timings depend on the machine, so no baseline is committed: create one
+with --save-baseline on the machine that will run the comparison. Without
+one the comparison is skipped with a notice, or the run exits 2 when
+--require-baseline is given (for CI).
+
+  python bench/run.py                          # run, compare with baseline
+  python bench/run.py --save-baseline          # run, store as the new baseline
+  python bench/run.py --require-baseline       # fail if there is nothing to compare with
+  python bench/run.py --only simulate.generate --sizes 1000,10000
+  python bench/run.py --max-n 1000000          # every benchmark up to 10^6
+"""
+
+import argparse, contextlib, importlib.util, io, json, os, platform, shutil, subprocess, sys, tempfile, time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [ROOT, BENCH_DIR]
+
+import simulate
+from rest_standin import StandIn, normalize
+from supabase_rest import SupabaseClient
+
+SIZES = [10 ** k for k in range(2, 7)]
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+SEED = 42
+
+
+def load_script(filename):
+    """Import a hyphenated top-level script (e.g. archive-and-clear.py) as a module."""
+    name = filename[:-3].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def split_counts(n):
+    """Respondents -> (students, faculty, practitioners) in simulate.py's 40/30/30 mix."""
+    ns, nf = n * 4 // 10, n * 3 // 10
+    return ns, nf, n - ns - nf
+
+
+def best_of(repeat, fn, setup=None):
+    """Best wall time of fn() over `repeat` runs; setup() runs untimed before each."""
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+_datasets = {}
+
+
+def dataset(n):
+    """(personas, {table: rows}) for n respondents, built once per size."""
+    if n not in _datasets:
+        personas = simulate.build_all(split_counts(n), SEED)
+        tables = {'respondents': [], 'section_a_responses': [], 'likert_responses': []}
+        for persona in personas:
+            respondent, sa_rows, lr_rows = simulate.persona_rows(persona)
+            tables['respondents'].append(respondent)
+            tables['section_a_responses'].extend(sa_rows)
+            tables['likert_responses'].extend(lr_rows)
+        tables = {t: normalize(t, rows) for t, rows in tables.items()}
+        _datasets.clear()  # one size in memory at a time
+        _datasets[n] = (personas, tables)
+    return _datasets[n]
+
+
+# ================================================================
+# BENCHMARKS -- each returns seconds for n respondents
+# ================================================================
+
+def bench_generate(n, repeat, server):
+    def run():
+        for persona in simulate.build_all(split_counts(n), SEED):
+            simulate.persona_rows(persona)
+    return best_of(repeat, run)
+
+
+def bench_submit(n, repeat, server):
+    personas, _ = dataset(n)
+    simulate._client = SupabaseClient(server.url, 'bench')
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i, persona in enumerate(personas):
+                simulate.submit_persona(persona, i)
+    return best_of(repeat, run, setup=server.store.clear)
+
+
+def bench_export(n, repeat, server):
+    _, tables = dataset(n)
+    archive = load_script('archive-and-clear.py')
+    archive.client = SupabaseClient(server.url, 'bench')
+    out_dir = tempfile.mkdtemp(prefix='bench_archive_')
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for table in archive.TABLES:
+                rows = archive.supabase_get(table)
+                archive.save_csv(rows, os.path.join(out_dir, f'{table}.csv'))
+    try:
+        return best_of(repeat, run, setup=lambda: server.load(tables))
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def bench_delete(n, repeat, server):
+    _, tables = dataset(n)
+    archive = load_script('archive-and-clear.py')
+    archive.client = SupabaseClient(server.url, 'bench')
+
+    def run():
+        for table in ['likert_responses', 'section_a_responses', 'respondents']:
+            archive.supabase_delete(table)
+    return best_of(repeat, run, setup=lambda: server.load(tables))
+
+
+# name -> (function, default size cap)
+BENCHMARKS = {
+    'simulate.generate': (bench_generate, 10 ** 5),
+    'simulate.submit': (bench_submit, 10 ** 3),
+    'archive.export': (bench_export, 10 ** 4),
+    'archive.delete': (bench_delete, 10 ** 4),
+}
+
+
+def run_js(sizes, repeat, max_n, only):
+    """Run bench/stats-bench.js; returns (results, error message or None)."""
+    node = shutil.which('node')
+    if node is None:
+        return {}, 'node not found'
+    cmd = [node, os.path.join(BENCH_DIR, 'stats-bench.js'),
+           '--sizes', ','.join(map(str, sizes)), '--repeat', str(repeat)]
+    if max_n:
+        cmd += ['--max-n', str(max_n)]
+    if only:
+        cmd += ['--only', ','.join(o[len('js.'):] for o in only if o.startswith('js.'))]
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        errors = [l for l in proc.stderr.splitlines() if 'Error' in l]
+        return {}, (errors or proc.stderr.strip().splitlines() or ['failed'])[0]
+    return {f'js.{k}': v for k, v in json.loads(proc.stdout).items()}, None
+
+
+# ================================================================
+# BASELINE
+# ================================================================
+
+def compare(results, baseline):
+    """-> [(bench, n, old_s, new_s, ratio)] for entries in both runs."""
+    rows = []
+    for name, by_size in results.items():
+        for n, r in by_size.items():
+            old = baseline.get('results', {}).get(name, {}).get(n)
+            if old and old['seconds'] > 0:
+                rows.append((name, n, old['seconds'], r['seconds'], r['seconds'] / old['seconds']))
+    return rows
+
+
+def print_results(results, comparison, threshold):
+    cmp = {(name, n): ratio for name, n, _, _, ratio in comparison}
+    print(f"\n{'benchmark':20s} {'n':>9s} {'seconds':>10s} {'resp/s':>12s} {'vs baseline':>12s}")
+    print('-' * 67)
+    regressions = 0
+    for name in results:
+        for n, r in sorted(results[name].items(), key=lambda kv: int(kv[0])):
+            ratio = cmp.get((name, n))
+            flag = ''
+            if ratio is not None:
+                flag = f"{(ratio - 1) * 100:+.1f}%"
+                if ratio > 1 + threshold:
+                    flag += ' SLOWER'
+                    regressions += 1
+                elif ratio < 1 - threshold:
+                    flag += ' faster'
+            print(f"{name:20s} {int(n):>9,d} {r['seconds']:>10.4f} {r['per_sec']:>12,.0f} {flag:>12s}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the survey tooling.")
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help='respondent counts')
+    parser.add_argument('--max-n', type=int, help='size cap for every benchmark (default: per benchmark)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per size; best is kept')
+    parser.add_argument('--only', help='comma-separated benchmark names (js.* for the node ones)')
+    parser.add_argument('--no-js', action='store_true', help='skip the node benchmarks')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the baseline')
+    parser.add_argument('--require-baseline', action='store_true', help='exit 2 if no baseline exists')
+    parser.add_argument('--threshold', type=float, default=0.20, help='relative slowdown reported as a regression')
+    parser.add_argument('--out', help='also write this run to a JSON file')
+    args = parser.parse_args()
+
+    if args.require_baseline and not args.save_baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; create one with --save-baseline", file=sys.stderr)
+        sys.exit(2)
+    sizes = sorted(int(s) for s in args.sizes.split(','))
+    only = set(args.only.split(',')) if args.only else None
+    results = {}
+
+    print("=" * 67)
+    print("AI-Eng-TAM Survey -- Benchmarks")
+    print("=" * 67)
+
+    with StandIn() as server:
+        # Sizes outer, so each size's dataset is built once and shared
+        for n in sizes:
+            for name, (fn, cap) in BENCHMARKS.items():
+                if only and name not in only:
+                    continue
+                limit = args.max_n or cap
+                if n > limit:
+                    print(f"  {name}: n={n:,} skipped (cap {limit:,}; use --max-n)")
+                    continue
+                seconds = fn(n, args.repeat if n <= 10 ** 4 else 1, server)
+                results.setdefault(name, {})[str(n)] = {'seconds': seconds, 'per_sec': n / seconds}
+                print(f"  {name}: n={n:,} {seconds:.4f}s")
+
+    if not args.no_js and (not only or any(o.startswith('js.') for o in only)):
+        js_results, err = run_js(sizes, args.repeat, args.max_n, only)
+        if err:
+            print(f"  js benchmarks skipped: {err}")
+        results.update(js_results)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    comparison = compare(results, baseline) if baseline else []
+    regressions = print_results(results, comparison, args.threshold)
+
+    run = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(run, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif baseline:
+        print(f"\nCompared with baseline from {baseline['meta']['date']} "
+              f"({len(comparison)} entries, threshold {args.threshold:.0%})")
+        if regressions:
+            print(f"{regressions} regression(s)")
+            sys.exit(1)
+    else:
+        print(f"\nNo baseline at {args.baseline}: comparison skipped. "
+              "Run with --save-baseline on this machine to create one.")
+
+
+if __name__ == '__main__':
+    main()
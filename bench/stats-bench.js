@@ -0,0 +1,109 @@
+// Benchmarks for the dashboard's statistics and CSV exports.
+// Run with `npm run bench` or through bench/run.py, which stores and compares
+// the results. Prints JSON: { name: { n: { seconds, per_sec } } }.
+//
+//   node bench/stats-bench.js --sizes 100,1000,10000 --repeat 3
+//   node bench/stats-bench.js --only oneWayAnova --max-n 1000000
+
+import { getLikertSections } from '../src/data/surveyData.js';
+import { descriptiveStats, oneWayAnova, aggregateByConstruct } from '../src/lib/statistics.js';
+import { buildLongCsv, buildWideCsv } from '../src/lib/exportCsv.js';
+
+const STAKEHOLDERS = ['student', 'faculty', 'practitioner'];
+
+function parseArgs(argv) {
+  const args = { sizes: [100, 1000, 10000, 100000, 1000000], repeat: 3, maxN: null, only: null };
+  for (let i = 0; i < argv.length; i += 2) {
+    const [flag, value] = [argv[i], argv[i + 1]];
+    if (flag === '--sizes') args.sizes = value.split(',').map(Number);
+    else if (flag === '--repeat') args.repeat = Number(value);
+    else if (flag === '--max-n') args.maxN = Number(value);
+    else if (flag === '--only') args.only = value ? new Set(value.split(',')) : null;
+  }
+  return args;
+}
+
+// Deterministic PRNG (mulberry32) so every run sees the same data
+function rng(seed) {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+// n respondents in simulate.py's 40/30/30 mix, with every Likert item answered
+function syntheticData(n) {
+  const rand = rng(42);
+  const itemsByType = {};
+  for (const type of STAKEHOLDERS) {
+    const sections = getLikertSections(type);
+    itemsByType[type] = [];
+    for (const section of ['A', 'B', 'C']) {
+      for (const construct of sections[section].constructs) {
+        for (const item of construct.items) itemsByType[type].push([section, item.code]);
+      }
+    }
+  }
+
+  const respondents = [];
+  const likert = [];
+  for (let i = 0; i < n; i++) {
+    const type = i < n * 0.4 ? 'student' : i < n * 0.7 ? 'faculty' : 'practitioner';
+    const id = `00000000-0000-4000-8000-${String(i).padStart(12, '0')}`;
+    respondents.push({ id, stakeholder_type: type, created_at: '2026-01-01T00:00:00Z' });
+    const anchor = 3 + rand() * 3;
+    for (const [section, code] of itemsByType[type]) {
+      const value = Math.min(7, Math.max(1, Math.round(anchor + (rand() - 0.5) * 3)));
+      likert.push({ respondent_id: id, section, item_code: code, value });
+    }
+  }
+  return { respondents, sectionA: [], likert };
+}
+
+// name -> [default size cap, setup(data) -> () => work]
+const BENCHMARKS = {
+  aggregateByConstruct: [1e5, (data) => () =>
+    aggregateByConstruct(data.likert, data.respondents, getLikertSections)],
+  oneWayAnova: [1e6, (data) => {
+    const agg = aggregateByConstruct(data.likert, data.respondents, getLikertSections);
+    return () => {
+      for (const groups of Object.values(agg)) oneWayAnova(groups);
+    };
+  }],
+  descriptiveStats: [1e6, (data) => {
+    const values = data.likert.map((l) => l.value);
+    return () => descriptiveStats(values);
+  }],
+  longCsv: [1e5, (data) => () => buildLongCsv(data)],
+  wideCsv: [1e5, (data) => () => buildWideCsv(data)],
+};
+
+function bestOf(repeat, fn) {
+  let best = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    const t0 = performance.now();
+    fn();
+    best = Math.min(best, performance.now() - t0);
+  }
+  return best / 1000;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const results = {};
+for (const n of args.sizes) {
+  const active = Object.entries(BENCHMARKS).filter(([name, [cap]]) =>
+    (!args.only || args.only.has(name)) && n <= (args.maxN ?? cap));
+  if (active.length === 0) continue;
+  const data = syntheticData(n);
+  for (const [name, [, setup]] of active) {
+    const seconds = bestOf(n <= 1e4 ? args.repeat : 1, setup(data));
+    results[name] = results[name] || {};
+    results[name][String(n)] = { seconds, per_sec: n / seconds };
+    console.error(`  js.${name}: n=${n.toLocaleString()} ${seconds.toFixed(4)}s`);
+  }
+}
+console.log(JSON.stringify(results, null, 2));
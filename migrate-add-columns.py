@@ -2,11 +2,14 @@
 """
 Migration: Add institution_or_company and repeat_flag columns to respondents table.
 Run this once against the live Supabase database.
+
+Superseded by run-migrations.py, which applies these columns as
+migrations/0001 and 0002 and records them in schema_migrations.
 """
 
 import json, sys
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+
+from supabase_rest import SupabaseClient, SupabaseError
 
 SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
 SERVICE_KEY = (
@@ -16,6 +19,8 @@ SERVICE_KEY = (
     "NzgzNTA1fQ.WMj3qqwBV1QBwPxrQFd7lHtuLopbpxvEOT8vm3GEB70"
 )
 
+client = SupabaseClient(SUPABASE_URL, SERVICE_KEY)
+
 # SQL statements to add the new columns
 MIGRATIONS = [
     "ALTER TABLE respondents ADD COLUMN IF NOT EXISTS institution_or_company TEXT;",
@@ -34,17 +39,11 @@ def run_sql(sql):
 
 def test_column_exists(column_name):
     """Test if a column exists by selecting it."""
-    url = f"{SUPABASE_URL}/rest/v1/respondents?select={column_name}&limit=1"
-    req = Request(url, method='GET')
-    req.add_header('apikey', SERVICE_KEY)
-    req.add_header('Authorization', f'Bearer {SERVICE_KEY}')
-    req.add_header('Content-Type', 'application/json')
-
     try:
-        resp = urlopen(req)
+        client.get('respondents', {'select': column_name, 'limit': 1})
         return True
-    except HTTPError as e:
-        if e.code == 400:
+    except SupabaseError as e:
+        if e.status == 400:
             return False
         raise
 
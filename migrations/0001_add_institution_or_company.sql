@@ -0,0 +1,3 @@
+-- Shared demographics column (institution for faculty/students, company
+-- for practitioners).
+ALTER TABLE respondents ADD COLUMN IF NOT EXISTS institution_or_company TEXT;
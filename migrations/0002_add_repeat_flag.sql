@@ -0,0 +1,7 @@
+-- Browser-detected repeat submissions. The column is added without a
+-- value so the ALTER is instant, then existing rows are backfilled in
+-- bounded primary-key ranges ({keys} is filled in by run-migrations.py).
+ALTER TABLE respondents ADD COLUMN IF NOT EXISTS repeat_flag BOOLEAN;
+ALTER TABLE respondents ALTER COLUMN repeat_flag SET DEFAULT false;
+
+-- backfill: UPDATE respondents SET repeat_flag = false WHERE repeat_flag IS NULL AND {keys}
@@ -0,0 +1,70 @@
+-- Atomic, idempotent submission functions called by /api/submit
+-- (single submissions and offline-queue batches).
+CREATE OR REPLACE FUNCTION submit_survey(payload JSONB)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  resp_id UUID := (payload->'respondent'->>'id')::UUID;
+BEGIN
+  IF resp_id IS NULL THEN
+    RAISE EXCEPTION 'respondent.id is required';
+  END IF;
+
+  -- Column defaults do not apply to jsonb_populate_record, so supply them
+  INSERT INTO respondents
+  SELECT * FROM jsonb_populate_record(
+    NULL::respondents,
+    jsonb_build_object('repeat_flag', false, 'created_at', now()) || (payload->'respondent')
+  )
+  ON CONFLICT (id) DO NOTHING;
+
+  IF NOT FOUND THEN
+    RETURN resp_id;  -- already submitted; retry is a no-op
+  END IF;
+
+  INSERT INTO section_a_responses (respondent_id, category, uses_category, selected_tools, other_tool)
+  SELECT resp_id, r.category, COALESCE(r.uses_category, false), COALESCE(r.selected_tools, '[]'), r.other_tool
+  FROM jsonb_to_recordset(COALESCE(payload->'sectionA', '[]')) AS r(
+    category TEXT, uses_category BOOLEAN, selected_tools JSONB, other_tool TEXT
+  );
+
+  INSERT INTO likert_responses (respondent_id, section, item_code, value)
+  SELECT resp_id, r.section, r.item_code, r.value
+  FROM jsonb_to_recordset(COALESCE(payload->'likert', '[]')) AS r(
+    section TEXT, item_code TEXT, value INTEGER
+  );
+
+  RETURN resp_id;
+END;
+$$;
+
+-- Only the server-side endpoint (service role) may call it
+REVOKE ALL ON FUNCTION submit_survey(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_survey(JSONB) TO service_role;
+
+-- Batch variant used when the browser drains its offline queue. Each
+-- submission runs in its own subtransaction, so one bad payload does not
+-- roll back the rest of the batch. Returns [{ id, ok, error }].
+CREATE OR REPLACE FUNCTION submit_surveys(payloads JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  item JSONB;
+  results JSONB := '[]';
+BEGIN
+  FOR item IN SELECT * FROM jsonb_array_elements(payloads) LOOP
+    BEGIN
+      PERFORM submit_survey(item);
+      results := results || jsonb_build_object('id', item->'respondent'->>'id', 'ok', true);
+    EXCEPTION WHEN OTHERS THEN
+      results := results || jsonb_build_object('id', item->'respondent'->>'id', 'ok', false, 'error', SQLERRM);
+    END;
+  END LOOP;
+  RETURN results;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION submit_surveys(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_surveys(JSONB) TO service_role;
@@ -0,0 +1,26 @@
+-- Report the SQLSTATE of each failed batch entry so /api/submit can tell
+-- bad payloads (classes 22/23, never retried) from transient failures.
+-- Returns [{ id, ok, error, code }].
+CREATE OR REPLACE FUNCTION submit_surveys(payloads JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  item JSONB;
+  results JSONB := '[]';
+BEGIN
+  FOR item IN SELECT * FROM jsonb_array_elements(payloads) LOOP
+    BEGIN
+      PERFORM submit_survey(item);
+      results := results || jsonb_build_object('id', item->'respondent'->>'id', 'ok', true);
+    EXCEPTION WHEN OTHERS THEN
+      results := results || jsonb_build_object(
+        'id', item->'respondent'->>'id', 'ok', false, 'error', SQLERRM, 'code', SQLSTATE);
+    END;
+  END LOOP;
+  RETURN results;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION submit_surveys(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_surveys(JSONB) TO service_role;
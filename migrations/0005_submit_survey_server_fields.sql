@@ -0,0 +1,46 @@
+-- The respondent's created_at and repeat_flag are set by the server; values
+-- for them in the public submission payload are ignored.
+CREATE OR REPLACE FUNCTION submit_survey(payload JSONB)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  resp_id UUID := (payload->'respondent'->>'id')::UUID;
+BEGIN
+  IF resp_id IS NULL THEN
+    RAISE EXCEPTION 'respondent.id is required';
+  END IF;
+
+  -- Column defaults do not apply to jsonb_populate_record, so supply them.
+  -- created_at and repeat_flag are always set here; the payload comes
+  -- from the public survey form and cannot choose them.
+  INSERT INTO respondents
+  SELECT * FROM jsonb_populate_record(
+    NULL::respondents,
+    ((payload->'respondent') - 'created_at' - 'repeat_flag')
+      || jsonb_build_object('repeat_flag', false, 'created_at', now())
+  )
+  ON CONFLICT (id) DO NOTHING;
+
+  IF NOT FOUND THEN
+    RETURN resp_id;  -- already submitted; retry is a no-op
+  END IF;
+
+  INSERT INTO section_a_responses (respondent_id, category, uses_category, selected_tools, other_tool)
+  SELECT resp_id, r.category, COALESCE(r.uses_category, false), COALESCE(r.selected_tools, '[]'), r.other_tool
+  FROM jsonb_to_recordset(COALESCE(payload->'sectionA', '[]')) AS r(
+    category TEXT, uses_category BOOLEAN, selected_tools JSONB, other_tool TEXT
+  );
+
+  INSERT INTO likert_responses (respondent_id, section, item_code, value)
+  SELECT resp_id, r.section, r.item_code, r.value
+  FROM jsonb_to_recordset(COALESCE(payload->'likert', '[]')) AS r(
+    section TEXT, item_code TEXT, value INTEGER
+  );
+
+  RETURN resp_id;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION submit_survey(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_survey(JSONB) TO service_role;
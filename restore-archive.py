@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+AI-Eng-TAM Survey -- Restore an Archive
+=======================================
+Bulk-loads an archive_{TIMESTAMP}/ directory written by archive-and-clear.py
+back into a database, parents first (respondents -> section_a_responses ->
+likert_responses).
+
+1. Streams each CSV, converts JSONB / boolean / integer cells and validates
+   every row against the constraints in supabase-schema.sql. Rejected rows
+   go to restore_rejects_{table}.csv in the archive directory.
+2. Inserts batches concurrently over the REST API as idempotent upserts
+   (on_conflict=id, duplicates ignored), or with --dsn through PostgreSQL
+   COPY when psycopg is installed.
+3. Checkpoints finished batches in restore_state.json, so re-running after a
+   partial failure resumes where it stopped.
+
+Uses the service-role key so it can write to every table.
+"""
+
+import argparse, csv, json, os, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from supabase_rest import SupabaseClient, SupabaseError, enable_tracing
+from survey_schema import TABLES, parse_schema, coerce_row, fill_defaults, validate_row
+
+try:
+    import psycopg  # optional: enables the COPY fast path (--dsn)
+except ImportError:
+    psycopg = None
+
+# --Supabase credentials (service-role key -- full access) --
+SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
+SERVICE_KEY = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJpc3MiOiJzdXBhYmFzZSIsInJlZiI6InZwdnpobWJhaXJtc2xvenJuZXl1Iiwi"
+    "cm9sZSI6InNlcnZpY2Vfcm9sZSIsImlhdCI6MTc3MTIwNzUwNSwiZXhwIjoyMDg2"
+    "NzgzNTA1fQ.WMj3qqwBV1QBwPxrQFd7lHtuLopbpxvEOT8vm3GEB70"
+)
+
+STATE_FILE = 'restore_state.json'
+
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+
+# ================================================================
+# LOADERS
+# ================================================================
+
+class RestLoader:
+    """Batched upserts through PostgREST, on_conflict=id with duplicates
+    ignored -- idempotent, so the client retries failed batches itself."""
+    name = 'REST upsert'
+
+    def __init__(self, workers):
+        self.client = SupabaseClient(SUPABASE_URL, SERVICE_KEY, timeout=120, pool_size=workers)
+
+    def load(self, table, columns, rows):
+        try:
+            return self.client.insert(table.name, rows, upsert=True, on_conflict='id')
+        except SupabaseError as e:
+            print(f"  ERROR inserting into {table.name}: {e.status} -- {e.body}", file=sys.stderr)
+            raise
+
+    def close(self):
+        self.client.close()
+
+
+class CopyLoader:
+    """COPY into a temp table, then INSERT ... ON CONFLICT DO NOTHING.
+    One connection per worker thread."""
+    name = 'PostgreSQL COPY'
+
+    def __init__(self, dsn):
+        self.dsn = dsn
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def _conn(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = psycopg.connect(self.dsn)
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def load(self, table, columns, rows):
+        conn = self._conn()
+        cols = ', '.join(columns)
+        staging = f'restore_{table.name}'
+        json_cols = {c for c in columns if table.columns[c].type in ('JSONB', 'JSON')}
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                            f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS")
+                with cur.copy(f"COPY {staging} ({cols}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row([
+                            json.dumps(row[c]) if c in json_cols and row[c] is not None else row[c]
+                            for c in columns
+                        ])
+                cur.execute(f"INSERT INTO {table.name} ({cols}) SELECT {cols} FROM {staging} "
+                            f"ON CONFLICT DO NOTHING")
+
+    def close(self):
+        for conn in self.connections:
+            conn.close()
+
+
+# ================================================================
+# CHECKPOINT STATE
+# ================================================================
+
+class RestoreState:
+    """Which batches of which tables are already in the target database."""
+
+    def __init__(self, path, batch_size, fresh=False):
+        self.path = path
+        self.lock = threading.Lock()
+        data = {}
+        if not fresh and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('batch_size') != batch_size:
+                raise SystemExit(f"  {path} was written with --batch-size {data.get('batch_size')}; "
+                                 f"use the same size to resume, or pass --fresh.")
+        self.data = {'batch_size': batch_size, 'done': data.get('done', {})}
+
+    def is_done(self, table, batch_no):
+        return batch_no in self.data['done'].get(table, ())
+
+    def mark_done(self, table, batch_no):
+        with self.lock:
+            self.data['done'].setdefault(table, []).append(batch_no)
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(self.data, f)
+            os.replace(tmp, self.path)
+
+
+# ================================================================
+# RESTORE
+# ================================================================
+
+def read_batches(table, csv_path, known_ids, rejects_path, batch_size, stats):
+    """Yield (batch_no, columns, rows) of valid, typed rows.
+
+    Rows failing NOT NULL / CHECK / foreign-key / UNIQUE checks are written to
+    rejects_path; counts are accumulated in `stats`. Batch numbering depends
+    only on the file contents, so it is stable across runs (which is what
+    makes resuming possible).
+    """
+    fk_cols = [c.name for c in table.columns.values() if c.references]
+    unique_keys = [(table.primary_key,)] + table.unique
+    seen = {key: set() for key in unique_keys}
+
+    rejects_file, rejects = None, None
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        unknown = [c for c in reader.fieldnames or [] if c not in table.columns]
+        if unknown:
+            print(f"    (ignoring columns not in schema: {', '.join(unknown)})")
+        columns = [c for c in table.columns if c in (reader.fieldnames or [])]
+        for c in table.columns.values():
+            if c.not_null and c.name not in columns and c.default is not None:
+                columns.append(c.name)
+
+        batch, batch_no = [], 0
+        for raw in reader:
+            stats['read'] += 1
+            try:
+                row = fill_defaults(table, coerce_row(table, raw))
+                problems = validate_row(table, row)
+            except (ValueError, SyntaxError) as e:
+                row, problems = raw, [f"unparseable value: {e}"]
+
+            if not problems:
+                for col in fk_cols:
+                    if row.get(col) is not None and row[col] not in known_ids:
+                        problems.append(f"{col}={row[col]} has no parent row")
+                for key in unique_keys:
+                    value = tuple(row.get(c) for c in key)
+                    if value in seen[key]:
+                        problems.append(f"duplicate {', '.join(key)}")
+                    else:
+                        seen[key].add(value)
+
+            if problems:
+                stats['rejected'] += 1
+                if rejects is None:
+                    rejects_file = open(rejects_path, 'w', newline='', encoding='utf-8')
+                    rejects = csv.DictWriter(rejects_file, fieldnames=list(raw.keys()) + ['errors'])
+                    rejects.writeheader()
+                rejects.writerow({**raw, 'errors': '; '.join(problems)})
+                continue
+
+            if table.name == 'respondents':
+                known_ids.add(row['id'])
+            batch.append({c: row.get(c) for c in columns})
+            if len(batch) >= batch_size:
+                yield batch_no, columns, batch
+                batch, batch_no = [], batch_no + 1
+        if batch:
+            yield batch_no, columns, batch
+
+    if rejects_file:
+        rejects_file.close()
+
+
+def restore_table(table, archive_dir, loader, state, known_ids, args):
+    csv_path = os.path.join(archive_dir, f'{table.name}.csv')
+    if not os.path.exists(csv_path):
+        print(f"  {table.name}: no CSV in archive, skipping")
+        return
+    rejects_path = os.path.join(archive_dir, f'restore_rejects_{table.name}.csv')
+
+    print(f"  Restoring {table.name}...")
+    t0 = time.time()
+    loaded, skipped = 0, 0
+    stats = {'read': 0, 'rejected': 0}
+    pending = {}
+
+    def settle(futures):
+        nonlocal loaded
+        for fut in futures:
+            batch_no, n = pending.pop(fut)
+            fut.result()  # re-raises the batch's error
+            state.mark_done(table.name, batch_no)
+            loaded += n
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for batch_no, columns, rows in read_batches(table, csv_path, known_ids, rejects_path, args.batch_size, stats):
+            if state.is_done(table.name, batch_no):
+                skipped += len(rows)
+                continue
+            if args.dry_run:
+                loaded += len(rows)
+                continue
+            # Bound the number of in-flight batches to keep memory flat
+            if len(pending) >= args.workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                settle(done)
+            pending[pool.submit(loader.load, table, columns, rows)] = (batch_no, len(rows))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            settle(done)
+
+    elapsed = time.time() - t0
+    rate = loaded / elapsed if elapsed > 0 else 0
+    print(f"    {stats['read']} read, {loaded} loaded, {skipped} already restored, "
+          f"{stats['rejected']} rejected ({elapsed:.1f}s, {rate:,.0f} rows/s)")
+    if stats['rejected']:
+        print(f"    Rejected rows -> {rejects_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Restore an archive_{TIMESTAMP}/ directory into a database.")
+    parser.add_argument('archive_dir')
+    parser.add_argument('--dsn', help='PostgreSQL connection string; uses COPY (requires psycopg)')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=8, help='concurrent batches in flight')
+    parser.add_argument('--fresh', action='store_true', help='ignore an existing checkpoint')
+    parser.add_argument('--dry-run', action='store_true', help='validate only; write nothing')
+    parser.add_argument('--trace', metavar='PATH', help='append a JSONL span per REST call (see trace-report.py)')
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+
+    print("=" * 70)
+    print("AI-Eng-TAM Survey -- Restore Archive")
+    print(f"Archive: {args.archive_dir}")
+    print("=" * 70)
+
+    if args.dsn:
+        if psycopg is None:
+            raise SystemExit("  --dsn needs psycopg: pip install 'psycopg[binary]'")
+        loader = CopyLoader(args.dsn)
+    else:
+        loader = RestLoader(args.workers)
+    print(f"\n  Loader: {'validation only (dry run)' if args.dry_run else loader.name}, "
+          f"batch size {args.batch_size}, {args.workers} workers\n")
+
+    tables, _ = parse_schema()
+    state = RestoreState(os.path.join(args.archive_dir, STATE_FILE), args.batch_size,
+                         fresh=args.fresh or args.dry_run)
+    known_ids = set()
+    t0 = time.time()
+    try:
+        for name in TABLES:
+            restore_table(tables[name], args.archive_dir, loader, state, known_ids, args)
+    except Exception as e:
+        print(f"\n  FAILED: {e}", file=sys.stderr)
+        print("  Progress is checkpointed; re-run the same command to resume.", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        loader.close()
+
+    print(f"\n{'=' * 70}")
+    print(f"COMPLETE in {time.time() - t0:.1f}s")
+    print(f"{'=' * 70}")
+
+
+if __name__ == '__main__':
+    main()
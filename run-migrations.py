@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+AI-Eng-TAM Survey -- Versioned Migration Runner
+===============================================
+1. Fetches the live schema and the applied migration versions in ONE call
+   (the migration_status() function from supabase-schema.sql).
+2. Diffs the live columns against supabase-schema.sql and reports drift.
+3. Applies pending migrations/NNNN_name.sql files in version order via the
+   exec_sql() function, one statement per call (each commits on its own,
+   so a lock taken by an ALTER is released straight away), runs their
+   backfills in bounded chunks (one short transaction per chunk, so big
+   tables are never locked for long), then records the version in
+   schema_migrations.
+
+When everything is already applied the run costs a single round trip.
+Migration files must be safe to re-run (IF NOT EXISTS / OR REPLACE), since
+a run interrupted mid-backfill re-applies the file before resuming.
+
+Backfills are declared in the migration file as comment lines:
+    -- backfill: UPDATE t SET c = ... WHERE c IS NULL AND {keys}
+The runner walks t's primary key (id) with keyset lookups and runs the
+statement once per range of --chunk-size ids, {keys} becoming
+`id > 'a' AND id <= 'b'`. Every chunk is a primary-key range scan, so no
+helper index is needed and no chunk rereads rows an earlier one covered.
+"""
+
+import argparse, hashlib, os, re, sys, time
+from supabase_rest import SupabaseClient, SupabaseError, enable_tracing
+from survey_schema import SCHEMA_PATH, parse_schema
+
+# --Supabase credentials (service-role key -- full access) --
+SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
+SERVICE_KEY = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJpc3MiOiJzdXBhYmFzZSIsInJlZiI6InZwdnpobWJhaXJtc2xvenJuZXl1Iiwi"
+    "cm9sZSI6InNlcnZpY2Vfcm9sZSIsImlhdCI6MTc3MTIwNzUwNSwiZXhwIjoyMDg2"
+    "NzgzNTA1fQ.WMj3qqwBV1QBwPxrQFd7lHtuLopbpxvEOT8vm3GEB70"
+)
+
+client = SupabaseClient(SUPABASE_URL, SERVICE_KEY, timeout=300)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+
+class MissingFunction(Exception):
+    """The bootstrap functions from supabase-schema.sql are not installed."""
+
+
+def supabase_rpc(fn, args=None):
+    """Call a Postgres function through PostgREST and return its JSON result."""
+    try:
+        return client.rpc(fn, args)
+    except SupabaseError as e:
+        if e.status == 404 or e.code == 'PGRST202':
+            raise MissingFunction(fn)
+        print(f"  ERROR calling {fn}: {e.status} -- {e.body}", file=sys.stderr)
+        raise
+
+
+# ================================================================
+# MIGRATION FILES
+# ================================================================
+
+class Migration:
+    def __init__(self, path):
+        self.path = path
+        filename = os.path.basename(path)
+        self.version, _, rest = filename.partition('_')
+        self.name = rest[:-len('.sql')]
+        with open(path, encoding='utf-8') as f:
+            self.sql = f.read()
+        self.checksum = hashlib.sha256(self.sql.encode('utf-8')).hexdigest()
+        self.backfills = re.findall(r'^--\s*backfill:\s*(.+)$', self.sql, re.M)
+        self.statements = split_statements(self.sql)
+
+    def __repr__(self):
+        return f"{self.version}_{self.name}"
+
+
+# Line comments, quoted strings and dollar-quoted bodies, then statement ends
+_SQL_TOKEN = re.compile(r"--[^\n]*|'(?:[^']|'')*'|(\$\w*\$)|;")
+
+
+def split_statements(sql):
+    """Split a migration file into its top-level statements, keeping
+    function bodies ($$ ... $$) and string literals intact."""
+    statements, start, pos = [], 0, 0
+    while True:
+        m = _SQL_TOKEN.search(sql, pos)
+        if not m:
+            break
+        if m.group(1):
+            end = sql.find(m.group(1), m.end())
+            pos = len(sql) if end < 0 else end + len(m.group(1))
+        elif m.group() == ';':
+            statements.append(sql[start:m.start()])
+            start = pos = m.end()
+        else:
+            pos = m.end()
+    statements.append(sql[start:])
+    code = lambda s: re.sub(r'^\s*--.*$', '', s, flags=re.M).strip()
+    return [s.strip() for s in statements if code(s)]
+
+
+def load_migrations():
+    paths = sorted(
+        os.path.join(MIGRATIONS_DIR, f) for f in os.listdir(MIGRATIONS_DIR)
+        if re.match(r'^\d+_.+\.sql$', f)
+    )
+    return [Migration(p) for p in paths]
+
+
+def sql_literal(text):
+    return "'" + text.replace("'", "''") + "'"
+
+
+# ================================================================
+# SCHEMA DIFF
+# ================================================================
+
+def diff_schema(live_columns):
+    """Compare live columns with supabase-schema.sql -> [message]."""
+    tables, _ = parse_schema()
+    drift = []
+    for name, table in tables.items():
+        live = live_columns.get(name)
+        if live is None:
+            drift.append(f"table {name} is missing")
+            continue
+        missing = [c for c in table.columns if c not in live]
+        extra = [c for c in live if c not in table.columns]
+        if missing:
+            drift.append(f"{name}: missing columns {', '.join(missing)}")
+        if extra:
+            drift.append(f"{name}: columns not in schema file {', '.join(extra)}")
+    return drift
+
+
+# ================================================================
+# APPLY
+# ================================================================
+
+def key_ranges(table, chunk_size):
+    """Yield `id > a AND id <= b` predicates covering the table in chunks
+    of chunk_size rows. Each boundary is found from the previous one through
+    the primary key index, so finding it costs one chunk, not a rescan."""
+    after = None
+    while True:
+        params = {'select': 'id', 'order': 'id', 'limit': 1, 'offset': chunk_size - 1}
+        if after is not None:
+            params['id'] = f'gt.{after}'
+        rows = client.get(table, params)
+        bounds = [] if after is None else [f"id > {sql_literal(after)}"]
+        if rows:
+            after = rows[0]['id']
+            bounds.append(f"id <= {sql_literal(after)}")
+        yield ' AND '.join(bounds) or 'TRUE'
+        if not rows:
+            return
+
+
+def apply_migration(m, chunk_size):
+    print(f"  Applying {m}...")
+    for statement in m.statements:
+        supabase_rpc('exec_sql', {'query': statement})
+
+    for backfill in m.backfills:
+        table = re.match(r'\s*UPDATE\s+(\w+)', backfill, re.I).group(1)
+        total, t0 = 0, time.time()
+        for keys in key_ranges(table, chunk_size):
+            total += supabase_rpc('exec_sql', {'query': backfill.replace('{keys}', keys)}) or 0
+            print(f"    backfilled {total} rows...", end='\r')
+        print(f"    backfill: {total} rows in {time.time() - t0:.1f}s")
+
+    supabase_rpc('exec_sql', {'query': (
+        "INSERT INTO schema_migrations (version, name, checksum) VALUES "
+        f"({sql_literal(m.version)}, {sql_literal(m.name)}, {sql_literal(m.checksum)}) "
+        "ON CONFLICT (version) DO UPDATE SET checksum = EXCLUDED.checksum, applied_at = now()"
+    )})
+    print(f"    recorded version {m.version}")
+
+
+def print_bootstrap():
+    """Print the SQL that installs the bookkeeping table and functions."""
+    with open(SCHEMA_PATH, encoding='utf-8') as f:
+        schema = f.read()
+    start = schema.index('-- Migration bookkeeping')
+    end = schema.index('-- Row-Level Security')
+    block = schema[start:end].rsplit('-- =====', 1)[0]
+    print("\n" + "-" * 60)
+    print("MANUAL STEP REQUIRED (one time):")
+    print("Please run the following SQL in the Supabase SQL Editor:")
+    print("(Dashboard -> SQL Editor -> New Query)\n")
+    print(block.strip())
+    print("\n" + "-" * 60)
+    print("\nAfter running the SQL, re-run this script.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending migrations/ to the live database.")
+    parser.add_argument('--dry-run', action='store_true', help='show the plan without applying')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='rows per backfill transaction')
+    parser.add_argument('--trace', metavar='PATH', help='append a JSONL span per REST call (see trace-report.py)')
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+
+    print("=" * 60)
+    print("AI-Eng-TAM Survey -- Migrations")
+    print("=" * 60)
+
+    try:
+        status = supabase_rpc('migration_status')
+    except MissingFunction:
+        print("\n  migration_status() is not installed in the database.")
+        print_bootstrap()
+        return
+
+    applied = status.get('applied') or {}
+    drift = diff_schema(status.get('columns') or {})
+
+    migrations = load_migrations()
+    pending = [m for m in migrations if m.version not in applied]
+    for m in migrations:
+        if m.version in applied and applied[m.version] != m.checksum:
+            print(f"  WARNING: {m} was edited after it was applied (checksum differs)")
+
+    print(f"\n  {len(migrations) - len(pending)} applied, {len(pending)} pending")
+    if drift:
+        print("  Schema drift vs supabase-schema.sql:")
+        for line in drift:
+            print(f"    - {line}")
+
+    if not pending:
+        print("\nUp to date. No migration needed.")
+        return
+
+    for m in pending:
+        print(f"    pending: {m}" + (f" ({len(m.backfills)} backfill)" if m.backfills else ''))
+    if args.dry_run:
+        print("\nDry run: nothing applied.")
+        return
+
+    print()
+    for m in pending:
+        try:
+            apply_migration(m, args.chunk_size)
+        except Exception as e:
+            print(f"    FAILED: {e}")
+            print("    Stopping; later migrations were not applied. Re-run to resume.")
+            sys.exit(1)
+
+    print("\nAll migrations applied.")
+
+
+if __name__ == '__main__':
+    main()
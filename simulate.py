@@ -6,12 +6,21 @@ Generates realistic survey responses from 40 students, 30 faculty,
 and 30 practitioners, each with a detailed persona that drives
 internally-consistent Likert ratings and tool selections.
 
-Submits directly to the live Supabase database via REST API.
+Submits directly to the live Supabase database via REST API, or with
+--out writes JSONL files instead. Every persona has its own random
+stream derived from (seed, persona index), so --shard K/N runs on
+different processes or hosts concatenate to exactly the single-run
+dataset.
+
+With --power, instead runs thousands of replicate surveys in memory at
+several per-group sample sizes and reports construct-level ANOVA power
+and effect-size (eta^2) distributions. No network access is needed.
 """
 
-import json, random, uuid, time, sys
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+import argparse, json, os, random, uuid, time, sys
+from concurrent.futures import ProcessPoolExecutor
+from supabase_rest import SupabaseClient, SupabaseError, enable_tracing
+from survey_stats import CONSTRUCT_NAMES, STAKEHOLDER_TYPES, anova_from_moments, construct_of
 
 # ── Supabase credentials (anon key — same as the real survey app) ──
 SUPABASE_URL = "https://vpvzhmbairmslozrneyu.supabase.co"
@@ -118,22 +127,49 @@ EXP_LEVELS = {'None': 0, 'Limited': 1, 'Moderate': 2, 'Extensive': 3}
 # ================================================================
 # HELPER: generate a Likert value with construct-level anchoring
 # ================================================================
-def likert(anchor, sd=1.0):
+def likert(anchor, sd=1.0, rng=random):
     """Sample a 1-7 integer centered on anchor with given sd."""
-    v = random.gauss(anchor, sd)
+    v = rng.gauss(anchor, sd)
     return max(1, min(7, round(v)))
 
-def likert_set(codes, anchor, sd=1.0):
+def likert_set(codes, anchor, sd=1.0, rng=random):
     """Generate {code: value} for a list of codes, with per-item jitter."""
-    return {c: likert(anchor, sd) for c in codes}
+    return {c: likert(anchor, sd, rng) for c in codes}
+
+def scale_pool(pool, n):
+    """Resize a calibrated pool to n entries, keeping its proportions."""
+    if n == len(pool):
+        return pool
+    return [pool[i * len(pool) // n] for i in range(n)]
+
+# ================================================================
+# RANDOM STREAMS
+# Every persona draws from its own stream derived from (seed, persona
+# index), and group-level pool shuffles from (seed, group). Any subset
+# of personas can therefore be generated on any process or host and
+# still match a single-process run exactly.
+# ================================================================
+
+def stream(seed, *key):
+    """Independent, platform-stable RNG for (seed, *key)."""
+    return random.Random(':'.join(str(k) for k in (seed,) + key))
+
+def persona_rng(seed, index):
+    """Random stream for the persona at global index `index`."""
+    return stream(seed, 'persona', index)
 
 # ================================================================
 # PERSONA DEFINITIONS
 # ================================================================
 
-def build_students():
-    """40 student personas grounded in Purdue/MSU enrollment data."""
+def build_students(n=40, seed=42, offset=0, only=None):
+    """n student personas (default 40) grounded in Purdue/MSU enrollment data.
+
+    Personas get global indices offset..offset+n-1; if `only` is given, just
+    the personas whose index is in it are built.
+    """
     personas = []
+    pools_rng = stream(seed, 'pools', 'student')
 
     # Major distribution (Purdue-calibrated): ME 30%, CompE/EE 20%, Aero 10%,
     # Civil 8%, Industrial 8%, Chemical 5%, BME 7%, Materials 5%, Other 7%
@@ -149,13 +185,15 @@ def build_students():
         ['Environmental Engineering']*1 +
         ['Computer Science (Engineering track)']*2
     )
-    random.shuffle(majors_pool)
+    majors_pool = scale_pool(majors_pool, n)
+    pools_rng.shuffle(majors_pool)
 
     years_pool = (
         ['Freshman']*4 + ['Sophomore']*8 + ['Junior']*12 +
         ['Senior']*12 + ['Graduate']*4
     )
-    random.shuffle(years_pool)
+    years_pool = scale_pool(years_pool, n)
+    pools_rng.shuffle(years_pool)
 
     schools = [
         'Purdue University','Purdue University','Purdue University','Purdue University','Purdue University',
@@ -173,39 +211,44 @@ def build_students():
         'University of Cincinnati','University of Cincinnati',
         'University of Iowa','Michigan State University','Michigan State University',
     ]
-    random.shuffle(schools)
+    schools = scale_pool(schools, n)
+    pools_rng.shuffle(schools)
 
     exp_pool = (
         ['None']*6 + ['Limited']*14 + ['Moderate']*14 + ['Extensive']*6
     )
-    random.shuffle(exp_pool)
+    exp_pool = scale_pool(exp_pool, n)
+    pools_rng.shuffle(exp_pool)
 
     context_options = ['Coursework','Labs','Projects','Internships','Personal learning']
 
-    for i in range(40):
+    for i in range(n):
+        if only is not None and offset + i not in only:
+            continue
+        rng = persona_rng(seed, offset + i)
         year = years_pool[i]
         exp = exp_pool[i]
         major = majors_pool[i]
 
         # AI context depends on year
         if year in ('Freshman','Sophomore'):
-            ctx = random.choice(['Coursework','Labs','Personal learning'])
+            ctx = rng.choice(['Coursework','Labs','Personal learning'])
         elif year == 'Graduate':
-            ctx = random.choice(['Projects','Internships','Personal learning'])
+            ctx = rng.choice(['Projects','Internships','Personal learning'])
         else:
-            ctx = random.choice(context_options)
+            ctx = rng.choice(context_options)
 
         # Anchor scores based on experience and year
         exp_val = EXP_LEVELS[exp]
         year_val = {'Freshman':0,'Sophomore':1,'Junior':2,'Senior':3,'Graduate':4}[year]
 
         # Section A (Perceived Value): higher for experienced students
-        anchor_A = 4.2 + 0.4 * exp_val + 0.15 * year_val + random.gauss(0, 0.3)
+        anchor_A = 4.2 + 0.4 * exp_val + 0.15 * year_val + rng.gauss(0, 0.3)
         # Section B (Practices/Guardrails): moderate, slightly lower
-        anchor_B = 4.0 + 0.3 * exp_val + 0.1 * year_val + random.gauss(0, 0.3)
+        anchor_B = 4.0 + 0.3 * exp_val + 0.1 * year_val + rng.gauss(0, 0.3)
         # Section C (Readiness): students rate themselves moderately
-        anchor_C_AR = 3.8 + 0.5 * exp_val + 0.15 * year_val + random.gauss(0, 0.4)
-        anchor_C_CR = 4.5 + 0.3 * exp_val + 0.1 * year_val + random.gauss(0, 0.3)
+        anchor_C_AR = 3.8 + 0.5 * exp_val + 0.15 * year_val + rng.gauss(0, 0.4)
+        anchor_C_CR = 4.5 + 0.3 * exp_val + 0.1 * year_val + rng.gauss(0, 0.3)
 
         # Tool usage probability per category
         # CS/EE students use more ML/DL/NLP; ME students more EngDesign
@@ -226,6 +269,8 @@ def build_students():
         }
 
         personas.append({
+            'index': offset + i,
+            'rng': rng,
             'type': 'student',
             'demographics': {
                 'institution_or_company': schools[i],
@@ -241,15 +286,16 @@ def build_students():
                 'C_CR': anchor_C_CR,
             },
             'cat_prob': cat_prob,
-            'sd': 0.9 + random.uniform(-0.2, 0.2),
+            'sd': 0.9 + rng.uniform(-0.2, 0.2),
         })
 
     return personas
 
 
-def build_faculty():
-    """30 faculty personas."""
+def build_faculty(n=30, seed=42, offset=0, only=None):
+    """n faculty personas (default 30); see build_students for offset/only."""
     personas = []
+    pools_rng = stream(seed, 'pools', 'faculty')
 
     disciplines = (
         ['Mechanical Engineering']*7 +
@@ -260,18 +306,22 @@ def build_faculty():
         ['Biomedical Engineering']*3 +
         ['General Engineering / Engineering Education']*3
     )
-    random.shuffle(disciplines)
+    disciplines = scale_pool(disciplines, n)
+    pools_rng.shuffle(disciplines)
 
     years_pool = ['0–5']*8 + ['6–10']*8 + ['11–20']*8 + ['21+']*6
-    random.shuffle(years_pool)
+    years_pool = scale_pool(years_pool, n)
+    pools_rng.shuffle(years_pool)
 
     roles_pool = (
         ['Teaching']*10 + ['Research']*8 + ['Combination']*10 + ['Administration']*2
     )
-    random.shuffle(roles_pool)
+    roles_pool = scale_pool(roles_pool, n)
+    pools_rng.shuffle(roles_pool)
 
     inst_pool = ['R1']*15 + ['R2']*8 + ['Teaching-focused']*7
-    random.shuffle(inst_pool)
+    inst_pool = scale_pool(inst_pool, n)
+    pools_rng.shuffle(inst_pool)
 
     faculty_schools = (
         ['Purdue University']*6 +
@@ -287,14 +337,19 @@ def build_faculty():
         ['University of Cincinnati']*1 +
         ['Michigan State University']*1
     )
-    random.shuffle(faculty_schools)
+    faculty_schools = scale_pool(faculty_schools, n)
+    pools_rng.shuffle(faculty_schools)
 
     exp_pool = ['None']*3 + ['Limited']*9 + ['Moderate']*12 + ['Extensive']*6
-    random.shuffle(exp_pool)
+    exp_pool = scale_pool(exp_pool, n)
+    pools_rng.shuffle(exp_pool)
 
     context_options = ['Teaching','Research','Assessment','Administration','Personal productivity']
 
-    for i in range(30):
+    for i in range(n):
+        if only is not None and offset + i not in only:
+            continue
+        rng = persona_rng(seed, offset + i)
         exp = exp_pool[i]
         years = years_pool[i]
         role = roles_pool[i]
@@ -306,20 +361,20 @@ def build_faculty():
 
         # Context: researchers lean toward Research, teachers toward Teaching
         if role == 'Research':
-            ctx = random.choice(['Research','Personal productivity'])
+            ctx = rng.choice(['Research','Personal productivity'])
         elif role == 'Teaching':
-            ctx = random.choice(['Teaching','Assessment'])
+            ctx = rng.choice(['Teaching','Assessment'])
         else:
-            ctx = random.choice(context_options)
+            ctx = rng.choice(context_options)
 
         # Section A: faculty generally see value (5-6 range), experienced more
-        anchor_A = 4.8 + 0.3 * exp_val + 0.1 * years_val + random.gauss(0, 0.3)
+        anchor_A = 4.8 + 0.3 * exp_val + 0.1 * years_val + rng.gauss(0, 0.3)
         # Section B: faculty with more experience have stronger guardrails
-        anchor_B = 4.5 + 0.2 * exp_val + 0.15 * years_val + random.gauss(0, 0.3)
+        anchor_B = 4.5 + 0.2 * exp_val + 0.15 * years_val + rng.gauss(0, 0.3)
         # Section C AR: readiness varies — new faculty lower, experienced higher
-        anchor_C_AR = 4.0 + 0.4 * exp_val + 0.1 * years_val + random.gauss(0, 0.4)
+        anchor_C_AR = 4.0 + 0.4 * exp_val + 0.1 * years_val + rng.gauss(0, 0.4)
         # Section C CR: preparing career-ready engineers
-        anchor_C_CR = 4.3 + 0.3 * exp_val + 0.05 * years_val + random.gauss(0, 0.35)
+        anchor_C_CR = 4.3 + 0.3 * exp_val + 0.05 * years_val + rng.gauss(0, 0.35)
 
         is_cs_ee = 'Computer' in disc or 'Electrical' in disc
         is_eng_ed = 'General' in disc or 'Education' in disc
@@ -337,6 +392,8 @@ def build_faculty():
         }
 
         personas.append({
+            'index': offset + i,
+            'rng': rng,
             'type': 'faculty',
             'demographics': {
                 'institution_or_company': faculty_schools[i],
@@ -354,15 +411,16 @@ def build_faculty():
                 'C_CR': anchor_C_CR,
             },
             'cat_prob': cat_prob,
-            'sd': 0.85 + random.uniform(-0.15, 0.2),
+            'sd': 0.85 + rng.uniform(-0.15, 0.2),
         })
 
     return personas
 
 
-def build_practitioners():
-    """30 practitioner personas."""
+def build_practitioners(n=30, seed=42, offset=0, only=None):
+    """n practitioner personas (default 30); see build_students for offset/only."""
     personas = []
+    pools_rng = stream(seed, 'pools', 'practitioner')
 
     disciplines = (
         ['Mechanical Engineering']*7 +
@@ -373,16 +431,19 @@ def build_practitioners():
         ['Software / Systems Engineering']*3 +
         ['Aerospace Engineering']*2
     )
-    random.shuffle(disciplines)
+    disciplines = scale_pool(disciplines, n)
+    pools_rng.shuffle(disciplines)
 
     years_pool = ['0–5']*8 + ['6–10']*8 + ['11–20']*8 + ['21+']*6
-    random.shuffle(years_pool)
+    years_pool = scale_pool(years_pool, n)
+    pools_rng.shuffle(years_pool)
 
     roles_pool = (
         ['Engineer']*12 + ['Technical Lead']*7 +
         ['Manager']*6 + ['Hiring Manager']*5
     )
-    random.shuffle(roles_pool)
+    roles_pool = scale_pool(roles_pool, n)
+    pools_rng.shuffle(roles_pool)
 
     industries = [
         'Automotive','Automotive','Automotive','Automotive',
@@ -397,10 +458,12 @@ def build_practitioners():
         'Consumer Products','Consumer Products',
         'Telecommunications','Oil & Gas','Robotics / Automation','Chemical Processing',
     ]
-    random.shuffle(industries)
+    industries = scale_pool(industries, n)
+    pools_rng.shuffle(industries)
 
     org_sizes = ['<100']*5 + ['100–999']*8 + ['1,000–9,999']*9 + ['10,000+']*8
-    random.shuffle(org_sizes)
+    org_sizes = scale_pool(org_sizes, n)
+    pools_rng.shuffle(org_sizes)
 
     companies = [
         'Caterpillar','Caterpillar','Caterpillar',
@@ -422,14 +485,19 @@ def build_practitioners():
         'Medtronic',
         'AECOM',
     ]
-    random.shuffle(companies)
+    companies = scale_pool(companies, n)
+    pools_rng.shuffle(companies)
 
     exp_pool = ['None']*2 + ['Limited']*7 + ['Moderate']*13 + ['Extensive']*8
-    random.shuffle(exp_pool)
+    exp_pool = scale_pool(exp_pool, n)
+    pools_rng.shuffle(exp_pool)
 
     context_options = ['Engineering design','Analysis/simulation','Project management','Decision support']
 
-    for i in range(30):
+    for i in range(n):
+        if only is not None and offset + i not in only:
+            continue
+        rng = persona_rng(seed, offset + i)
         exp = exp_pool[i]
         years = years_pool[i]
         role = roles_pool[i]
@@ -440,17 +508,17 @@ def build_practitioners():
         exp_val = EXP_LEVELS[exp]
         years_val = {'0–5':0,'6–10':1,'11–20':2,'21+':3}[years]
 
-        ctx = random.choice(context_options)
+        ctx = rng.choice(context_options)
 
         # Section A: practitioners see high value in AI (industry perspective)
-        anchor_A = 5.0 + 0.25 * exp_val + 0.1 * years_val + random.gauss(0, 0.3)
+        anchor_A = 5.0 + 0.25 * exp_val + 0.1 * years_val + rng.gauss(0, 0.3)
         # Section B: workplace practices — experienced practitioners rate higher
-        anchor_B = 4.3 + 0.2 * exp_val + 0.1 * years_val + random.gauss(0, 0.35)
+        anchor_B = 4.3 + 0.2 * exp_val + 0.1 * years_val + rng.gauss(0, 0.35)
         # Section C AR: practitioners rate GRADUATE readiness LOWER than students
         # rate their own (documented pattern in workforce readiness literature)
-        anchor_C_AR = 3.5 + 0.15 * exp_val + 0.05 * years_val + random.gauss(0, 0.4)
+        anchor_C_AR = 3.5 + 0.15 * exp_val + 0.05 * years_val + rng.gauss(0, 0.4)
         # Section C CR: workforce preparedness
-        anchor_C_CR = 3.8 + 0.2 * exp_val + 0.1 * years_val + random.gauss(0, 0.35)
+        anchor_C_CR = 3.8 + 0.2 * exp_val + 0.1 * years_val + rng.gauss(0, 0.35)
 
         is_tech = 'Software' in disc or 'Computer' in disc or 'Technology' in industry
         is_large_org = org_size in ('1,000–9,999', '10,000+')
@@ -468,6 +536,8 @@ def build_practitioners():
         }
 
         personas.append({
+            'index': offset + i,
+            'rng': rng,
             'type': 'practitioner',
             'demographics': {
                 'institution_or_company': companies[i],
@@ -486,7 +556,7 @@ def build_practitioners():
                 'C_CR': anchor_C_CR,
             },
             'cat_prob': cat_prob,
-            'sd': 0.9 + random.uniform(-0.15, 0.2),
+            'sd': 0.9 + rng.uniform(-0.15, 0.2),
         })
 
     return personas
@@ -496,37 +566,35 @@ def build_practitioners():
 # GENERATE RESPONSES FROM PERSONA
 # ================================================================
 
+def section_items(stype):
+    """[(section, item codes)] for a stakeholder type, in survey order."""
+    if stype == 'student':
+        return [('A', SECTION_A_ITEMS), ('B', SECTION_B_ITEMS_STUDENT), ('C', SECTION_C_ITEMS_STUDENT)]
+    if stype == 'practitioner':
+        return [('A', SECTION_A_ITEMS), ('B', SECTION_B_ITEMS_PRACTITIONER), ('C', SECTION_C_ITEMS_PRACTITIONER)]
+    return [('A', SECTION_A_ITEMS), ('B', SECTION_B_ITEMS), ('C', SECTION_C_ITEMS_FACULTY)]
+
+
+def anchor_key(section, code):
+    """Which persona anchor drives an item (Section C splits AR and CR)."""
+    if section == 'C':
+        return 'C_AR' if code.startswith('AR') else 'C_CR'
+    return section
+
+
 def generate_likert_responses(persona):
     """Produce list of {section, item_code, value} dicts."""
     a = persona['anchors']
     sd = persona['sd']
+    rng = persona['rng']
     rows = []
 
-    # Section A (all 15 items same for all stakeholders)
-    for code in SECTION_A_ITEMS:
-        rows.append({'section': 'A', 'item_code': code, 'value': likert(a['A'], sd)})
-
-    # Section B (student has fewer GB items)
-    if persona['type'] == 'student':
-        b_items = SECTION_B_ITEMS_STUDENT
-    elif persona['type'] == 'practitioner':
-        b_items = SECTION_B_ITEMS_PRACTITIONER
-    else:
-        b_items = SECTION_B_ITEMS
-    for code in b_items:
-        rows.append({'section': 'B', 'item_code': code, 'value': likert(a['B'], sd)})
-
-    # Section C — AR and CR have different anchors
-    if persona['type'] == 'student':
-        c_items = SECTION_C_ITEMS_STUDENT
-    elif persona['type'] == 'practitioner':
-        c_items = SECTION_C_ITEMS_PRACTITIONER
-    else:
-        c_items = SECTION_C_ITEMS_FACULTY
-
-    for code in c_items:
-        anchor = a['C_AR'] if code.startswith('AR') else a['C_CR']
-        rows.append({'section': 'C', 'item_code': code, 'value': likert(anchor, sd)})
+    # Sections A, B, C (student/practitioner have fewer GB items; Section C
+    # AR and CR have different anchors)
+    for section, codes in section_items(persona['type']):
+        for code in codes:
+            value = likert(a[anchor_key(section, code)], sd, rng)
+            rows.append({'section': section, 'item_code': code, 'value': value})
 
     return rows
 
@@ -535,18 +603,19 @@ def generate_tool_responses(persona):
     """Produce list of {category, uses_category, selected_tools, other_tool} dicts."""
     stype = persona['type']
     cat_prob = persona['cat_prob']
+    rng = persona['rng']
     rows = []
 
     for cat_id in CATEGORIES:
         prob = min(0.95, max(0.02, cat_prob.get(cat_id, 0.1)))
-        uses = random.random() < prob
+        uses = rng.random() < prob
 
         selected = []
         if uses:
             tools_list = TOOLS[stype][cat_id]
             # Select 1-4 tools, weighted toward fewer
-            n_tools = min(len(tools_list), max(1, int(random.gauss(2.5, 1.2))))
-            selected = random.sample(tools_list, min(n_tools, len(tools_list)))
+            n_tools = min(len(tools_list), max(1, int(rng.gauss(2.5, 1.2))))
+            selected = rng.sample(tools_list, min(n_tools, len(tools_list)))
 
         rows.append({
             'category': cat_id,
@@ -558,55 +627,187 @@ def generate_tool_responses(persona):
     return rows
 
 
+# ================================================================
+# MONTE CARLO POWER ANALYSIS (no network)
+# ================================================================
+
+def construct_plan(stype):
+    """[(construct_id, anchor_key, n_items)] for a stakeholder type."""
+    plan = {}
+    for section, codes in section_items(stype):
+        for code in codes:
+            cid = construct_of(code)
+            if cid not in plan:
+                plan[cid] = [anchor_key(section, code), 0]
+            plan[cid][1] += 1
+    return [(cid, key, k) for cid, (key, k) in plan.items()]
+
+
+def persona_construct_scores(persona, plan):
+    """Construct means for one persona, drawn straight from the generative
+    model without building per-item row dicts (fast path for replicates)."""
+    a = persona['anchors']
+    sd = persona['sd']
+    gauss = persona['rng'].gauss
+    scores = []
+    for cid, key, k in plan:
+        mu = a[key]
+        total = 0
+        for _ in range(k):
+            v = round(gauss(mu, sd))
+            total += 1 if v < 1 else (7 if v > 7 else v)
+        scores.append((cid, total / k))
+    return scores
+
+
+def power_chunk(args):
+    """Run a block of replicate surveys at one per-group size.
+
+    Each replicate derives its streams from (seed, n, replicate) so results
+    do not depend on how replicates are split across worker processes.
+    Returns (n, [{construct_id: (p, eta_squared)}]).
+    """
+    n, seed, replicates = args
+    plans = {t: construct_plan(t) for t in STAKEHOLDER_TYPES}
+    results = []
+    for rep in replicates:
+        personas = build_all((n, n, n), f'{seed}:{n}:{rep}')
+
+        # Per-construct, per-group moments: [n, sum, sum of squares]
+        moments = {}
+        for persona in personas:
+            stype = persona['type']
+            for cid, score in persona_construct_scores(persona, plans[stype]):
+                m = moments.setdefault(cid, {}).setdefault(stype, [0, 0.0, 0.0])
+                m[0] += 1
+                m[1] += score
+                m[2] += score * score
+
+        rep_result = {}
+        for cid, groups in moments.items():
+            res = anova_from_moments([tuple(m) for m in groups.values()])
+            rep_result[cid] = (res['p'], res['etaSquared'])
+        results.append(rep_result)
+    return n, results
+
+
+def quantile(sorted_vals, q):
+    """Linear-interpolated quantile of an already sorted list."""
+    if not sorted_vals:
+        return None
+    pos = (len(sorted_vals) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+
+def run_power_analysis(sizes, replicates, seed=42, alpha=0.05, workers=None, json_path=None):
+    """Estimate ANOVA power per construct for each per-group sample size."""
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, replicates // (workers * 4))
+    tasks = [
+        (n, seed, range(start, min(start + chunk, replicates)))
+        for n in sizes
+        for start in range(0, replicates, chunk)
+    ]
+
+    print(f"\nRunning {replicates} replicates x {len(sizes)} sizes on {workers} worker(s)...")
+    t0 = time.time()
+    collected = {n: [] for n in sizes}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for n, results in pool.map(power_chunk, tasks):
+            collected[n].extend(results)
+    print(f"Done in {time.time() - t0:.1f}s\n")
+
+    summary = {}
+    for n in sizes:
+        summary[n] = {}
+        for cid in CONSTRUCT_NAMES:
+            ps = [r[cid][0] for r in collected[n] if cid in r and r[cid][0] is not None]
+            etas = sorted(r[cid][1] for r in collected[n] if cid in r and r[cid][1] is not None)
+            if not ps:
+                continue
+            summary[n][cid] = {
+                'power': sum(1 for p in ps if p < alpha) / len(ps),
+                'eta_sq_median': quantile(etas, 0.5),
+                'eta_sq_lo': quantile(etas, 0.025),
+                'eta_sq_hi': quantile(etas, 0.975),
+            }
+
+    print(f"Power (alpha={alpha}) by per-group n; eta^2 median [95% interval]")
+    print("-" * 70)
+    print(f"{'Construct':10s}" + "".join(f"{'n=' + str(n):>10s}" for n in sizes))
+    for cid in CONSTRUCT_NAMES:
+        cells = [summary[n].get(cid) for n in sizes]
+        print(f"{cid:10s}" + "".join(f"{c['power']:10.2f}" if c else f"{'--':>10s}" for c in cells))
+    print()
+    for cid in CONSTRUCT_NAMES:
+        c = summary[sizes[-1]].get(cid)
+        if c:
+            print(f"  {cid:6s} n={sizes[-1]}: eta^2 {c['eta_sq_median']:.3f} "
+                  f"[{c['eta_sq_lo']:.3f}, {c['eta_sq_hi']:.3f}]")
+
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump({'alpha': alpha, 'replicates': replicates, 'seed': seed,
+                       'results': {str(n): v for n, v in summary.items()}}, f, indent=2)
+        print(f"\nSaved power grid -> {json_path}")
+
+    return summary
+
+
 # ================================================================
 # SUPABASE REST API SUBMISSION
 # ================================================================
 
+_client = None
+
+
+def rest_client():
+    """Created on first use so power-analysis worker processes never open one."""
+    global _client
+    if _client is None:
+        _client = SupabaseClient(SUPABASE_URL, ANON_KEY)
+    return _client
+
+
 def supabase_insert(table, rows):
     """Insert rows into a Supabase table via REST API."""
-    url = f"{SUPABASE_URL}/rest/v1/{table}"
-    data = json.dumps(rows).encode('utf-8')
-    req = Request(url, data=data, method='POST')
-    req.add_header('apikey', ANON_KEY)
-    req.add_header('Authorization', f'Bearer {ANON_KEY}')
-    req.add_header('Content-Type', 'application/json')
-    req.add_header('Prefer', 'return=minimal')
-
     try:
-        resp = urlopen(req)
-        return resp.status
-    except HTTPError as e:
-        body = e.read().decode('utf-8')
-        print(f"  ERROR inserting into {table}: {e.code} — {body}", file=sys.stderr)
+        return rest_client().insert(table, rows)
+    except SupabaseError as e:
+        print(f"  ERROR inserting into {table}: {e.status} — {e.body}", file=sys.stderr)
         raise
 
 
-def submit_persona(persona, index):
-    """Submit a single persona's complete survey response."""
-    respondent_id = str(uuid.uuid4())
-    stype = persona['type']
+ACCESS_CODES = {
+    'faculty': 'FACULTY7389',
+    'student': 'STUDENT2025',
+    'practitioner': 'PRACTITIONER1023',
+}
 
-    access_codes = {
-        'faculty': 'FACULTY7389',
-        'student': 'STUDENT2025',
-        'practitioner': 'PRACTITIONER1023',
-    }
+
+def persona_rows(persona):
+    """Build (respondent, section_a_rows, likert_rows) for one persona.
+
+    Everything, including the respondent id, comes from the persona's own
+    random stream, so the rows are identical wherever they are generated.
+    """
+    rng = persona['rng']
+    respondent_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    stype = persona['type']
 
     # Build respondent record
     respondent = {
         'id': respondent_id,
         'stakeholder_type': stype,
-        'access_code': access_codes[stype],
+        'access_code': ACCESS_CODES[stype],
     }
     respondent.update(persona['demographics'])
 
-    # Insert respondent
-    supabase_insert('respondents', [respondent])
-
-    # Generate and insert tool responses (section_a_responses table)
-    tool_rows = generate_tool_responses(persona)
+    # Tool responses (section_a_responses table)
     sa_rows = []
-    for tr in tool_rows:
+    for tr in generate_tool_responses(persona):
         sa_rows.append({
             'respondent_id': respondent_id,
             'category': tr['category'],
@@ -614,18 +815,27 @@ def submit_persona(persona, index):
             'selected_tools': json.dumps(tr['selected_tools']),
             'other_tool': tr['other_tool'],
         })
-    supabase_insert('section_a_responses', sa_rows)
 
-    # Generate and insert Likert responses
-    likert_rows = generate_likert_responses(persona)
+    # Likert responses
     lr_rows = []
-    for lr in likert_rows:
+    for lr in generate_likert_responses(persona):
         lr_rows.append({
             'respondent_id': respondent_id,
             'section': lr['section'],
             'item_code': lr['item_code'],
             'value': lr['value'],
         })
+
+    return respondent, sa_rows, lr_rows
+
+
+def submit_persona(persona, index):
+    """Submit a single persona's complete survey response."""
+    respondent, sa_rows, lr_rows = persona_rows(persona)
+    stype = persona['type']
+
+    supabase_insert('respondents', [respondent])
+    supabase_insert('section_a_responses', sa_rows)
     supabase_insert('likert_responses', lr_rows)
 
     # Brief description for logging
@@ -641,26 +851,84 @@ def submit_persona(persona, index):
 
 
 # ================================================================
-# MAIN
+# SHARDED GENERATION
 # ================================================================
 
-if __name__ == '__main__':
-    random.seed(42)  # Reproducible results
+def build_all(counts, seed):
+    """All personas for (students, faculty, practitioners) counts, in index order."""
+    ns, nf, npr = counts
+    return (build_students(ns, seed, 0) +
+            build_faculty(nf, seed, ns) +
+            build_practitioners(npr, seed, ns + nf))
+
+
+def submission_order(total, seed):
+    """Global submission order: a seeded permutation of persona indices."""
+    order = list(range(total))
+    stream(seed, 'order').shuffle(order)  # Mix submission order
+    return order
+
+
+def shard_personas(counts, seed, shard=0, num_shards=1):
+    """Personas for shard `shard` of `num_shards`, in submission order.
+
+    Shards are contiguous slices of the global submission order, so shards
+    0..num_shards-1 concatenated equal a single-process run.
+    Returns (position of the first persona, personas).
+    """
+    ns, nf, npr = counts
+    total = ns + nf + npr
+    lo = shard * total // num_shards
+    hi = (shard + 1) * total // num_shards
+    wanted = submission_order(total, seed)[lo:hi]
+    only = set(wanted)
+    built = (build_students(ns, seed, 0, only) +
+             build_faculty(nf, seed, ns, only) +
+             build_practitioners(npr, seed, ns + nf, only))
+    by_index = {p['index']: p for p in built}
+    return lo, [by_index[i] for i in wanted]
+
+
+def write_shard(personas, out_dir, shard, num_shards):
+    """Write a shard as JSONL, one file per table.
+
+    Files are named {table}.{shard}-of-{num_shards}.jsonl; concatenating them
+    in name order reproduces the single-process output byte for byte.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    suffix = f'{shard:05d}-of-{num_shards:05d}.jsonl'
+    files = {
+        table: open(os.path.join(out_dir, f'{table}.{suffix}'), 'w', encoding='utf-8')
+        for table in ('respondents', 'section_a_responses', 'likert_responses')
+    }
+    try:
+        for persona in personas:
+            respondent, sa_rows, lr_rows = persona_rows(persona)
+            files['respondents'].write(json.dumps(respondent, ensure_ascii=False) + '\n')
+            for row in sa_rows:
+                files['section_a_responses'].write(json.dumps(row, ensure_ascii=False) + '\n')
+            for row in lr_rows:
+                files['likert_responses'].write(json.dumps(row, ensure_ascii=False) + '\n')
+    finally:
+        for f in files.values():
+            f.close()
+    print(f"  Wrote {len(personas)} personas -> {out_dir}/*.{suffix}")
+
+
+# ================================================================
+# MAIN
+# ================================================================
 
+def submit_all(counts=(40, 30, 30), seed=42, shard=0, num_shards=1):
+    """Build the personas for one shard and submit them to the live database."""
     print("=" * 70)
     print("AI-Eng-TAM Survey Simulation")
     print("=" * 70)
 
-    # Build all personas
-    print("\nBuilding 40 student personas...")
-    students = build_students()
-    print("Building 30 faculty personas...")
-    faculty = build_faculty()
-    print("Building 30 practitioner personas...")
-    practitioners = build_practitioners()
-
-    all_personas = students + faculty + practitioners
-    random.shuffle(all_personas)  # Mix submission order
+    ns, nf, npr = counts
+    print(f"\nBuilding {ns} student, {nf} faculty and {npr} practitioner personas"
+          f" (shard {shard + 1} of {num_shards})...")
+    start, all_personas = shard_personas(counts, seed, shard, num_shards)
 
     print(f"\nSubmitting {len(all_personas)} responses to Supabase...\n")
 
@@ -670,11 +938,11 @@ if __name__ == '__main__':
 
     for i, persona in enumerate(all_personas):
         try:
-            submit_persona(persona, i)
+            submit_persona(persona, start + i)
             success += 1
         except Exception as e:
             errors += 1
-            print(f"  FAILED [{i+1}]: {e}", file=sys.stderr)
+            print(f"  FAILED [{start+i+1}]: {e}", file=sys.stderr)
 
         # Small delay to avoid rate limiting
         if (i + 1) % 10 == 0:
@@ -687,3 +955,48 @@ if __name__ == '__main__':
     print(f"{'=' * 70}")
     print(f"\nView results at: https://ai-eng-tam-survey.vercel.app/admin")
     print(f"Admin password: admin2025")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--power', action='store_true',
+                        help='run an offline Monte Carlo power analysis instead of submitting')
+    parser.add_argument('--sizes', default='10,20,30,40,60,80',
+                        help='comma-separated per-group sample sizes (power mode)')
+    parser.add_argument('--replicates', type=int, default=1000,
+                        help='replicate surveys per sample size (power mode)')
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    parser.add_argument('--json', dest='json_path', help='also write the power grid as JSON')
+    parser.add_argument('--counts', default='40,30,30',
+                        help='students,faculty,practitioners to generate')
+    parser.add_argument('--shard', default='1/1',
+                        help='generate only shard K of N (1-based, e.g. 3/8)')
+    parser.add_argument('--out', help='write JSONL files to this directory instead of submitting')
+    parser.add_argument('--trace', metavar='PATH', help='append a JSONL span per REST call (see trace-report.py)')
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+
+    if args.power:
+        sizes = [int(x) for x in args.sizes.split(',') if x.strip()]
+        run_power_analysis(sizes, args.replicates, args.seed, args.alpha,
+                           args.workers, args.json_path)
+        return
+
+    counts = tuple(int(x) for x in args.counts.split(','))
+    k, num_shards = (int(x) for x in args.shard.split('/'))
+    if len(counts) != 3 or not 1 <= k <= num_shards:
+        parser.error('--counts needs three values and --shard must be K/N with 1 <= K <= N')
+
+    if args.out:
+        _, personas = shard_personas(counts, args.seed, k - 1, num_shards)
+        write_shard(personas, args.out, k - 1, num_shards)
+    else:
+        submit_all(counts, args.seed, k - 1, num_shards)
+
+
+if __name__ == '__main__':
+    main()
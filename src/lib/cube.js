@@ -0,0 +1,224 @@
+// Demographic cube for the admin dashboard.
+// One pass over the data builds a base cuboid: a cell per distinct
+// combination of the configured demographic dimensions, each holding
+// mergeable moments (n, sum, sumsq) for every construct score and every
+// Likert item. Any slice, rollup or group comparison is then answered by
+// merging cells -- never by going back to the raw Likert rows. The rollups
+// in CUBE_ROLLUPS are materialized up front so the common views merge a
+// handful of cells instead of the whole base cuboid.
+import { anovaFromMoments } from './statistics';
+import { DEMOGRAPHICS } from '../data/surveyData';
+
+export const CUBE_DIMENSIONS = [
+  'stakeholder_type',
+  'prior_ai_experience',
+  'primary_ai_context',
+  'engineering_discipline',
+  'year_in_program',
+  'years_in_academia',
+  'primary_role',
+  'institution_type',
+  'years_professional_experience',
+  'practitioner_role',
+  'industry_sector',
+  'organization_size',
+];
+
+// Each dimension alone, and crossed with stakeholder_type
+export const CUBE_ROLLUPS = CUBE_DIMENSIONS.flatMap((d) =>
+  d === 'stakeholder_type' ? [[d]] : [[d], ['stakeholder_type', d]]);
+
+const SEP = '\u001f';
+const STAKEHOLDERS = ['faculty', 'student', 'practitioner'];
+
+// Labels and answer order from the survey definitions
+const FIELD_INFO = { stakeholder_type: { label: 'Stakeholder type', options: STAKEHOLDERS } };
+for (const { fields } of Object.values(DEMOGRAPHICS)) {
+  for (const f of fields) {
+    if (!FIELD_INFO[f.id]) FIELD_INFO[f.id] = { label: f.label, options: f.options || [] };
+  }
+}
+
+export function dimensionLabel(dim) {
+  return FIELD_INFO[dim]?.label || dim;
+}
+
+// Sort group values in survey answer order, free text alphabetically after
+export function sortDimensionValues(dim, values) {
+  const order = FIELD_INFO[dim]?.options || [];
+  const rank = (v) => (order.indexOf(v) === -1 ? order.length : order.indexOf(v));
+  return [...values].sort((a, b) => rank(a) - rank(b) || String(a).localeCompare(String(b)));
+}
+
+function dimValue(respondent, dim) {
+  const v = respondent[dim];
+  if (v == null) return '';
+  return String(v).trim();
+}
+
+function newCell(values, cube) {
+  return {
+    values,
+    n: 0,
+    constructs: new Float64Array(cube.constructIds.length * 3),
+    items: new Float64Array(cube.itemCodes.length * 3),
+  };
+}
+
+function mergeInto(target, cell) {
+  target.n += cell.n;
+  for (let i = 0; i < cell.constructs.length; i++) target.constructs[i] += cell.constructs[i];
+  for (let i = 0; i < cell.items.length; i++) target.items[i] += cell.items[i];
+}
+
+function addMoment(arr, index, value) {
+  arr[index * 3] += 1;
+  arr[index * 3 + 1] += value;
+  arr[index * 3 + 2] += value * value;
+}
+
+function project(cells, positions, cube) {
+  const out = new Map();
+  for (const cell of cells) {
+    const values = positions.map((p) => cell.values[p]);
+    const key = values.join(SEP);
+    let target = out.get(key);
+    if (!target) {
+      target = newCell(values, cube);
+      out.set(key, target);
+    }
+    mergeInto(target, cell);
+  }
+  return out;
+}
+
+// data: { respondents, likert }; likertSections: getLikertSections
+export function buildCube(data, likertSections, { dimensions = CUBE_DIMENSIONS, rollups = CUBE_ROLLUPS } = {}) {
+  // Construct -> item codes per stakeholder type (as in aggregateByConstruct)
+  const constructItems = {};
+  const itemIndex = new Map();
+  for (const stType of STAKEHOLDERS) {
+    const sections = likertSections(stType);
+    for (const secKey of ['A', 'B', 'C']) {
+      for (const construct of sections[secKey].constructs) {
+        if (!constructItems[construct.id]) constructItems[construct.id] = {};
+        constructItems[construct.id][stType] = construct.items.map((i) => i.code);
+        for (const item of construct.items) {
+          if (!itemIndex.has(item.code)) itemIndex.set(item.code, itemIndex.size);
+        }
+      }
+    }
+  }
+
+  const cube = {
+    dimensions,
+    constructIds: Object.keys(constructItems),
+    itemCodes: [...itemIndex.keys()],
+    base: new Map(),
+    rollups: [],
+  };
+
+  const byRespondent = new Map();
+  for (const row of data.likert) {
+    let responses = byRespondent.get(row.respondent_id);
+    if (!responses) {
+      responses = {};
+      byRespondent.set(row.respondent_id, responses);
+    }
+    responses[row.item_code] = row.value;
+  }
+
+  for (const r of data.respondents) {
+    const responses = byRespondent.get(r.id);
+    if (!responses) continue;
+    const values = dimensions.map((d) => dimValue(r, d));
+    const key = values.join(SEP);
+    let cell = cube.base.get(key);
+    if (!cell) {
+      cell = newCell(values, cube);
+      cube.base.set(key, cell);
+    }
+    cell.n += 1;
+
+    cube.constructIds.forEach((cId, ci) => {
+      const codes = constructItems[cId][r.stakeholder_type];
+      if (!codes) return;
+      let sum = 0;
+      let count = 0;
+      for (const code of codes) {
+        const v = responses[code];
+        if (v != null) {
+          sum += v;
+          count += 1;
+        }
+      }
+      if (count > 0) addMoment(cell.constructs, ci, sum / count);
+    });
+    for (const [code, v] of Object.entries(responses)) {
+      const ii = itemIndex.get(code);
+      if (ii !== undefined && v != null) addMoment(cell.items, ii, v);
+    }
+  }
+
+  for (const dims of rollups) {
+    const positions = dims.map((d) => dimensions.indexOf(d));
+    if (positions.includes(-1)) continue;
+    cube.rollups.push({ dims, cells: project(cube.base.values(), positions, cube) });
+  }
+  return cube;
+}
+
+// Group the cube by `by` dimensions, restricted by `where` ({ dim: value or [values] }).
+// Returns [{ key: { dim: value }, cell }]. Empty strings mean "not answered".
+export function queryCube(cube, { by = [], where = {} } = {}) {
+  const needed = [...new Set([...by, ...Object.keys(where)])];
+
+  // Smallest materialized rollup that has every needed dimension, else the base
+  let source = { dims: cube.dimensions, cells: cube.base };
+  for (const rollup of cube.rollups) {
+    if (needed.every((d) => rollup.dims.includes(d)) && rollup.cells.size < source.cells.size) {
+      source = rollup;
+    }
+  }
+
+  const filters = Object.entries(where).map(([dim, allowed]) => [
+    source.dims.indexOf(dim),
+    new Set(Array.isArray(allowed) ? allowed : [allowed]),
+  ]);
+  const cells = [...source.cells.values()].filter((cell) =>
+    filters.every(([pos, allowed]) => allowed.has(cell.values[pos])));
+
+  const grouped = project(cells, by.map((d) => source.dims.indexOf(d)), cube);
+  return [...grouped.values()].map((cell) => ({
+    key: Object.fromEntries(by.map((d, i) => [d, cell.values[i]])),
+    cell,
+  }));
+}
+
+// { n, sum, sumsq } for a construct id or item code within a cell
+export function cellMoments(cube, cell, { construct, item }) {
+  const [arr, index] = construct !== undefined
+    ? [cell.constructs, cube.constructIds.indexOf(construct)]
+    : [cell.items, cube.itemCodes.indexOf(item)];
+  if (index === -1) return { n: 0, sum: 0, sumsq: 0 };
+  return { n: arr[index * 3], sum: arr[index * 3 + 1], sumsq: arr[index * 3 + 2] };
+}
+
+// { n, mean, sd } from moments (sample SD, as descriptiveStats)
+export function momentStats({ n, sum, sumsq }) {
+  if (n === 0) return { n: 0, mean: null, sd: null };
+  const mean = sum / n;
+  const variance = n > 1 ? Math.max(0, (sumsq - n * mean * mean) / (n - 1)) : 0;
+  return { n, mean, sd: Math.sqrt(variance) };
+}
+
+// One-way ANOVA across the values of `dim` for a construct or item.
+// Respondents who did not answer `dim` are left out.
+export function compareGroups(cube, dim, { where = {}, construct, item } = {}) {
+  const groups = {};
+  for (const { key, cell } of queryCube(cube, { by: [dim], where })) {
+    if (key[dim] === '') continue;
+    groups[key[dim]] = cellMoments(cube, cell, { construct, item });
+  }
+  return anovaFromMoments(groups);
+}
@@ -0,0 +1,222 @@
+// Response quality checks for the admin dashboard (same rules as
+// survey_quality.py, which writes data_quality.csv when archiving).
+// Each respondent's Likert vector, items in survey order, is screened for
+// zero variance, long strings of one answer and repeating patterns.
+// Duplicate submissions are found without comparing all pairs: identical
+// vectors share a hash key, and near duplicates share at least one LSH
+// band. With MAX_DIFF + 1 interleaved bands, two vectors differing in at
+// most MAX_DIFF items agree on a whole band; candidates are verified by
+// Hamming distance. Each vector is compared with at most BUCKET_WINDOW
+// earlier members of each bucket, so the work stays O(n * bands * BUCKET_WINDOW)
+// when a cohort of similar answers fills one bucket. Larger buckets are
+// sorted by answers first so the window holds the most similar vectors;
+// only pairs further apart than that can be missed.
+import { CONSTRUCT_NAMES } from '../data/surveyData';
+
+// Keep in sync with survey_quality.py
+export const MIN_ITEMS = 10; // fewer answered items: not screened
+export const LONG_STRING_SHARE = 0.5; // longest run of one answer >= this share of items
+export const PATTERN_PERIODS = [2, 3, 4, 5, 6, 7];
+export const PATTERN_SHARE = 0.9; // answer i equals answer i - period this often ...
+export const PATTERN_MAX_REPEAT = 0.5; // ... while consecutive answers repeat at most this often
+export const MAX_DIFF = 2; // near duplicate: at most this many differing items
+export const BUCKET_WINDOW = 64; // earlier bucket members each vector is compared with
+
+export const QUALITY_FLAGS = {
+  zero_variance: 'Zero variance',
+  long_string: 'Long string',
+  pattern: 'Repeating pattern',
+  exact_duplicate: 'Exact duplicate',
+  near_duplicate: 'Near duplicate',
+};
+
+const CONSTRUCT_RANK = Object.fromEntries(Object.keys(CONSTRUCT_NAMES).map((c, i) => [c, i]));
+
+function itemOrder(a, b) {
+  const parse = (code) => {
+    const construct = code.replace(/\d+$/, '');
+    return [CONSTRUCT_RANK[construct] ?? Infinity, construct, Number(code.slice(construct.length)) || 0];
+  };
+  const [ra, ca, na] = parse(a);
+  const [rb, cb, nb] = parse(b);
+  return ra - rb || ca.localeCompare(cb) || na - nb;
+}
+
+// vector: answers in survey order, null = unanswered
+export function screenVector(vector) {
+  let n = 0;
+  let sum = 0;
+  let sumsq = 0;
+  let run = 0;
+  let longest = 0;
+  let prev = null;
+  const same = new Array(8).fill(0);
+  const pairs = new Array(8).fill(0);
+  for (let i = 0; i < vector.length; i++) {
+    const v = vector[i];
+    if (v == null) {
+      run = 0;
+      prev = null;
+      continue;
+    }
+    n += 1;
+    sum += v;
+    sumsq += v * v;
+    run = v === prev ? run + 1 : 1;
+    if (run > longest) longest = run;
+    prev = v;
+    for (let lag = 1; lag < 8 && lag <= i; lag++) {
+      const u = vector[i - lag];
+      if (u != null) {
+        pairs[lag] += 1;
+        if (u === v) same[lag] += 1;
+      }
+    }
+  }
+
+  if (n === 0) return { n: 0, sd: null, longestRun: 0, patternPeriod: null, flags: [] };
+  const mean = sum / n;
+  const sd = n > 1 ? Math.sqrt(Math.max(0, sumsq - n * mean * mean) / (n - 1)) : 0;
+  const flags = [];
+  let patternPeriod = null;
+  if (n >= MIN_ITEMS) {
+    if (sd === 0) {
+      flags.push('zero_variance');
+    } else if (longest >= LONG_STRING_SHARE * n) {
+      flags.push('long_string');
+    } else if (pairs[1] && same[1] <= PATTERN_MAX_REPEAT * pairs[1]) {
+      patternPeriod = PATTERN_PERIODS.find((lag) => pairs[lag] && same[lag] >= PATTERN_SHARE * pairs[lag]) ?? null;
+      if (patternPeriod) flags.push('pattern');
+    }
+  }
+  return { n, sd, longestRun: longest, patternPeriod, flags };
+}
+
+// Answer order of two vectors (unanswered first), as Python compares lists
+function compareVectors(a, b) {
+  for (let i = 0; i < a.length && i < b.length; i++) {
+    const d = (a[i] ?? -1) - (b[i] ?? -1);
+    if (d) return d;
+  }
+  return a.length - b.length;
+}
+
+function hamming(a, b, limit) {
+  let d = 0;
+  for (let i = 0; i < a.length && d <= limit; i++) {
+    if (a[i] !== b[i]) d += 1;
+  }
+  return d;
+}
+
+// vectors: [{ id, vector }] of one stakeholder type -> [[idA, idB, distance]]
+export function nearDuplicates(vectors, maxDiff = MAX_DIFF) {
+  const exact = new Map();
+  for (const { id, vector } of vectors) {
+    const key = vector.join(',');
+    if (!exact.has(key)) exact.set(key, { vector, ids: [] });
+    exact.get(key).ids.push(id);
+  }
+  const pairs = [];
+  for (const { ids } of exact.values()) {
+    for (const other of ids.slice(1)) pairs.push([ids[0], other, 0]);
+  }
+  if (maxDiff <= 0) return pairs;
+
+  // One representative per distinct vector; straight-liners are already
+  // flagged and would only crowd the buckets.
+  const uniques = [...exact.values()].filter(({ vector }) =>
+    new Set(vector.filter((v) => v != null)).size > 1);
+  const bands = maxDiff + 1;
+  const buckets = new Map();
+  uniques.forEach(({ vector }, u) => {
+    for (let b = 0; b < bands; b++) {
+      const key = `${b}|${vector.filter((_, i) => i % bands === b).join(',')}`;
+      if (!buckets.has(key)) buckets.set(key, []);
+      buckets.get(key).push(u);
+    }
+  });
+
+  const seen = new Set();
+  for (const members of buckets.values()) {
+    if (members.length > BUCKET_WINDOW) {
+      members.sort((p, q) => compareVectors(uniques[p].vector, uniques[q].vector));
+    }
+    for (let y = 1; y < members.length; y++) {
+      for (let x = Math.max(0, y - BUCKET_WINDOW); x < y; x++) {
+        const lo = Math.min(members[x], members[y]);
+        const hi = Math.max(members[x], members[y]);
+        const key = `${lo},${hi}`;
+        if (seen.has(key)) continue;
+        seen.add(key);
+        const a = uniques[lo];
+        const b = uniques[hi];
+        const d = hamming(a.vector, b.vector, maxDiff);
+        if (d <= maxDiff) pairs.push([a.ids[0], b.ids[0], d]);
+      }
+    }
+  }
+  return pairs;
+}
+
+// data: { respondents, likert } -> one row per respondent with Likert answers:
+// { id, stakeholderType, repeatFlag, n, sd, longestRun, patternPeriod, flags, duplicateOf, duplicateDistance }
+export function assessQuality(data, { maxDiff = MAX_DIFF } = {}) {
+  const types = new Map(data.respondents.map((r) => [r.id, r.stakeholder_type]));
+  const answers = new Map();
+  const codes = {};
+  for (const row of data.likert) {
+    const stType = types.get(row.respondent_id);
+    if (!stType) continue;
+    if (!answers.has(row.respondent_id)) answers.set(row.respondent_id, {});
+    answers.get(row.respondent_id)[row.item_code] = row.value == null ? null : Number(row.value);
+    (codes[stType] ||= new Set()).add(row.item_code);
+  }
+  const order = Object.fromEntries(Object.entries(codes).map(([t, c]) => [t, [...c].sort(itemOrder)]));
+
+  const results = new Map();
+  const vectors = {};
+  for (const r of data.respondents) {
+    const responses = answers.get(r.id);
+    if (!responses) continue;
+    const vector = order[r.stakeholder_type].map((code) => responses[code] ?? null);
+    (vectors[r.stakeholder_type] ||= []).push({ id: r.id, vector });
+    results.set(r.id, {
+      id: r.id,
+      stakeholderType: r.stakeholder_type,
+      repeatFlag: r.repeat_flag === true || String(r.repeat_flag).toLowerCase() === 'true',
+      ...screenVector(vector),
+      duplicateOf: null,
+      duplicateDistance: null,
+    });
+  }
+
+  // Each member of a duplicate pair points at its closest counterpart
+  for (const group of Object.values(vectors)) {
+    for (const [a, b, d] of nearDuplicates(group, maxDiff)) {
+      for (const [id, other] of [[a, b], [b, a]]) {
+        const row = results.get(id);
+        if (row.duplicateDistance === null || d < row.duplicateDistance) {
+          row.duplicateOf = other;
+          row.duplicateDistance = d;
+        }
+      }
+    }
+  }
+  for (const row of results.values()) {
+    if (row.duplicateOf !== null) row.flags.push(row.duplicateDistance === 0 ? 'exact_duplicate' : 'near_duplicate');
+  }
+  return [...results.values()];
+}
+
+// { screened, flagged, repeatFlag, [flag]: count }
+export function summarizeQuality(rows) {
+  const counts = { screened: rows.length, flagged: 0, repeatFlag: 0 };
+  for (const flag of Object.keys(QUALITY_FLAGS)) counts[flag] = 0;
+  for (const row of rows) {
+    if (row.repeatFlag) counts.repeatFlag += 1;
+    if (row.flags.length) counts.flagged += 1;
+    for (const flag of row.flags) counts[flag] += 1;
+  }
+  return counts;
+}
@@ -0,0 +1,60 @@
+// CSV exports for the admin dashboard.
+// Pure string builders (benchmarked in bench/stats-bench.js) plus a
+// browser download helper. Rows are grouped by respondent once up front,
+// so both exports are linear in the number of Likert rows.
+
+// Long format: one row per Likert response
+export function buildLongCsv({ respondents, likert }) {
+  const typeById = new Map();
+  for (const r of respondents) typeById.set(r.id, r.stakeholder_type);
+
+  const lines = ['respondent_id,stakeholder_type,section,item_code,value'];
+  for (const row of likert) {
+    lines.push([
+      row.respondent_id,
+      typeById.get(row.respondent_id) || '',
+      row.section,
+      row.item_code,
+      row.value,
+    ].join(','));
+  }
+  return lines.join('\n');
+}
+
+// Wide format: one row per respondent, one column per item code
+export function buildWideCsv({ respondents, likert }) {
+  const codes = new Set();
+  const valuesById = new Map();
+  for (const l of likert) {
+    codes.add(l.item_code);
+    let values = valuesById.get(l.respondent_id);
+    if (!values) {
+      values = {};
+      valuesById.set(l.respondent_id, values);
+    }
+    values[l.item_code] = l.value;
+  }
+  const allItemCodes = [...codes].sort();
+
+  const lines = [['respondent_id', 'stakeholder_type', 'created_at', ...allItemCodes].join(',')];
+  for (const resp of respondents) {
+    const values = valuesById.get(resp.id) || {};
+    lines.push([
+      resp.id,
+      resp.stakeholder_type,
+      resp.created_at || '',
+      ...allItemCodes.map((code) => values[code] ?? ''),
+    ].join(','));
+  }
+  return lines.join('\n');
+}
+
+export function downloadCsv(csv, filename) {
+  const blob = new Blob([csv], { type: 'text/csv' });
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename;
+  a.click();
+  URL.revokeObjectURL(url);
+}
@@ -0,0 +1,212 @@
+// ============================================================
+// IndexedDB-backed offline submission queue
+// Submissions that cannot reach the server are appended here and
+// drained in batches once connectivity returns. Entries are keyed
+// by respondent id, so re-queuing the same submission is a no-op.
+// Entries the server rejects move to their own store, so draining only
+// ever reads submissions that can still be sent.
+// ============================================================
+
+const DB_NAME = 'ai_eng_tam';
+const DB_VERSION = 2;
+export const PENDING_STORE = 'pending_submissions';
+export const REJECTED_STORE = 'rejected_submissions';
+export const LOCAL_STORE = 'local_responses';
+
+const BATCH_SIZE = 20;
+const MIN_RETRY_MS = 15 * 1000;
+const MAX_RETRY_MS = 5 * 60 * 1000;
+
+let dbPromise = null;
+
+export const isIndexedDbAvailable = () => typeof indexedDB !== 'undefined';
+
+function openDb() {
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve, reject) => {
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = (event) => {
+        const db = request.result;
+        for (const name of [PENDING_STORE, LOCAL_STORE, REJECTED_STORE]) {
+          if (!db.objectStoreNames.contains(name)) {
+            db.createObjectStore(name, { keyPath: 'id' });
+          }
+        }
+        // Version 1 kept rejected entries in the pending store with rejected: true
+        if (event.oldVersion === 1) {
+          const tx = request.transaction;
+          const rejected = tx.objectStore(REJECTED_STORE);
+          tx.objectStore(PENDING_STORE).openCursor().onsuccess = (e) => {
+            const cursor = e.target.result;
+            if (!cursor) return;
+            if (cursor.value.rejected) {
+              rejected.put(cursor.value);
+              cursor.delete();
+            }
+            cursor.continue();
+          };
+        }
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => {
+        dbPromise = null;
+        reject(request.error);
+      };
+    });
+  }
+  return dbPromise;
+}
+
+// Run fn(store) inside a transaction; resolves with fn's request result
+// once the transaction has committed.
+async function withStore(storeName, mode, fn) {
+  const db = await openDb();
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(storeName, mode);
+    const request = fn(tx.objectStore(storeName));
+    tx.oncomplete = () => resolve(request?.result);
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// Append a record to a store (one put — no rewrite of earlier entries)
+export function appendRecord(storeName, record) {
+  return withStore(storeName, 'readwrite', (store) => store.put(record));
+}
+
+export function getAllRecords(storeName, count) {
+  return withStore(storeName, 'readonly', (store) => store.getAll(null, count));
+}
+
+// Up to count records with keys after afterKey (all from the start if null)
+function getRecordsAfter(storeName, afterKey, count) {
+  const range = afterKey == null ? null : IDBKeyRange.lowerBound(afterKey, true);
+  return withStore(storeName, 'readonly', (store) => store.getAll(range, count));
+}
+
+// Queue a submission and arm the retry timer, so it is sent even if the
+// browser never goes offline/online or changes tab visibility.
+export async function enqueueSubmission(payload) {
+  await appendRecord(PENDING_STORE, {
+    id: payload.respondent.id,
+    payload,
+    queuedAt: new Date().toISOString(),
+    attempts: 0,
+  });
+  scheduleDrain();
+}
+
+// Apply per-submission results from the server in a single transaction:
+// accepted entries are removed, rejected ones move to REJECTED_STORE for
+// inspection, everything else has its attempt counter bumped.
+async function applyResults(entries, results) {
+  const byId = new Map(results.map((r) => [r.id, r]));
+  const db = await openDb();
+  await new Promise((resolve, reject) => {
+    const tx = db.transaction([PENDING_STORE, REJECTED_STORE], 'readwrite');
+    const store = tx.objectStore(PENDING_STORE);
+    for (const entry of entries) {
+      const result = byId.get(entry.id);
+      if (result?.ok) {
+        store.delete(entry.id);
+      } else if (result && !result.retryable) {
+        store.delete(entry.id);
+        tx.objectStore(REJECTED_STORE).put({ ...entry, rejected: true, lastError: result.error });
+      } else {
+        store.put({ ...entry, attempts: entry.attempts + 1, lastError: result?.error });
+      }
+    }
+    tx.oncomplete = resolve;
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+let draining = null;
+
+// Send pending submissions in batches, walking the queue once in key
+// order, until it is exhausted or a batch fails outright. sendBatch(payloads)
+// must resolve with [{ id, ok, retryable, error }] or throw on network failure.
+// Returns the number of entries still waiting to be retried.
+export function drainQueue(sendBatch) {
+  if (draining) return draining;
+  draining = (async () => {
+    try {
+      let after = null;
+      let waiting = 0;
+      for (;;) {
+        const entries = await getRecordsAfter(PENDING_STORE, after, BATCH_SIZE);
+        if (entries.length === 0) return waiting;
+        after = entries[entries.length - 1].id;
+        let results;
+        try {
+          results = await sendBatch(entries.map((e) => e.payload));
+        } catch {
+          await applyResults(entries, []);
+          return waiting + entries.length;
+        }
+        await applyResults(entries, results);
+        const settled = new Set(results.filter((r) => r.ok || !r.retryable).map((r) => r.id));
+        // Stop if nothing in this batch was settled (accepted or rejected)
+        if (settled.size === 0) return waiting + entries.length;
+        waiting += entries.filter((e) => !settled.has(e.id)).length;
+      }
+    } finally {
+      draining = null;
+    }
+  })();
+  return draining;
+}
+
+let syncRun = null;
+let syncTimer = null;
+let syncDelay = MIN_RETRY_MS;
+
+// Arm the backoff timer for another drain (no-op before startBackgroundSync
+// or while a retry is already scheduled)
+export function scheduleDrain() {
+  if (!syncRun || syncTimer) return;
+  syncTimer = setTimeout(syncRun, syncDelay * (0.5 + Math.random()));
+  syncDelay = Math.min(syncDelay * 2, MAX_RETRY_MS);
+}
+
+// Drain whenever the browser comes back online or the tab becomes visible,
+// and keep retrying with exponential backoff while work remains.
+export function startBackgroundSync(sendBatch) {
+  if (!isIndexedDbAvailable() || typeof window === 'undefined') return () => {};
+
+  const run = async () => {
+    clearTimeout(syncTimer);
+    syncTimer = null;
+    if (navigator.onLine === false) return;
+    let remaining = 0;
+    try {
+      remaining = await drainQueue(sendBatch);
+    } catch (err) {
+      console.error('Offline queue drain failed:', err);
+      remaining = 1;
+    }
+    if (remaining > 0) {
+      scheduleDrain();
+    } else {
+      syncDelay = MIN_RETRY_MS;
+    }
+  };
+  syncRun = run;
+
+  const onVisible = () => {
+    if (document.visibilityState === 'visible') run();
+  };
+
+  window.addEventListener('online', run);
+  document.addEventListener('visibilitychange', onVisible);
+  run();
+
+  return () => {
+    clearTimeout(syncTimer);
+    syncTimer = null;
+    syncRun = null;
+    window.removeEventListener('online', run);
+    document.removeEventListener('visibilitychange', onVisible);
+  };
+}
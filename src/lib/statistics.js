@@ -68,6 +68,40 @@ export function oneWayAnova(groups) {
   return { F, p, dfBetween, dfWithin };
 }
 
+// One-way ANOVA from per-group moments instead of raw values
+// groups: { groupName: { n, sum, sumsq } } -- e.g. cells of the cube in cube.js
+// Returns { F, p, dfBetween, dfWithin, etaSquared } (same conventions as oneWayAnova)
+export function anovaFromMoments(groups) {
+  const moments = Object.values(groups).filter((g) => g.n > 0);
+  const k = moments.length;
+  if (k < 2) {
+    return { F: null, p: null, dfBetween: 0, dfWithin: 0, etaSquared: null };
+  }
+
+  const N = moments.reduce((s, g) => s + g.n, 0);
+  const dfBetween = k - 1;
+  const dfWithin = N - k;
+  if (dfWithin <= 0) {
+    return { F: null, p: null, dfBetween, dfWithin, etaSquared: null };
+  }
+
+  const grandMean = moments.reduce((s, g) => s + g.sum, 0) / N;
+  let ssBetween = 0;
+  let ssWithin = 0;
+  for (const g of moments) {
+    ssBetween += g.n * Math.pow(g.sum / g.n - grandMean, 2);
+    ssWithin += Math.max(0, g.sumsq - (g.sum * g.sum) / g.n);
+  }
+
+  const msBetween = ssBetween / dfBetween;
+  const msWithin = ssWithin / dfWithin;
+  const F = msWithin > 0 ? msBetween / msWithin : 0;
+  const p = 1 - jStat.centralF.cdf(F, dfBetween, dfWithin);
+  const ssTotal = ssBetween + ssWithin;
+
+  return { F, p, dfBetween, dfWithin, etaSquared: ssTotal > 0 ? ssBetween / ssTotal : 0 };
+}
+
 // Compute frequency distribution for Likert values (1-7)
 export function frequencyDistribution(values) {
   const dist = { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 7: 0 };
@@ -1,22 +1,23 @@
-import { createClient } from '@supabase/supabase-js';
+import {
+  LOCAL_STORE, isIndexedDbAvailable, appendRecord, getAllRecords,
+  enqueueSubmission, startBackgroundSync,
+} from './offlineQueue';
 
+// All reads and writes go through the /api routes, which hold the service
+// key; the browser only needs to know whether a backend is deployed.
 const supabaseUrl = import.meta.env.VITE_SUPABASE_URL || '';
-const supabaseAnonKey = import.meta.env.VITE_SUPABASE_ANON_KEY || '';
-
-// Client for survey respondents (anon key, can only insert)
-export const supabase = supabaseUrl && supabaseAnonKey
-  ? createClient(supabaseUrl, supabaseAnonKey)
-  : null;
 
 // Check if Supabase is configured
-export const isSupabaseConfigured = () => Boolean(supabaseUrl && supabaseAnonKey);
+export const isSupabaseConfigured = () => Boolean(supabaseUrl);
 
 // ============================================================
-// Local storage fallback for development/demo without Supabase
+// Local fallback for development/demo without Supabase
+// Entries are appended to IndexedDB; the legacy localStorage array
+// is still read so earlier demo data stays visible.
 // ============================================================
 const LOCAL_KEY = 'ai_eng_tam_responses';
 
-function getLocalResponses() {
+function getLegacyLocalResponses() {
   try {
     return JSON.parse(localStorage.getItem(LOCAL_KEY) || '[]');
   } catch {
@@ -24,54 +25,105 @@ function getLocalResponses() {
   }
 }
 
-function saveLocalResponses(responses) {
-  localStorage.setItem(LOCAL_KEY, JSON.stringify(responses));
+async function getLocalResponses() {
+  const legacy = getLegacyLocalResponses();
+  if (!isIndexedDbAvailable()) return legacy;
+  return legacy.concat(await getAllRecords(LOCAL_STORE));
+}
+
+async function appendLocalResponse(entry) {
+  if (isIndexedDbAvailable()) {
+    await appendRecord(LOCAL_STORE, entry);
+    return;
+  }
+  const all = getLegacyLocalResponses();
+  all.push(entry);
+  localStorage.setItem(LOCAL_KEY, JSON.stringify(all));
 }
 
 // ============================================================
 // Data Access Functions
 // ============================================================
 
-export async function submitSurvey({ respondent, sectionA, likertResponses }) {
-  if (supabase && isSupabaseConfigured()) {
-    // Generate UUID client-side so we don't need SELECT permission after insert
-    const respondentId = crypto.randomUUID();
+const SUBMIT_ATTEMPTS = 3;
 
-    // Insert respondent with the pre-generated ID
-    const { error: respError } = await supabase
-      .from('respondents')
-      .insert({ id: respondentId, ...respondent });
+// POST the whole survey to the server-side submit endpoint. The server writes
+// all three tables in one transaction and is idempotent on the respondent id,
+// so network errors and 5xx responses can simply be retried.
+async function postSubmission(payload) {
+  let lastError;
+  for (let attempt = 0; attempt < SUBMIT_ATTEMPTS; attempt++) {
+    if (attempt > 0) {
+      await new Promise((resolve) => setTimeout(resolve, 500 * 2 ** (attempt - 1)));
+    }
+    let res;
+    try {
+      res = await fetch('/api/submit', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload),
+      });
+    } catch (err) {
+      lastError = err; // network failure — retry
+      lastError.retryable = true;
+      continue;
+    }
+    if (res.ok) return res.json();
+    const body = await res.json().catch(() => ({}));
+    lastError = new Error(body.error || `HTTP ${res.status}`);
+    lastError.retryable = res.status >= 500;
+    if (!lastError.retryable) break; // bad payload — retrying won't help
+  }
+  throw lastError;
+}
 
-    if (respError) throw respError;
+// Send a batch of queued submissions; used by the offline queue drain.
+// Throws on network failure so the whole batch is retried later.
+async function sendQueuedBatch(payloads) {
+  const res = await fetch('/api/submit', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ submissions: payloads }),
+  });
+  // 5xx (including the 502 for auth, missing-function and upstream errors):
+  // keep every entry and retry the whole batch later
+  if (res.status >= 500) throw new Error(`HTTP ${res.status}`);
+  if (!res.ok) {
+    const body = await res.json().catch(() => ({}));
+    // Whole batch rejected as invalid by the endpoint — settle every entry
+    return payloads.map((p) => ({ id: p.respondent.id, ok: false, retryable: false, error: body.error }));
+  }
+  // The server marks each failed entry retryable or not (bad payload)
+  const { results } = await res.json();
+  return results.map((r) => ({ ...r, retryable: Boolean(r.retryable) }));
+}
 
-    // Insert Section A responses
-    if (sectionA.length > 0) {
-      const sectionARows = sectionA.map((a) => ({
-        respondent_id: respondentId,
-        ...a,
-      }));
-      const { error: aError } = await supabase
-        .from('section_a_responses')
-        .insert(sectionARows);
-      if (aError) throw aError;
-    }
+// Start draining the offline queue in the background (call once at startup)
+export function startOfflineSync() {
+  if (!isSupabaseConfigured()) return () => {};
+  return startBackgroundSync(sendQueuedBatch);
+}
 
-    // Insert Likert responses
-    if (likertResponses.length > 0) {
-      const likertRows = likertResponses.map((l) => ({
-        respondent_id: respondentId,
-        ...l,
-      }));
-      const { error: lError } = await supabase
-        .from('likert_responses')
-        .insert(likertRows);
-      if (lError) throw lError;
+export async function submitSurvey({ respondent, sectionA, likertResponses }) {
+  if (isSupabaseConfigured()) {
+    // Generate UUID client-side so retries of the same submission are deduplicated
+    const respondentId = crypto.randomUUID();
+    const payload = {
+      respondent: { id: respondentId, ...respondent },
+      sectionA,
+      likert: likertResponses,
+    };
+    try {
+      await postSubmission(payload);
+    } catch (err) {
+      // Offline or server unreachable: keep the submission and send it later
+      if (!err.retryable || !isIndexedDbAvailable()) throw err;
+      await enqueueSubmission(payload);
     }
-
     return respondentId;
   }
 
-  // Local storage fallback
+  // Local fallback
   const respondentId = crypto.randomUUID();
   const entry = {
     id: respondentId,
@@ -79,9 +131,7 @@ export async function submitSurvey({ respondent, sectionA, likertResponses }) {
     sectionA: sectionA.map((a) => ({ ...a, respondent_id: respondentId })),
     likertResponses: likertResponses.map((l) => ({ ...l, respondent_id: respondentId })),
   };
-  const all = getLocalResponses();
-  all.push(entry);
-  saveLocalResponses(all);
+  await appendLocalResponse(entry);
   return respondentId;
 }
 
@@ -101,7 +151,7 @@ export async function fetchAllData(adminPassword) {
   }
 
   // Local fallback for development/demo without Supabase
-  const all = getLocalResponses();
+  const all = await getLocalResponses();
   return {
     respondents: all.map((e) => e.respondent),
     sectionA: all.flatMap((e) => e.sectionA),
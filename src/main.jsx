@@ -2,6 +2,10 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.jsx'
+import { startOfflineSync } from './lib/supabase'
+
+// Send any survey submissions that were queued while offline
+startOfflineSync()
 
 createRoot(document.getElementById('root')).render(
   <StrictMode>
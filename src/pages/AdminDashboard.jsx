@@ -9,6 +9,12 @@ import {
   descriptiveStats, oneWayAnova, frequencyDistribution,
   aggregateByConstruct, heatmapColor,
 } from '../lib/statistics';
+import { buildLongCsv, buildWideCsv, downloadCsv } from '../lib/exportCsv';
+import {
+  CUBE_DIMENSIONS, buildCube, queryCube, cellMoments, momentStats, compareGroups,
+  dimensionLabel, sortDimensionValues,
+} from '../lib/cube';
+import { assessQuality, summarizeQuality, QUALITY_FLAGS } from '../lib/dataQuality';
 
 const ADMIN_PASSWORD = 'admin2025';
 
@@ -20,6 +26,7 @@ export default function AdminDashboard() {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [filter, setFilter] = useState('all'); // 'all', 'faculty', 'student', 'practitioner'
+  const [breakdownDim, setBreakdownDim] = useState('prior_ai_experience');
 
   const handleLogin = () => {
     if (password === ADMIN_PASSWORD) {
@@ -119,60 +126,45 @@ export default function AdminDashboard() {
     return results;
   }, [constructAgg]);
 
+  // Demographic cube: built once per data load, every breakdown is answered from it
+  const cube = useMemo(() => {
+    if (!data || data.respondents.length === 0) return null;
+    return buildCube(data, getLikertSections);
+  }, [data]);
+
+  // Construct means by the selected demographic (within the stakeholder filter)
+  const breakdown = useMemo(() => {
+    if (!cube) return null;
+    const where = filter === 'all' ? {} : { stakeholder_type: filter };
+    const groups = queryCube(cube, { by: [breakdownDim], where })
+      .filter(({ key }) => key[breakdownDim] !== '');
+    const order = sortDimensionValues(breakdownDim, groups.map(({ key }) => key[breakdownDim]));
+    groups.sort((a, b) => order.indexOf(a.key[breakdownDim]) - order.indexOf(b.key[breakdownDim]));
+    const rows = Object.entries(CONSTRUCT_NAMES).map(([id, name]) => ({
+      id,
+      name,
+      stats: groups.map(({ cell }) => momentStats(cellMoments(cube, cell, { construct: id }))),
+      anova: compareGroups(cube, breakdownDim, { where, construct: id }),
+    }));
+    return { groups, rows };
+  }, [cube, breakdownDim, filter]);
+
+  // Straight-lining, patterns and duplicate submissions (within the stakeholder filter)
+  const qualityRows = useMemo(() => (data ? assessQuality(data) : []), [data]);
+  const quality = useMemo(() => {
+    const rows = filter === 'all' ? qualityRows : qualityRows.filter((r) => r.stakeholderType === filter);
+    return { counts: summarizeQuality(rows), flagged: rows.filter((r) => r.flags.length > 0) };
+  }, [qualityRows, filter]);
+
   // CSV Export
   const exportCSV = () => {
     if (!data) return;
-    const rows = [['respondent_id', 'stakeholder_type', 'section', 'item_code', 'value']];
-    for (const row of data.likert) {
-      const resp = data.respondents.find((r) => r.id === row.respondent_id);
-      rows.push([
-        row.respondent_id,
-        resp?.stakeholder_type || '',
-        row.section,
-        row.item_code,
-        row.value,
-      ]);
-    }
-    const csv = rows.map((r) => r.join(',')).join('\n');
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `ai-eng-tam-data-${new Date().toISOString().slice(0, 10)}.csv`;
-    a.click();
-    URL.revokeObjectURL(url);
+    downloadCsv(buildLongCsv(data), `ai-eng-tam-data-${new Date().toISOString().slice(0, 10)}.csv`);
   };
 
   const exportFullCSV = () => {
     if (!data) return;
-
-    // Build a wide-format CSV with one row per respondent
-    const allItemCodes = [...new Set(data.likert.map((l) => l.item_code))].sort();
-    const header = ['respondent_id', 'stakeholder_type', 'created_at', ...allItemCodes];
-    const rows = [header];
-
-    for (const resp of data.respondents) {
-      const respLikert = data.likert.filter((l) => l.respondent_id === resp.id);
-      const valueMap = {};
-      for (const l of respLikert) {
-        valueMap[l.item_code] = l.value;
-      }
-      rows.push([
-        resp.id,
-        resp.stakeholder_type,
-        resp.created_at || '',
-        ...allItemCodes.map((code) => valueMap[code] ?? ''),
-      ]);
-    }
-
-    const csv = rows.map((r) => r.join(',')).join('\n');
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `ai-eng-tam-wide-${new Date().toISOString().slice(0, 10)}.csv`;
-    a.click();
-    URL.revokeObjectURL(url);
+    downloadCsv(buildWideCsv(data), `ai-eng-tam-wide-${new Date().toISOString().slice(0, 10)}.csv`);
   };
 
   // ===== RENDER =====
@@ -367,6 +359,130 @@ export default function AdminDashboard() {
         </div>
       </div>
 
+      {/* Demographic Breakdown (cube) */}
+      <div className="dashboard-panel">
+        <h3>
+          Construct Means by{' '}
+          <select value={breakdownDim} onChange={(e) => setBreakdownDim(e.target.value)}>
+            {CUBE_DIMENSIONS.map((dim) => (
+              <option key={dim} value={dim}>{dimensionLabel(dim)}</option>
+            ))}
+          </select>
+          {filter !== 'all' ? ` (${filter})` : ''}
+        </h3>
+        {breakdown && breakdown.groups.length > 0 ? (
+          <div className="heatmap-container">
+            <table className="heatmap-table">
+              <thead>
+                <tr>
+                  <th>Construct</th>
+                  {breakdown.groups.map(({ key, cell }) => (
+                    <th key={key[breakdownDim]}>
+                      {key[breakdownDim]}
+                      <br />
+                      <span style={{ fontWeight: 400, fontSize: '0.75rem' }}>n={cell.n}</span>
+                    </th>
+                  ))}
+                  <th>ANOVA F</th>
+                  <th>p-value</th>
+                  <th>&eta;&sup2;</th>
+                </tr>
+              </thead>
+              <tbody>
+                {breakdown.rows.map(({ id, name, stats, anova }) => (
+                  <tr key={id}>
+                    <td className="construct-label">{name}</td>
+                    {stats.map((st, i) => (
+                      <td key={i} style={{ backgroundColor: heatmapColor(st.mean), color: '#1f2937' }}>
+                        {st.mean !== null ? st.mean.toFixed(2) : '--'}
+                      </td>
+                    ))}
+                    <td>{anova.F != null ? anova.F.toFixed(3) : '--'}</td>
+                    <td style={{ fontWeight: anova.p != null && anova.p < 0.05 ? 700 : 400 }}>
+                      {anova.p != null ? anova.p.toFixed(4) : '--'}
+                      {anova.p != null && anova.p < 0.05 && ' *'}
+                    </td>
+                    <td>{anova.etaSquared != null ? anova.etaSquared.toFixed(3) : '--'}</td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+            <p style={{ fontSize: '0.75rem', color: 'var(--gray-500)', marginTop: '0.5rem' }}>
+              Respondents who did not answer this question are excluded. One-way ANOVA across the
+              groups shown, computed from precomputed group aggregates.
+            </p>
+          </div>
+        ) : (
+          <p style={{ color: 'var(--gray-500)' }}>No responses for this question in the current view.</p>
+        )}
+      </div>
+
+      {/* Data Quality */}
+      <div className="dashboard-panel">
+        <h3>Response Quality {filter !== 'all' ? `(${filter})` : ''}</h3>
+        <table className="stats-table">
+          <thead>
+            <tr>
+              <th>Screened</th>
+              {Object.values(QUALITY_FLAGS).map((label) => <th key={label}>{label}</th>)}
+              <th>Repeat flag (browser)</th>
+            </tr>
+          </thead>
+          <tbody>
+            <tr>
+              <td className="numeric">{quality.counts.screened}</td>
+              {Object.keys(QUALITY_FLAGS).map((flag) => (
+                <td key={flag} className="numeric">{quality.counts[flag]}</td>
+              ))}
+              <td className="numeric">{quality.counts.repeatFlag}</td>
+            </tr>
+          </tbody>
+        </table>
+        {quality.flagged.length > 0 && (
+          <table className="stats-table" style={{ marginTop: '1rem' }}>
+            <thead>
+              <tr>
+                <th>Respondent</th>
+                <th>Type</th>
+                <th>Items</th>
+                <th>SD</th>
+                <th>Longest run</th>
+                <th>Flags</th>
+                <th>Duplicate of</th>
+              </tr>
+            </thead>
+            <tbody>
+              {quality.flagged.slice(0, 50).map((r) => (
+                <tr key={r.id}>
+                  <td><code>{r.id.slice(0, 8)}</code></td>
+                  <td>{r.stakeholderType}</td>
+                  <td className="numeric">{r.n}</td>
+                  <td className="numeric">{r.sd != null ? r.sd.toFixed(2) : '--'}</td>
+                  <td className="numeric">{r.longestRun}</td>
+                  <td>
+                    {r.flags
+                      .map((f) => (f === 'pattern' ? `${QUALITY_FLAGS[f]} (period ${r.patternPeriod})` : QUALITY_FLAGS[f]))
+                      .join(', ')}
+                  </td>
+                  <td>
+                    {r.duplicateOf ? (
+                      <>
+                        <code>{r.duplicateOf.slice(0, 8)}</code> ({r.duplicateDistance} items differ)
+                      </>
+                    ) : '--'}
+                  </td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        )}
+        <p style={{ fontSize: '0.75rem', color: 'var(--gray-500)', marginTop: '0.5rem' }}>
+          Likert answers in survey order. Long string: one answer for at least half the items in a
+          row. Near duplicate: at most 2 items differ from another respondent of the same type.
+          {quality.flagged.length > 50 && ` Showing 50 of ${quality.flagged.length} flagged respondents.`}
+        </p>
+      </div>
+
       {/* Item-Level Descriptive Statistics */}
       <div className="dashboard-panel">
         <h3>Item-Level Descriptive Statistics {filter !== 'all' ? `(${filter})` : '(filtered view)'}</h3>
@@ -72,6 +72,143 @@ CREATE INDEX idx_likert_respondent ON likert_responses(respondent_id);
 CREATE INDEX idx_likert_item_code ON likert_responses(item_code);
 CREATE INDEX idx_respondents_type ON respondents(stakeholder_type);
 
+-- ============================================================
+-- Function: submit_survey (atomic, idempotent submission)
+-- Called by the /api/submit serverless function with the service
+-- role key. Writes the respondent, Section D rows and Likert rows
+-- in a single transaction. Re-submitting the same client-generated
+-- respondent id is a no-op, so retries are always safe.
+-- ============================================================
+CREATE OR REPLACE FUNCTION submit_survey(payload JSONB)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  resp_id UUID := (payload->'respondent'->>'id')::UUID;
+BEGIN
+  IF resp_id IS NULL THEN
+    RAISE EXCEPTION 'respondent.id is required';
+  END IF;
+
+  -- Column defaults do not apply to jsonb_populate_record, so supply them.
+  -- created_at and repeat_flag are always set here; the payload comes
+  -- from the public survey form and cannot choose them.
+  INSERT INTO respondents
+  SELECT * FROM jsonb_populate_record(
+    NULL::respondents,
+    ((payload->'respondent') - 'created_at' - 'repeat_flag')
+      || jsonb_build_object('repeat_flag', false, 'created_at', now())
+  )
+  ON CONFLICT (id) DO NOTHING;
+
+  IF NOT FOUND THEN
+    RETURN resp_id;  -- already submitted; retry is a no-op
+  END IF;
+
+  INSERT INTO section_a_responses (respondent_id, category, uses_category, selected_tools, other_tool)
+  SELECT resp_id, r.category, COALESCE(r.uses_category, false), COALESCE(r.selected_tools, '[]'), r.other_tool
+  FROM jsonb_to_recordset(COALESCE(payload->'sectionA', '[]')) AS r(
+    category TEXT, uses_category BOOLEAN, selected_tools JSONB, other_tool TEXT
+  );
+
+  INSERT INTO likert_responses (respondent_id, section, item_code, value)
+  SELECT resp_id, r.section, r.item_code, r.value
+  FROM jsonb_to_recordset(COALESCE(payload->'likert', '[]')) AS r(
+    section TEXT, item_code TEXT, value INTEGER
+  );
+
+  RETURN resp_id;
+END;
+$$;
+
+-- Only the server-side endpoint (service role) may call it
+REVOKE ALL ON FUNCTION submit_survey(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_survey(JSONB) TO service_role;
+
+-- Batch variant used when the browser drains its offline queue. Each
+-- submission runs in its own subtransaction, so one bad payload does not
+-- roll back the rest of the batch. Returns [{ id, ok, error, code }], code
+-- being the SQLSTATE of a failed entry.
+CREATE OR REPLACE FUNCTION submit_surveys(payloads JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  item JSONB;
+  results JSONB := '[]';
+BEGIN
+  FOR item IN SELECT * FROM jsonb_array_elements(payloads) LOOP
+    BEGIN
+      PERFORM submit_survey(item);
+      results := results || jsonb_build_object('id', item->'respondent'->>'id', 'ok', true);
+    EXCEPTION WHEN OTHERS THEN
+      results := results || jsonb_build_object(
+        'id', item->'respondent'->>'id', 'ok', false, 'error', SQLERRM, 'code', SQLSTATE);
+    END;
+  END LOOP;
+  RETURN results;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION submit_surveys(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_surveys(JSONB) TO service_role;
+
+-- ============================================================
+-- Migration bookkeeping (used by run-migrations.py)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  version TEXT PRIMARY KEY,           -- e.g. '0002'
+  name TEXT NOT NULL,
+  checksum TEXT NOT NULL,             -- sha256 of the migration file
+  applied_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Execute one SQL string; returns the affected row count so chunked
+-- backfills know when they are finished. Each call is its own transaction.
+-- Runs as its owner (postgres): service_role does not own the tables and
+-- functions that migrations ALTER or replace.
+CREATE OR REPLACE FUNCTION exec_sql(query TEXT)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+  affected INTEGER;
+BEGIN
+  EXECUTE query;
+  GET DIAGNOSTICS affected = ROW_COUNT;
+  RETURN affected;
+END;
+$$;
+
+-- Everything the migration runner needs in one round trip: applied
+-- versions with their checksums, and the live columns of every table.
+CREATE OR REPLACE FUNCTION migration_status()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT jsonb_build_object(
+    'applied', COALESCE((SELECT jsonb_object_agg(version, checksum) FROM schema_migrations), '{}'),
+    'columns', COALESCE((
+      SELECT jsonb_object_agg(table_name, cols) FROM (
+        SELECT table_name, jsonb_agg(column_name::TEXT ORDER BY ordinal_position) AS cols
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        GROUP BY table_name
+      ) t
+    ), '{}')
+  );
+$$;
+
+ALTER FUNCTION exec_sql(TEXT) OWNER TO postgres;
+REVOKE ALL ON FUNCTION exec_sql(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION migration_status() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION exec_sql(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION migration_status() TO service_role;
+ALTER TABLE schema_migrations ENABLE ROW LEVEL SECURITY;
+
 -- ============================================================
 -- Row-Level Security (RLS)
 -- ============================================================
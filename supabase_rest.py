@@ -0,0 +1,404 @@
+"""
+AI-Eng-TAM Survey -- Shared Supabase REST client (stdlib only)
+==============================================================
+One client for all the Python tooling, replacing the per-script urllib
+helpers that opened a new TCP+TLS connection for every request.
+
+- Persistent keep-alive connections, pooled and safe to share across threads
+- gzip response bodies (Accept-Encoding). Request bodies are sent
+  uncompressed: PostgREST does not decode Content-Encoding: gzip
+- Per-request timeouts
+- Retries with full-jitter exponential backoff for idempotent calls
+  (GET/HEAD/PUT/DELETE, or any call passed idempotent=True), honoring
+  Retry-After on 429/503
+- paginate(): streams rows page by page, keyset-paged on the primary key,
+  decoding each JSON array incrementally as it arrives
+- Optional tracing: one JSONL span per call (latency, bytes in/out, rows,
+  retries) when SUPABASE_TRACE=spans.jsonl is set or enable_tracing() is
+  called; summarize with trace-report.py
+
+    client = SupabaseClient(SUPABASE_URL, SERVICE_KEY)
+    for row in client.paginate('likert_responses'):
+        ...
+    client.insert('respondents', rows, upsert=True, on_conflict='id')
+"""
+
+import http.client, json, os, queue, random, re, sys, threading, time, zlib
+from urllib.parse import urlencode, urlsplit
+
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'}
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+READ_CHUNK = 64 * 1024
+
+
+# ================================================================
+# TRACING
+# ================================================================
+
+class Tracer:
+    """Appends one JSON line per REST call to a file. Thread-safe."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.script = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else None
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def record(self, span):
+        span['script'] = self.script
+        span['pid'] = os.getpid()
+        line = json.dumps(span, separators=(',', ':')) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+_tracer = Tracer(os.environ['SUPABASE_TRACE']) if os.environ.get('SUPABASE_TRACE') else None
+
+
+def enable_tracing(path):
+    """Trace every client in this process to `path` (JSONL, appended)."""
+    global _tracer
+    if _tracer is None or _tracer.path != path:
+        _tracer = Tracer(path)
+    return _tracer
+
+
+def _resource(path):
+    """'/rest/v1/likert_responses?...' -> 'likert_responses';
+    '/rest/v1/rpc/exec_sql' -> 'rpc/exec_sql'."""
+    m = re.match(r'/rest/v1/([^?]+)', path)
+    return m.group(1) if m else path.split('?', 1)[0]
+
+
+def _content_range_rows(headers):
+    """Row count from PostgREST's Content-Range ('0-999/*' -> 1000)."""
+    m = re.match(r'(\d+)-(\d+)', (headers or {}).get('Content-Range') or '')
+    return int(m.group(2)) - int(m.group(1)) + 1 if m else None
+
+
+class SupabaseError(Exception):
+    """Non-2xx response from PostgREST."""
+
+    def __init__(self, method, path, status, body, retry_after=None):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+        try:
+            detail = json.loads(body).get('message') or body
+        except (ValueError, AttributeError):
+            detail = body
+        super().__init__(f"{method} {path}: HTTP {status} -- {detail}")
+
+    @property
+    def code(self):
+        """PostgREST error code (e.g. 'PGRST202'), if any."""
+        try:
+            return json.loads(self.body).get('code')
+        except (ValueError, AttributeError):
+            return None
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body.decode('utf-8')) if self.body else None
+
+
+class _Body:
+    """Readable view of an HTTP response that transparently un-gzips."""
+
+    def __init__(self, resp):
+        self.resp = resp
+        gz = 'gzip' in (resp.getheader('Content-Encoding') or '').lower()
+        self.inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if gz else None
+        self.wire_bytes = 0
+        self.rows = None  # set by streaming consumers, for the trace span
+
+    def chunks(self):
+        while True:
+            raw = self.resp.read(READ_CHUNK)
+            if not raw:
+                break
+            self.wire_bytes += len(raw)
+            data = self.inflater.decompress(raw) if self.inflater else raw
+            if data:
+                yield data
+        if self.inflater:
+            tail = self.inflater.flush()
+            if tail:
+                yield tail
+
+    def read(self):
+        return b''.join(self.chunks())
+
+
+def iter_json_array(chunks):
+    """Yield the elements of a JSON array as its bytes arrive, without
+    holding the decoded page in memory all at once."""
+    decoder = json.JSONDecoder()
+    decode_tail = b''
+    buf = ''
+    started = False
+    for chunk in chunks:
+        # Guard against a multi-byte UTF-8 character split across chunks
+        chunk = decode_tail + chunk
+        try:
+            text = chunk.decode('utf-8')
+            decode_tail = b''
+        except UnicodeDecodeError as e:
+            text = chunk[:e.start].decode('utf-8')
+            decode_tail = chunk[e.start:]
+        buf += text
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if not started:
+                if pos >= len(buf):
+                    break
+                if buf[pos] != '[':
+                    raise ValueError('expected a JSON array')
+                started = True
+                pos += 1
+                continue
+            if pos >= len(buf) or buf[pos] == ']':
+                break
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                break  # element not complete yet; wait for more bytes
+            yield value
+            pos = end
+        buf = buf[pos:]
+
+
+class SupabaseClient:
+    def __init__(self, url, key, timeout=30, max_retries=4, pool_size=8, tracer=None):
+        parts = urlsplit(url)
+        self.scheme = parts.scheme or 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.key = key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.tracer = tracer  # None -> the process-wide one from enable_tracing()
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    # ── connection pool ──
+
+    def _new_connection(self):
+        cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _release(self, conn):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    # ── core request ──
+
+    def _headers(self, extra):
+        headers = {
+            'apikey': self.key,
+            'Authorization': f'Bearer {self.key}',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+        }
+        headers.update(extra or {})
+        return headers
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+        return random.uniform(0, min(30.0, 0.5 * 2 ** attempt))
+
+    def _send(self, method, path, body, headers, consume, span):
+        """One attempt. Returns consume(status, headers, _Body).
+        Raises OSError / HTTPException on transport failure."""
+        conn, reused = self._acquire()
+        try:
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # Sending failed on a pooled keep-alive connection the server
+                # had already closed: it never received the whole request, so
+                # resending it on another connection is safe for any method.
+                if reused:
+                    e.stale_connection = True
+                raise
+            resp = conn.getresponse()
+            span['status'] = resp.status
+            stream = _Body(resp)
+            try:
+                result = consume(resp.status, resp.headers, stream)
+            finally:
+                span['bytes_in'] += stream.wire_bytes
+                if stream.rows is not None:
+                    span['rows'] = stream.rows
+            span['bytes_in'] += len(resp.read())  # drain so the connection can be reused
+            if span['rows'] is None:
+                span['rows'] = _content_range_rows(resp.headers)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+            conn.close()
+            # Dropped after the request was sent: the server may have
+            # processed it, so request() only resends idempotent calls.
+            e.reused_connection = reused
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return result
+
+    def request(self, method, path, params=None, json_body=None, headers=None,
+                idempotent=None, consume=None):
+        """Send a request to {url}{path}; path is e.g. '/rest/v1/respondents'.
+
+        consume(status, headers, body) may stream the response; by default
+        the whole body is read and a Response is returned. Non-2xx responses
+        raise SupabaseError.
+        """
+        method = method.upper()
+        if params:
+            path = f"{path}?{urlencode(params, safe=',.*()')}"
+        hdrs = self._headers(headers)
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode('utf-8')
+            hdrs.setdefault('Content-Type', 'application/json')
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        def default_consume(status, resp_headers, stream):
+            return Response(status, resp_headers, stream.read())
+
+        tracer = self.tracer or _tracer
+        span = {'method': method, 'resource': _resource(path), 'status': None,
+                'bytes_out': len(body or b''), 'bytes_in': 0,
+                'rows': len(json_body) if isinstance(json_body, list) else None,
+                'retries': 0}
+        t0 = time.time()
+
+        def checked(status, resp_headers, stream):
+            if status >= 300:
+                raise SupabaseError(method, path, status, stream.read().decode('utf-8', 'replace'),
+                                    resp_headers.get('Retry-After'))
+            return (consume or default_consume)(status, resp_headers, stream)
+
+        attempt = 0
+        try:
+            while True:
+                try:
+                    return self._send(method, path, body, hdrs, checked, span)
+                except SupabaseError as e:
+                    if not idempotent or e.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        raise
+                    time.sleep(self._backoff(attempt, e.retry_after))
+                except (OSError, http.client.HTTPException) as e:
+                    if getattr(e, 'stale_connection', False):
+                        continue  # never sent; see _send()
+                    if not idempotent or attempt >= self.max_retries:
+                        raise
+                    if getattr(e, 'reused_connection', False):
+                        continue  # likely a stale keep-alive; resend at once on another connection
+                    time.sleep(self._backoff(attempt))
+                attempt += 1
+                span['retries'] = attempt
+        except Exception as e:
+            span['error'] = type(e).__name__
+            raise
+        finally:
+            if tracer is not None:
+                span['ts'] = round(t0, 6)
+                span['ms'] = round((time.time() - t0) * 1000, 3)
+                tracer.record(span)
+
+    # ── PostgREST helpers ──
+
+    def get(self, table, params=None, headers=None):
+        return self.request('GET', f'/rest/v1/{table}', params=params, headers=headers).json()
+
+    def insert(self, table, rows, upsert=False, on_conflict=None, returning=False):
+        """Insert rows. With upsert=True existing keys are ignored, which
+        makes the call idempotent (and therefore retried on failure)."""
+        prefer = ['return=representation' if returning else 'return=minimal']
+        params = {}
+        if upsert:
+            prefer.append('resolution=ignore-duplicates')
+            if on_conflict:
+                params['on_conflict'] = on_conflict
+        resp = self.request('POST', f'/rest/v1/{table}', params=params, json_body=rows,
+                            headers={'Prefer': ','.join(prefer)}, idempotent=upsert)
+        return resp.json() if returning else resp.status
+
+    def delete(self, table, filters):
+        """Delete rows matching PostgREST filters, e.g. {'id': 'not.is.null'}."""
+        return self.request('DELETE', f'/rest/v1/{table}', params=filters,
+                            headers={'Prefer': 'return=minimal'}).status
+
+    def rpc(self, fn, args=None, idempotent=False):
+        """Call a Postgres function; returns its decoded JSON result."""
+        return self.request('POST', f'/rest/v1/rpc/{fn}', json_body=args or {},
+                            idempotent=idempotent).json()
+
+    def paginate(self, table, select='*', order='id', page_size=1000, filters=None):
+        """Yield every row of a table, page by page (PostgREST caps a single
+        response at 1000 rows). Rows are decoded as each page streams in.
+
+        Pages are keyset-driven: each asks for `order` greater than the last
+        value seen, so Postgres starts from the index instead of rescanning
+        earlier rows, and concurrent inserts or deletes cannot shift rows
+        between pages. `order` must therefore be a single unique, non-null
+        column (the primary key), included in `select`, and not also used
+        in `filters`."""
+        after = None
+        while True:
+            params = {'select': select, 'order': order, 'limit': page_size}
+            params.update(filters or {})
+            if after is not None:
+                params[order] = f'gt.{after}'
+            page = []
+
+            def consume(status, headers, stream):
+                page.extend(iter_json_array(stream.chunks()))
+                stream.rows = len(page)
+                return len(page)
+
+            n = self.request('GET', f'/rest/v1/{table}', params=params, consume=consume)
+            yield from page
+            if n < page_size:
+                return
+            after = page[-1][order]
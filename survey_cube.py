@@ -0,0 +1,194 @@
+"""
+AI-Eng-TAM Survey -- Demographic cube
+=====================================
+Python counterpart of src/lib/cube.js. One pass over the data builds a
+base cuboid -- a cell per distinct combination of the configured
+demographic dimensions -- holding mergeable (n, sum, sumsq) moments for
+every construct score and Likert item. Slices, rollups and group
+comparisons (anova_from_moments) merge cells and never touch raw rows.
+ROLLUPS are materialized at build time; the cube is saved as JSON.
+"""
+
+import json
+from datetime import datetime, timezone
+
+from survey_stats import anova_from_moments
+
+# Keep in sync with CUBE_DIMENSIONS / CUBE_ROLLUPS in src/lib/cube.js
+DIMENSIONS = [
+    'stakeholder_type',
+    'prior_ai_experience',
+    'primary_ai_context',
+    'engineering_discipline',
+    'year_in_program',
+    'years_in_academia',
+    'primary_role',
+    'institution_type',
+    'years_professional_experience',
+    'practitioner_role',
+    'industry_sector',
+    'organization_size',
+]
+# Each dimension alone, and crossed with stakeholder_type
+ROLLUPS = [['stakeholder_type']] + [dims for d in DIMENSIONS[1:] for dims in ([d], ['stakeholder_type', d])]
+
+
+def dim_value(value):
+    """Cell key value; '' means not answered."""
+    return '' if value is None else str(value).strip()
+
+
+class Cell:
+    __slots__ = ('values', 'n', 'constructs', 'items')
+
+    def __init__(self, values, n_constructs, n_items):
+        self.values = values
+        self.n = 0
+        self.constructs = [0.0] * (3 * n_constructs)
+        self.items = [0.0] * (3 * n_items)
+
+    def merge(self, other):
+        self.n += other.n
+        for i, v in enumerate(other.constructs):
+            self.constructs[i] += v
+        for i, v in enumerate(other.items):
+            self.items[i] += v
+
+    def to_json(self):
+        return {'values': list(self.values), 'n': self.n,
+                'constructs': self.constructs, 'items': self.items}
+
+
+def _add(moments, index, value):
+    moments[3 * index] += 1
+    moments[3 * index + 1] += value
+    moments[3 * index + 2] += value * value
+
+
+class Cube:
+    def __init__(self, dimensions, constructs, items):
+        self.dimensions = list(dimensions)
+        self.constructs = list(constructs)
+        self.items = list(items)
+        self.construct_index = {c: i for i, c in enumerate(self.constructs)}
+        self.item_index = {c: i for i, c in enumerate(self.items)}
+        self.base = {}        # tuple of values -> Cell
+        self.rollups = []     # [(dims, {tuple: Cell})]
+        self.built_at = None
+
+    def _cell(self, cells, values):
+        cell = cells.get(values)
+        if cell is None:
+            cell = cells[values] = Cell(values, len(self.constructs), len(self.items))
+        return cell
+
+    @classmethod
+    def build(cls, respondents, construct_scores, likert, constructs, items,
+              dimensions=DIMENSIONS, rollups=ROLLUPS):
+        """respondents: dicts with 'id' and the dimension columns;
+        construct_scores: (respondent_id, construct, score);
+        likert: (respondent_id, item_code, value).
+        Respondents without any Likert answers are left out, as in cube.js."""
+        cube = cls(dimensions, constructs, items)
+        keys = {r['id']: tuple(dim_value(r.get(d)) for d in dimensions) for r in respondents}
+        counted = set()
+
+        def cell_for(respondent_id):
+            values = keys.get(respondent_id)
+            if values is None:
+                return None
+            cell = cube._cell(cube.base, values)
+            if respondent_id not in counted:
+                counted.add(respondent_id)
+                cell.n += 1
+            return cell
+
+        for rid, code, value in likert:
+            ii = cube.item_index.get(code)
+            cell = cell_for(rid)
+            if cell is not None and ii is not None and value is not None:
+                _add(cell.items, ii, value)
+        for rid, construct, score in construct_scores:
+            ci = cube.construct_index.get(construct)
+            if rid in counted and ci is not None:
+                _add(cube.base[keys[rid]].constructs, ci, score)
+
+        for dims in rollups:
+            if all(d in cube.dimensions for d in dims):
+                cube.rollups.append((list(dims), cube._project(cube.base.values(), cube.dimensions, dims)))
+        cube.built_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        return cube
+
+    def _project(self, cells, source_dims, dims):
+        positions = [source_dims.index(d) for d in dims]
+        out = {}
+        for cell in cells:
+            self._cell(out, tuple(cell.values[p] for p in positions)).merge(cell)
+        return out
+
+    def query(self, by=(), where=None):
+        """Group by `by` dimensions within `where` ({dim: value or [values]}).
+        Returns [(values tuple, Cell)], from the smallest materialized
+        rollup that covers the dimensions involved."""
+        where = where or {}
+        needed = set(by) | set(where)
+        source_dims, cells = self.dimensions, self.base
+        for dims, rollup in self.rollups:
+            if needed <= set(dims) and len(rollup) < len(cells):
+                source_dims, cells = dims, rollup
+
+        filters = [(source_dims.index(d), set(v) if isinstance(v, (list, tuple, set)) else {v})
+                   for d, v in where.items()]
+        selected = (c for c in cells.values()
+                    if all(c.values[pos] in allowed for pos, allowed in filters))
+        grouped = self._project(selected, source_dims, list(by))
+        return sorted(grouped.items())
+
+    def moments(self, cell, construct=None, item=None):
+        """(n, sum, sumsq) of a construct score or item within a cell."""
+        if construct is not None:
+            i, arr = self.construct_index.get(construct), cell.constructs
+        else:
+            i, arr = self.item_index.get(item), cell.items
+        if i is None:
+            return (0, 0.0, 0.0)
+        return (int(arr[3 * i]), arr[3 * i + 1], arr[3 * i + 2])
+
+    def compare(self, dim, where=None, construct=None, item=None):
+        """One-way ANOVA across the answered values of `dim`."""
+        return anova_from_moments([
+            self.moments(cell, construct, item)
+            for (value,), cell in self.query([dim], where) if value != ''
+        ])
+
+    # ── persistence ──
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'built_at': self.built_at,
+                'dimensions': self.dimensions,
+                'constructs': self.constructs,
+                'items': self.items,
+                'base': [c.to_json() for c in self.base.values()],
+                'rollups': [{'dims': dims, 'cells': [c.to_json() for c in cells.values()]}
+                            for dims, cells in self.rollups],
+            }, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        cube = cls(data['dimensions'], data['constructs'], data['items'])
+        cube.built_at = data.get('built_at')
+
+        def cells(rows):
+            out = {}
+            for row in rows:
+                cell = cube._cell(out, tuple(row['values']))
+                cell.n, cell.constructs, cell.items = row['n'], row['constructs'], row['items']
+            return out
+
+        cube.base = cells(data['base'])
+        cube.rollups = [(r['dims'], cells(r['cells'])) for r in data['rollups']]
+        return cube
@@ -0,0 +1,196 @@
+"""
+AI-Eng-TAM Survey -- Response quality checks
+============================================
+Python counterpart of src/lib/dataQuality.js. Screens every respondent's
+Likert vector (items in survey order) for zero variance, long strings of
+identical answers and repeating patterns (1-7-1-7..., 1-2-3-4-5-6-7...),
+and finds exact and near-duplicate submissions
+without comparing all pairs: exact duplicates share a hash bucket, near
+duplicates share at least one LSH band. Vectors are split into
+MAX_DIFF + 1 interleaved bands, so two vectors that differ in at most
+MAX_DIFF items agree on a whole band (pigeonhole); candidates are verified
+by Hamming distance. Each vector is compared with at most BUCKET_WINDOW
+earlier members of each bucket, so the work is O(n * bands * BUCKET_WINDOW)
+even when a cohort of similar answers (e.g. mostly 7s) fills one bucket.
+Larger buckets are sorted by answers first so the window holds the most
+similar vectors; only pairs further apart than that can be missed.
+"""
+
+import csv
+from operator import eq
+
+from survey_stats import CONSTRUCT_NAMES, construct_of
+
+# Keep in sync with src/lib/dataQuality.js
+MIN_ITEMS = 10             # fewer answered items: not screened
+LONG_STRING_SHARE = 0.5    # longest run of one answer >= this share of items
+PATTERN_PERIODS = range(2, 8)
+PATTERN_SHARE = 0.9        # answer i equals answer i - period this often ...
+PATTERN_MAX_REPEAT = 0.5   # ... while consecutive answers repeat at most this often
+MAX_DIFF = 2               # near duplicate: at most this many differing items
+BUCKET_WINDOW = 64         # earlier bucket members each vector is compared with
+
+FIELDS = ['respondent_id', 'stakeholder_type', 'repeat_flag', 'n_items', 'sd', 'longest_run',
+          'pattern_period', 'flags', 'duplicate_of', 'duplicate_distance']
+
+_RANK = {c: i for i, c in enumerate(CONSTRUCT_NAMES)}
+
+
+def item_order(code):
+    """Survey order: construct order of CONSTRUCT_NAMES, then item number."""
+    construct = construct_of(code)
+    number = code[len(construct):]
+    return (_RANK.get(construct, len(_RANK)), construct, int(number) if number else 0)
+
+
+def _lag_share(vector, lag):
+    """(matches, pairs) of answer i == answer i - lag over answered pairs."""
+    pairs = [(a, b) for a, b in zip(vector, vector[lag:]) if a is not None and b is not None]
+    return sum(a == b for a, b in pairs), len(pairs)
+
+
+def screen(vector):
+    """A respondent's answers (None = unanswered) ->
+    (n, sd, longest_run, pattern_period, flags)."""
+    values = [v for v in vector if v is not None]
+    n = len(values)
+    if n == 0:
+        return 0, None, 0, None, []
+    mean = sum(values) / n
+    sd = (max(0.0, sum(v * v for v in values) - n * mean * mean) / (n - 1)) ** 0.5 if n > 1 else 0.0
+    run = longest = 0
+    prev = None
+    for v in vector:
+        run = run + 1 if v == prev and v is not None else 1
+        prev = v
+        if run > longest:
+            longest = run
+
+    flags, period = [], None
+    if n < MIN_ITEMS:
+        return n, sd, longest, period, flags
+    if sd == 0:
+        flags.append('zero_variance')
+    elif longest >= LONG_STRING_SHARE * n:
+        flags.append('long_string')
+    else:
+        # Lag comparisons run as C-level map(eq) passes for complete vectors
+        complete = n == len(vector)
+        for lag in range(1, PATTERN_PERIODS.stop):
+            same, pairs = ((sum(map(eq, vector, vector[lag:])), n - lag) if complete
+                           else _lag_share(vector, lag))
+            if lag == 1 and (not pairs or same > PATTERN_MAX_REPEAT * pairs):
+                break
+            if lag > 1 and pairs and same >= PATTERN_SHARE * pairs:
+                period = lag
+                flags.append('pattern')
+                break
+    return n, sd, longest, period, flags
+
+
+def hamming(a, b, limit):
+    """Number of differing items, or limit + 1 once it exceeds limit."""
+    d = 0
+    for x, y in zip(a, b):
+        if x != y:
+            d += 1
+            if d > limit:
+                break
+    return d
+
+
+def near_duplicates(vectors, max_diff=MAX_DIFF):
+    """vectors: [(respondent_id, tuple)] of one stakeholder type ->
+    [(id_a, id_b, distance)] for every pair within max_diff items."""
+    exact = {}
+    for rid, vec in vectors:
+        exact.setdefault(vec, []).append(rid)
+    pairs = [(ids[0], other, 0) for ids in exact.values() for other in ids[1:]]
+    if max_diff <= 0:
+        return pairs
+
+    # One representative per distinct vector; straight-liners are already
+    # flagged and would only crowd the buckets.
+    uniques = [vec for vec in exact if len({v for v in vec if v is not None}) > 1]
+    bands = max_diff + 1
+    buckets = {}
+    for u, vec in enumerate(uniques):
+        for b in range(bands):
+            buckets.setdefault((b, vec[b::bands]), []).append(u)
+
+    seen = set()
+    for members in buckets.values():
+        if len(members) > BUCKET_WINDOW:
+            members.sort(key=lambda u: [-1 if v is None else v for v in uniques[u]])
+        for y in range(1, len(members)):
+            for x in range(max(0, y - BUCKET_WINDOW), y):
+                key = (min(members[x], members[y]), max(members[x], members[y]))
+                if key in seen:
+                    continue
+                seen.add(key)
+                d = hamming(uniques[key[0]], uniques[key[1]], max_diff)
+                if d <= max_diff:
+                    pairs.append((exact[uniques[key[0]]][0], exact[uniques[key[1]]][0], d))
+    return pairs
+
+
+def assess(respondents, likert, max_diff=MAX_DIFF):
+    """respondents: dicts with id, stakeholder_type (and repeat_flag);
+    likert: (respondent_id, item_code, value). -> one dict per respondent
+    with Likert answers, FIELDS as keys."""
+    answers, codes = {}, {}
+    types = {r['id']: r.get('stakeholder_type') for r in respondents}
+    for rid, code, value in likert:
+        stype = types.get(rid)
+        if stype is None:
+            continue
+        answers.setdefault(rid, {})[code] = None if value in (None, '') else int(value)
+        codes.setdefault(stype, set()).add(code)
+    order = {t: sorted(c, key=item_order) for t, c in codes.items()}
+
+    results, vectors = {}, {}
+    for r in respondents:
+        rid = r['id']
+        if rid not in answers:
+            continue
+        stype = types[rid]
+        vec = tuple(answers[rid].get(code) for code in order[stype])
+        n, sd, longest, period, flags = screen(vec)
+        vectors.setdefault(stype, []).append((rid, vec))
+        results[rid] = {
+            'respondent_id': rid, 'stakeholder_type': stype,
+            'repeat_flag': str(r.get('repeat_flag', '')).lower() in ('true', '1', 't'),
+            'n_items': n, 'sd': sd, 'longest_run': longest, 'pattern_period': period,
+            'flags': flags, 'duplicate_of': None, 'duplicate_distance': None,
+        }
+
+    # Each member of a duplicate pair points at its closest counterpart
+    for group in vectors.values():
+        for a, b, d in near_duplicates(group, max_diff):
+            for rid, other in ((a, b), (b, a)):
+                row = results[rid]
+                if row['duplicate_distance'] is None or d < row['duplicate_distance']:
+                    row['duplicate_of'], row['duplicate_distance'] = other, d
+    for row in results.values():
+        if row['duplicate_of'] is not None:
+            row['flags'].append('exact_duplicate' if row['duplicate_distance'] == 0 else 'near_duplicate')
+    return list(results.values())
+
+
+def summarize(rows):
+    """{flag: count} plus 'screened' and 'repeat_flag' totals."""
+    counts = {'screened': len(rows), 'repeat_flag': sum(r['repeat_flag'] for r in rows)}
+    for r in rows:
+        for flag in r['flags']:
+            counts[flag] = counts.get(flag, 0) + 1
+    counts['flagged'] = sum(1 for r in rows if r['flags'])
+    return counts
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for r in rows:
+            writer.writerow({**r, 'sd': '' if r['sd'] is None else round(r['sd'], 4),
+                             'flags': ';'.join(r['flags'])})
@@ -0,0 +1,217 @@
+"""
+AI-Eng-TAM Survey -- Schema definitions from supabase-schema.sql
+================================================================
+Parses the CREATE TABLE / CREATE INDEX statements in supabase-schema.sql
+so the Python tooling validates, converts and recreates rows from the
+same source of truth as the live database.
+"""
+
+import ast, json, os, re, uuid
+from datetime import datetime, timezone
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'supabase-schema.sql')
+
+# Foreign-key order: parents before children
+TABLES = ['respondents', 'section_a_responses', 'likert_responses']
+
+
+class Column:
+    def __init__(self, name, sql_type):
+        self.name = name
+        self.type = sql_type.upper()
+        self.not_null = False
+        self.primary_key = False
+        self.default = None
+        self.choices = None      # CHECK (col IN (...))
+        self.min_value = None    # CHECK (col >= x)
+        self.max_value = None    # CHECK (col <= x)
+        self.references = None   # (table, column)
+
+    def __repr__(self):
+        return f"Column({self.name!r}, {self.type!r})"
+
+
+class Table:
+    def __init__(self, name):
+        self.name = name
+        self.columns = {}        # name -> Column, in declaration order
+        self.unique = []         # [tuple of column names]
+
+    @property
+    def primary_key(self):
+        return next((c.name for c in self.columns.values() if c.primary_key), None)
+
+
+def _strip_comments(sql):
+    return re.sub(r'--[^\n]*', '', sql)
+
+
+def _split_top_level(body):
+    """Split a CREATE TABLE body on commas that are not inside parentheses."""
+    parts, depth, cur = [], 0, []
+    for ch in body:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(''.join(cur).strip())
+            cur = []
+        else:
+            cur.append(ch)
+    if ''.join(cur).strip():
+        parts.append(''.join(cur).strip())
+    return parts
+
+
+def _apply_check(col, expr):
+    m = re.search(r'\bIN\s*\(([^)]*)\)', expr, re.I)
+    if m:
+        col.choices = set(re.findall(r"'([^']*)'", m.group(1)))
+    for op, num in re.findall(r'(>=|<=|>|<)\s*(-?\d+)', expr):
+        n = int(num)
+        if op == '>=':
+            col.min_value = n
+        elif op == '>':
+            col.min_value = n + 1
+        elif op == '<=':
+            col.max_value = n
+        else:
+            col.max_value = n - 1
+
+
+def _parse_column(definition):
+    m = re.match(r'(\w+)\s+(\w+)(.*)$', definition, re.S)
+    name, sql_type, rest = m.group(1), m.group(2), m.group(3)
+    col = Column(name, sql_type)
+    col.primary_key = bool(re.search(r'\bPRIMARY\s+KEY\b', rest, re.I))
+    col.not_null = col.primary_key or bool(re.search(r'\bNOT\s+NULL\b', rest, re.I))
+    d = re.search(r"\bDEFAULT\s+('[^']*'|\S+\(\)|\S+)", rest, re.I)
+    if d:
+        col.default = d.group(1)
+    c = re.search(r'\bCHECK\s*\((.*)\)', rest, re.I | re.S)
+    if c:
+        _apply_check(col, c.group(1))
+    r = re.search(r'\bREFERENCES\s+(\w+)\s*\((\w+)\)', rest, re.I)
+    if r:
+        col.references = (r.group(1), r.group(2))
+    return col
+
+
+def parse_schema(sql=None):
+    """Return ({table: Table}, [(index_name, table, [columns])])."""
+    if sql is None:
+        with open(SCHEMA_PATH, encoding='utf-8') as f:
+            sql = f.read()
+    sql = _strip_comments(sql)
+
+    tables = {}
+    for m in re.finditer(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*?)\);', sql, re.I | re.S):
+        table = Table(m.group(1))
+        for part in _split_top_level(m.group(2)):
+            u = re.match(r'UNIQUE\s*\(([^)]*)\)', part, re.I)
+            if u:
+                table.unique.append(tuple(c.strip() for c in u.group(1).split(',')))
+                continue
+            col = _parse_column(part)
+            table.columns[col.name] = col
+        tables[table.name] = table
+
+    indexes = [
+        (m.group(1), m.group(2), [c.strip() for c in m.group(3).split(',')])
+        for m in re.finditer(r'CREATE\s+INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+ON\s+(\w+)\s*\(([^)]*)\)', sql, re.I)
+    ]
+    return tables, indexes
+
+
+# ================================================================
+# Converting archive CSV values back to typed values
+# ================================================================
+
+def _to_bool(text):
+    t = text.strip().lower()
+    if t in ('true', 't', '1', 'yes'):
+        return True
+    if t in ('false', 'f', '0', 'no'):
+        return False
+    raise ValueError(f"not a boolean: {text!r}")
+
+
+def _to_json(text):
+    """JSONB from a CSV cell. archive-and-clear.py writes lists with str(),
+    so Python literals (['a', 'b']) are accepted alongside real JSON."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+def coerce_value(column, text):
+    """Convert one CSV cell to the Python value for its column type."""
+    if text is None or text == '':
+        return None
+    if column.type == 'BOOLEAN':
+        return _to_bool(text)
+    if column.type in ('INTEGER', 'INT', 'BIGINT', 'SMALLINT'):
+        return int(text)
+    if column.type in ('JSONB', 'JSON'):
+        value = _to_json(text)
+        # Double-encoded JSON strings ("[\"a\"]") come from rows inserted as text
+        return _to_json(value) if isinstance(value, str) else value
+    return text
+
+
+def coerce_row(table, raw):
+    """CSV dict -> typed dict restricted to the table's columns."""
+    return {
+        name: coerce_value(table.columns[name], value)
+        for name, value in raw.items()
+        if name in table.columns
+    }
+
+
+def default_value(column):
+    """Python value for a column's DEFAULT, or None if it has none."""
+    d = column.default
+    if d is None:
+        return None
+    if d.lower() == 'uuid_generate_v4()':
+        return str(uuid.uuid4())
+    if d.lower() == 'now()':
+        return datetime.now(timezone.utc).isoformat()
+    if d.startswith("'"):
+        return coerce_value(column, d.strip("'"))
+    return coerce_value(column, d)
+
+
+def fill_defaults(table, row):
+    """Replace empty NOT NULL cells with the column default, as the database
+    would have done when the row was first inserted."""
+    for col in table.columns.values():
+        if col.not_null and row.get(col.name) is None and col.default is not None:
+            row[col.name] = default_value(col)
+    return row
+
+
+def validate_row(table, row):
+    """Check a typed row against the NOT NULL and CHECK constraints.
+
+    Returns a list of problems (empty when the row is valid). Foreign-key and
+    UNIQUE constraints span rows and are checked by the caller.
+    """
+    problems = []
+    for col in table.columns.values():
+        value = row.get(col.name)
+        if value is None:
+            if col.not_null and col.default is None:
+                problems.append(f"{col.name} is required")
+            continue
+        if col.choices is not None and value not in col.choices:
+            problems.append(f"{col.name}={value!r} not in {sorted(col.choices)}")
+        if col.min_value is not None and value < col.min_value:
+            problems.append(f"{col.name}={value} below {col.min_value}")
+        if col.max_value is not None and value > col.max_value:
+            problems.append(f"{col.name}={value} above {col.max_value}")
+        if col.type in ('JSONB', 'JSON') and col.default == "'[]'" and not isinstance(value, list):
+            problems.append(f"{col.name} must be a JSON array")
+    return problems
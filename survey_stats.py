@@ -0,0 +1,153 @@
+"""
+AI-Eng-TAM Survey -- Shared statistics helpers (stdlib only)
+============================================================
+Python counterparts of src/lib/statistics.js so the offline tooling
+scores constructs and runs ANOVA exactly the way the dashboard does.
+"""
+
+import math
+
+# Construct mapping for analysis (construct id -> display name),
+# same as CONSTRUCT_NAMES in src/data/surveyData.js
+CONSTRUCT_NAMES = {
+    'PU-L': 'Perceived Usefulness—Learning',
+    'PU-E': 'Perceived Usefulness—Efficiency',
+    'PEU': 'Perceived Ease of Use/Integration',
+    'EJ': 'Epistemic Judgment',
+    'BI': 'Behavioral Intention',
+    'MU': 'Modes of AI Use',
+    'LP': 'Learning/Workflow Placement',
+    'GB': 'Guardrails & Boundaries',
+    'OA': 'Ownership & Accountability',
+    'EV': 'Evaluation & Verification',
+    'ET': 'Ethics & Responsible Use',
+    'AR': 'AI Readiness',
+    'CR': 'Career/Workforce Readiness',
+}
+
+STAKEHOLDER_TYPES = ['faculty', 'student', 'practitioner']
+
+
+def construct_of(item_code):
+    """Map an item code to its construct id ('PU-L3' -> 'PU-L', 'AR7' -> 'AR')."""
+    return item_code.rstrip('0123456789')
+
+
+def construct_means(responses):
+    """{item_code: value} for one respondent -> {construct_id: mean}."""
+    sums, counts = {}, {}
+    for code, value in responses.items():
+        if value is None:
+            continue
+        c = construct_of(code)
+        sums[c] = sums.get(c, 0) + value
+        counts[c] = counts.get(c, 0) + 1
+    return {c: sums[c] / counts[c] for c in sums}
+
+
+def descriptive_stats(values):
+    """n, mean, sample SD, min, max, median -- matches descriptiveStats()."""
+    n = len(values)
+    if n == 0:
+        return {'n': 0, 'mean': 0, 'sd': 0, 'min': 0, 'max': 0, 'median': 0}
+    s = sorted(values)
+    mean = sum(values) / n
+    sd = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1)) if n > 1 else 0
+    mid = n // 2
+    median = s[mid] if n % 2 else (s[mid - 1] + s[mid]) / 2
+    return {'n': n, 'mean': mean, 'sd': sd, 'min': s[0], 'max': s[-1], 'median': median}
+
+
+# ================================================================
+# F distribution tail via the regularized incomplete beta function
+# ================================================================
+
+def _betacf(a, b, x, max_iter=200, eps=3e-14):
+    """Continued fraction for the incomplete beta function (Lentz's method)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < eps:
+            break
+    return h
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta I_x(a, b)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    ln_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(ln_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(ln_front) * _betacf(b, a, 1 - x) / b
+
+
+def f_sf(F, df1, df2):
+    """Upper tail P(X > F) of the F distribution (= 1 - jStat.centralF.cdf)."""
+    if F is None or F <= 0:
+        return 1.0
+    return betainc(df2 / 2.0, df1 / 2.0, df2 / (df2 + df1 * F))
+
+
+# ================================================================
+# One-way ANOVA
+# ================================================================
+
+def anova_from_moments(groups):
+    """One-way ANOVA from per-group (n, sum, sum_of_squares) triples.
+
+    Returns {'F', 'p', 'dfBetween', 'dfWithin', 'etaSquared'} with the same
+    null conventions as oneWayAnova() in src/lib/statistics.js.
+    """
+    groups = [g for g in groups if g[0] > 0]
+    k = len(groups)
+    if k < 2:
+        return {'F': None, 'p': None, 'dfBetween': 0, 'dfWithin': 0, 'etaSquared': None}
+    N = sum(g[0] for g in groups)
+    df_between, df_within = k - 1, N - k
+    if df_within <= 0:
+        return {'F': None, 'p': None, 'dfBetween': df_between, 'dfWithin': df_within,
+                'etaSquared': None}
+
+    grand_mean = sum(g[1] for g in groups) / N
+    ss_between = sum(n * (s / n - grand_mean) ** 2 for n, s, _ in groups)
+    ss_within = sum(max(0.0, ss - s * s / n) for n, s, ss in groups)
+
+    ms_between = ss_between / df_between
+    ms_within = ss_within / df_within
+    F = ms_between / ms_within if ms_within > 0 else 0
+    ss_total = ss_between + ss_within
+    return {
+        'F': F,
+        'p': f_sf(F, df_between, df_within),
+        'dfBetween': df_between,
+        'dfWithin': df_within,
+        'etaSquared': ss_between / ss_total if ss_total > 0 else 0,
+    }
+
+
+def one_way_anova(groups):
+    """groups: {name: [values]} -> same result shape as oneWayAnova()."""
+    return anova_from_moments([
+        (len(vals), sum(vals), sum(v * v for v in vals)) for vals in groups.values()
+    ])
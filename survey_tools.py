@@ -0,0 +1,251 @@
+"""
+AI-Eng-TAM Survey -- Section D tool index
+=========================================
+Bitset index over Section D tool usage (section_a_responses). Every
+respondent gets an ordinal; every (category, tool) pair gets a bitmap --
+a Python int with bit i set when respondent i selected that tool. Stakeholder
+groups, category use and construct-score levels are bitmaps too, so
+adoption rates, co-occurrence, combinations and construct links are ANDs
+and popcounts over whole columns. selected_tools JSON is parsed only when
+the index is built; the index is saved and reloaded without touching it.
+"""
+
+import base64, json
+from collections import Counter
+
+from survey_stats import STAKEHOLDER_TYPES, anova_from_moments
+
+# Section D categories, in survey order (SECTION_D_COMMON_CATEGORIES in surveyData.js)
+CATEGORIES = ['ML', 'DL', 'NLP', 'CV', 'GenAI', 'Recommender', 'EngDesign', 'Robotics', 'Expert']
+OTHER = 'Other'  # feature for a non-empty other_tool
+
+
+def popcount(bits):
+    return bits.bit_count()
+
+
+def _bitmap(positions, size):
+    """Set of ordinals -> int bitmap (built in a bytearray: O(size), not O(size^2))."""
+    buf = bytearray((size + 7) // 8)
+    for i in positions:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def _ordinals(bits):
+    """Set bit positions of a bitmap, lowest first. Scans the bitmap's bytes
+    once and skips empty ones."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    for base, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield base * 8 + low.bit_length() - 1
+            byte ^= low
+
+
+def _encode(bits):
+    return base64.b64encode(bits.to_bytes((bits.bit_length() + 7) // 8, 'little')).decode('ascii')
+
+
+def _decode(text):
+    return int.from_bytes(base64.b64decode(text), 'little')
+
+
+def _tools(value):
+    """selected_tools cell -> list of names (handles double-encoded JSON)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = json.loads(value)
+        if isinstance(value, str):
+            value = json.loads(value)
+    return value
+
+
+class ToolIndex:
+    def __init__(self):
+        self.size = 0
+        self.stakeholders = {}   # stakeholder_type -> bitmap
+        self.answered = 0        # respondents with any Section D row
+        self.category_use = {}   # category -> bitmap (uses_category)
+        self.features = []       # [(category, tool)]
+        self.bitmaps = []        # bitmap per feature
+        self.masks = []          # per respondent: int over feature indexes
+        self.score_levels = {}   # construct -> {score: bitmap}
+
+    @classmethod
+    def build(cls, respondents, section_rows, construct_scores):
+        """respondents: (id, stakeholder_type);
+        section_rows: (respondent_id, category, uses_category, selected_tools, other_tool);
+        construct_scores: (respondent_id, construct, score)."""
+        idx = cls()
+        ordinal, by_type = {}, {}
+        for rid, stype in respondents:
+            by_type.setdefault(stype, []).append(len(ordinal))
+            ordinal[rid] = len(ordinal)
+        n = idx.size = len(ordinal)
+
+        answered, uses, selected = set(), {}, {}
+        for rid, category, uses_category, tools, other in section_rows:
+            i = ordinal.get(rid)
+            if i is None:
+                continue
+            answered.add(i)
+            if uses_category:
+                uses.setdefault(category, []).append(i)
+            names = _tools(tools)
+            if other and other.strip():
+                names = names + [OTHER]
+            for tool in names:
+                selected.setdefault((category, tool), []).append(i)
+
+        rank = {c: k for k, c in enumerate(CATEGORIES)}
+        idx.features = sorted(selected, key=lambda f: (rank.get(f[0], len(rank)), f[0], f[1]))
+        idx.bitmaps = [_bitmap(selected[f], n) for f in idx.features]
+        idx.stakeholders = {t: _bitmap(pos, n) for t, pos in by_type.items()}
+        idx.answered = _bitmap(answered, n)
+        idx.category_use = {c: _bitmap(pos, n) for c, pos in uses.items()}
+
+        # Transpose: each respondent's tool set as one int, for combination counts
+        masks = [0] * n
+        for f, feature in enumerate(idx.features):
+            bit = 1 << f
+            for i in selected[feature]:
+                masks[i] |= bit
+        idx.masks = masks
+
+        levels = {}
+        for rid, construct, score in construct_scores:
+            i = ordinal.get(rid)
+            if i is not None and score is not None:
+                levels.setdefault(construct, {}).setdefault(round(score, 6), []).append(i)
+        idx.score_levels = {c: {v: _bitmap(pos, n) for v, pos in by_value.items()}
+                            for c, by_value in levels.items()}
+        return idx
+
+    # ── persistence ──
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'size': self.size,
+                'stakeholders': {t: _encode(b) for t, b in self.stakeholders.items()},
+                'answered': _encode(self.answered),
+                'category_use': {c: _encode(b) for c, b in self.category_use.items()},
+                'features': self.features,
+                'bitmaps': [_encode(b) for b in self.bitmaps],
+                'masks': self.masks,
+                'score_levels': {c: [[v, _encode(b)] for v, b in levels.items()]
+                                 for c, levels in self.score_levels.items()},
+            }, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        idx = cls()
+        idx.size = data['size']
+        idx.stakeholders = {t: _decode(b) for t, b in data['stakeholders'].items()}
+        idx.answered = _decode(data['answered'])
+        idx.category_use = {c: _decode(b) for c, b in data['category_use'].items()}
+        idx.features = [tuple(f) for f in data['features']]
+        idx.bitmaps = [_decode(b) for b in data['bitmaps']]
+        idx.masks = data['masks']
+        idx.score_levels = {c: {v: _decode(b) for v, b in levels}
+                            for c, levels in data['score_levels'].items()}
+        return idx
+
+    # ── queries ──
+
+    def population(self, stakeholder=None):
+        """Bitmap of respondents who answered Section D (optionally one group)."""
+        mask = self.answered
+        if stakeholder:
+            mask &= self.stakeholders.get(stakeholder, 0)
+        return mask
+
+    def feature_ids(self, category=None):
+        return [f for f, (cat, _) in enumerate(self.features) if category in (None, cat)]
+
+    def adoption(self, category=None):
+        """-> [(category, tool, {stakeholder: (count, rate)})], rate over
+        respondents of that group who answered Section D."""
+        groups = [t for t in STAKEHOLDER_TYPES if t in self.stakeholders]
+        bases = {t: self.population(t) for t in groups}
+        totals = {t: popcount(b) for t, b in bases.items()}
+        out = []
+        for f in self.feature_ids(category):
+            bits = self.bitmaps[f]
+            by_group = {}
+            for t in groups:
+                count = popcount(bits & bases[t])
+                by_group[t] = (count, count / totals[t] if totals[t] else 0.0)
+            out.append((*self.features[f], by_group))
+        return out
+
+    def category_adoption(self, category=None):
+        """-> [(category, {stakeholder: (count, rate)})] from uses_category,
+        in survey order."""
+        groups = [t for t in STAKEHOLDER_TYPES if t in self.stakeholders]
+        bases = {t: self.population(t) for t in groups}
+        totals = {t: popcount(b) for t, b in bases.items()}
+        rank = {c: k for k, c in enumerate(CATEGORIES)}
+        out = []
+        for c in sorted(self.category_use, key=lambda c: (rank.get(c, len(rank)), c)):
+            if category in (None, c):
+                counts = {t: popcount(self.category_use[c] & bases[t]) for t in groups}
+                out.append((c, {t: (k, k / totals[t] if totals[t] else 0.0) for t, k in counts.items()}))
+        return out
+
+    def cooccurrence(self, features, stakeholder=None):
+        """Symmetric matrix of respondents selecting both tools (diagonal = each tool)."""
+        pop = self.population(stakeholder)
+        cols = [self.bitmaps[f] & pop for f in features]
+        matrix = [[0] * len(cols) for _ in cols]
+        for a in range(len(cols)):
+            for b in range(a, len(cols)):
+                matrix[a][b] = matrix[b][a] = popcount(cols[a] & cols[b])
+        return matrix
+
+    def combinations(self, category=None, stakeholder=None, top=10, min_tools=2):
+        """Most frequent exact tool sets -> [(tools, count)]."""
+        category_bits = users = 0
+        for f in self.feature_ids(category):
+            category_bits |= 1 << f
+            users |= self.bitmaps[f]
+        # Only respondents in the population who picked a tool of the category
+        counts = Counter()
+        for i in _ordinals(users & self.population(stakeholder)):
+            m = self.masks[i] & category_bits
+            if popcount(m) >= min_tools:
+                counts[m] += 1
+        return [([self.features[f][1] if category else '/'.join(self.features[f])
+                  for f in range(len(self.features)) if (m >> f) & 1], c)
+                for m, c in counts.most_common(top)]
+
+    def _moments(self, construct, bits):
+        n = s = ss = 0.0
+        for value, level in self.score_levels.get(construct, {}).items():
+            k = popcount(level & bits)
+            if k:
+                n += k
+                s += k * value
+                ss += k * value * value
+        return int(n), s, ss
+
+    def construct_link(self, construct, category=None, stakeholder=None, min_users=5):
+        """Construct score of adopters vs. non-adopters for each tool ->
+        [(category, tool, (n, mean) adopters, (n, mean) others, anova)]."""
+        pop = self.population(stakeholder)
+        out = []
+        for f in self.feature_ids(category):
+            users = self.bitmaps[f] & pop
+            if popcount(users) < min_users:
+                continue
+            a = self._moments(construct, users)
+            b = self._moments(construct, pop & ~users)
+            if not a[0] or not b[0]:
+                continue
+            out.append((*self.features[f], (a[0], a[1] / a[0]), (b[0], b[1] / b[0]),
+                        anova_from_moments([a, b])))
+        return out
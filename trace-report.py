@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+AI-Eng-TAM Survey -- Trace Report
+=================================
+Summarizes the JSONL spans written by supabase_rest.py (--trace PATH or
+SUPABASE_TRACE=PATH) and by api/admin-data.js (ADMIN_TRACE=1, one span per
+line in the function logs).
+
+Per table (or RPC function): calls, errors, retries, rows, bytes in/out,
+throughput over the wall-clock window the calls spanned, and p50/p95/p99
+latency. admin-data.js spans carry decoded rather than wire bytes; the
+report marks those with '*'.
+
+Usage:
+  python trace-report.py spans.jsonl [more.jsonl ...]
+  python trace-report.py spans.jsonl --by script,resource,method
+  python trace-report.py spans.jsonl --json
+"""
+
+import argparse, json, sys
+from collections import defaultdict
+
+
+def read_spans(paths):
+    """Yield span dicts; lines that are not spans (other log output) are skipped."""
+    for path in paths:
+        with (sys.stdin if path == '-' else open(path, encoding='utf-8')) as f:
+            for line in f:
+                line = line.strip()
+                start = line.find('{')
+                if start < 0:
+                    continue
+                try:
+                    span = json.loads(line[start:])
+                except ValueError:
+                    continue
+                if isinstance(span, dict) and 'ms' in span and 'resource' in span:
+                    yield span
+
+
+def percentile(sorted_vals, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_vals:
+        return None
+    rank = max(1, -(-len(sorted_vals) * q // 100))
+    return sorted_vals[int(rank) - 1]
+
+
+def summarize(spans, keys):
+    groups = defaultdict(list)
+    for span in spans:
+        groups[tuple(span.get(k) for k in keys)].append(span)
+
+    report = []
+    for key, group in sorted(groups.items(), key=lambda kv: str(kv[0])):
+        latencies = sorted(s['ms'] for s in group)
+        rows = sum(s.get('rows') or 0 for s in group)
+        start = min(s['ts'] for s in group)
+        end = max(s['ts'] + s['ms'] / 1000 for s in group)
+        wall = end - start
+        report.append({
+            **dict(zip(keys, key)),
+            'calls': len(group),
+            'errors': sum(1 for s in group if s.get('error') or (s.get('status') or 0) >= 400),
+            'retries': sum(s.get('retries') or 0 for s in group),
+            'rows': rows,
+            'bytes_in': sum(s.get('bytes_in') or 0 for s in group),
+            # admin-data.js only sees inflated bodies; kept apart from wire bytes
+            'bytes_decoded': sum(s.get('bytes_decoded') or 0 for s in group),
+            'bytes_out': sum(s.get('bytes_out') or 0 for s in group),
+            'wall_s': round(wall, 3),
+            'rows_per_s': round(rows / wall, 1) if wall > 0 else None,
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'max_ms': latencies[-1],
+        })
+    return report
+
+
+def fmt_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024 or unit == 'GB':
+            return f"{n:.0f}{unit}" if unit == 'B' else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def print_report(report, keys):
+    header = ['/'.join(keys), 'calls', 'err', 'retry', 'rows', 'in', 'out', 'rows/s', 'p50', 'p95', 'p99', 'max']
+    lines = []
+    decoded = False
+    for r in report:
+        bytes_in = fmt_bytes(r['bytes_in'])
+        if r['bytes_decoded'] and not r['bytes_in']:
+            bytes_in, decoded = fmt_bytes(r['bytes_decoded']) + '*', True
+        lines.append([
+            '/'.join(str(r[k]) for k in keys), r['calls'], r['errors'], r['retries'], r['rows'],
+            bytes_in, fmt_bytes(r['bytes_out']),
+            f"{r['rows_per_s']:,.0f}" if r['rows_per_s'] is not None else '-',
+            *(f"{r[k]:.0f}ms" for k in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')),
+        ])
+    widths = [max(len(str(x)) for x in col) for col in zip(header, *lines)]
+    for i, line in enumerate([header] + lines):
+        print('  '.join(str(x).ljust(w) if j == 0 else str(x).rjust(w)
+                        for j, (x, w) in enumerate(zip(line, widths))))
+        if i == 0:
+            print('  '.join('-' * w for w in widths))
+    if decoded:
+        print("\n  * decoded (inflated) bytes from api/admin-data.js, not wire bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize REST trace spans.")
+    parser.add_argument('paths', nargs='+', help="span files ('-' for stdin)")
+    parser.add_argument('--by', default='resource', help='comma-separated span fields to group by')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    keys = [k.strip() for k in args.by.split(',')]
+    spans = list(read_spans(args.paths))
+    if not spans:
+        raise SystemExit("  no spans found")
+    report = summarize(spans, keys)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{len(spans)} spans\n")
+        print_report(report, keys)
+
+
+if __name__ == '__main__':
+    main()